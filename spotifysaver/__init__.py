@@ -22,25 +22,32 @@ metadata preservation.
 __version__ = "0.7.5"
 
 
-# Verify if ffmpeg is installed
-import subprocess
+from functools import lru_cache
 
 
-def check_ffmpeg_installed():
-    """Check if ffmpeg is installed on the system."""
+@lru_cache(maxsize=None)
+def check_ffmpeg_installed(ffmpeg_path: str = "ffmpeg") -> bool:
+    """Check if ffmpeg is installed on the system.
+
+    The probe runs once per executable and process. It is not done at
+    import time: the transcoder calls it right before the first conversion,
+    so commands that never transcode start without spawning ffmpeg.
+
+    Args:
+        ffmpeg_path: FFmpeg executable to probe
+
+    Returns:
+        bool: True if the executable runs
+    """
+    import subprocess
+
     try:
         subprocess.run(
-            ["ffmpeg", "-version"],
+            [ffmpeg_path, "-version"],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             check=True,
         )
         return True
-    except FileNotFoundError:
+    except (FileNotFoundError, subprocess.CalledProcessError):
         return False
-
-
-if not check_ffmpeg_installed():
-    raise EnvironmentError(
-        "ffmpeg is not installed. Please install ffmpeg to use SpotifySaver."
-    )
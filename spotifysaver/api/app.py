@@ -1,5 +1,7 @@
 """FastAPI Application Factory"""
 
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
@@ -7,14 +9,34 @@ from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from .routers import download
+from .routers.download import maintain_task_leases, resume_interrupted_tasks
 from .config import APIConfig
+from .services import close_resources, get_task_store
 from .. import __version__
+from ..services.spotify_api import get_spotify_cache
+from ..downloader.transcode_scheduler import get_transcode_scheduler
+from ..downloader.image_cache import get_image_cache
 
 # Get the absolute path to the UI directory
 UI_DIR = Path(__file__).parent.parent / "ui"
 STATIC_DIR = UI_DIR / "static"
 INDEX_HTML = UI_DIR / "index.html"
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Evict expired tasks and resume interrupted ones on startup, keep the
+    task leases of this worker while running; release the shared resources
+    on shutdown."""
+    await asyncio.to_thread(get_task_store().evict_expired)
+    if APIConfig.RESUME_TASKS:
+        await resume_interrupted_tasks()
+    leases = asyncio.create_task(maintain_task_leases())
+    yield
+    leases.cancel()
+    await asyncio.gather(leases, return_exceptions=True)
+    await close_resources()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -27,6 +49,7 @@ def create_app() -> FastAPI:
         version=__version__,
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     # Mount static files (only if directory exists)
@@ -70,8 +93,18 @@ def create_app() -> FastAPI:
 
     @app.get("/health", tags=["Info"])
     async def health_check():
-        """Health check endpoint to verify API is running."""
-        return {"status": "healthy", "service": "SpotifySaver API"}
+        """Health check endpoint to verify API is running.
+
+        Also reports the size and hit rate of the Spotify metadata and cover
+        art caches and the load of the FFmpeg transcode scheduler.
+        """
+        return {
+            "status": "healthy",
+            "service": "SpotifySaver API",
+            "spotify_cache": get_spotify_cache().stats(),
+            "image_cache": get_image_cache().stats(),
+            "transcoder": get_transcode_scheduler().stats(),
+        }
 
     @app.get("/version", tags=["Info"])
     async def get_version():
@@ -1,8 +1,11 @@
 """API Configuration Settings"""
 
 import os
+from pathlib import Path
 from typing import List
 
+from ..config import Config
+
 
 class APIConfig:
     """Configuration settings for the FastAPI application."""
@@ -12,7 +15,23 @@ class APIConfig:
 
     # API settings
     DEFAULT_OUTPUT_DIR: str = "Music"
-    MAX_CONCURRENT_DOWNLOADS: int = 3
+    MAX_CONCURRENT_DOWNLOADS: int = int(os.getenv("API_MAX_CONCURRENT_DOWNLOADS", 3))
+
+    # Task store settings ("sqlite" or "redis")
+    TASK_STORE: str = os.getenv("API_TASK_STORE", "sqlite").lower()
+    TASK_STORE_PATH: Path = Path(os.getenv("API_TASK_STORE_PATH", Config.CONFIG_DIR / "api_tasks.db"))
+    TASK_STORE_REDIS_URL: str = os.getenv("API_REDIS_URL", "redis://localhost:6379/0")
+    TASK_TTL_HOURS: float = float(os.getenv("API_TASK_TTL_HOURS", 24))
+    # Re-queue tasks interrupted by a restart, continuing from their checkpoint journal
+    RESUME_TASKS: bool = os.getenv("API_RESUME_TASKS", "true").lower() == "true"
+    # Seconds without a heartbeat after which the worker owning a task is considered stopped
+    TASK_LEASE_SECONDS: float = float(os.getenv("API_TASK_LEASE_SECONDS", 60))
+
+    # Minimum seconds between two task store writes of the progress of a running task
+    PROGRESS_SAVE_SECONDS: float = float(os.getenv("API_PROGRESS_SAVE_SECONDS", 1))
+
+    # Seconds between keep-alive messages of the task event streams
+    EVENTS_KEEPALIVE_SECONDS: float = float(os.getenv("API_EVENTS_KEEPALIVE_SECONDS", 15))
 
     # File settings
     ALLOWED_FORMATS: List[str] = ["m4a", "mp3"]
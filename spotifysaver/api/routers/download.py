@@ -1,12 +1,14 @@
 """Download endpoints for the SpotifySaver API"""
 
 import asyncio
+import threading
+import time
 import uuid
 from datetime import datetime
-from typing import Dict
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from ..schemas import (
     DownloadRequest,
@@ -17,8 +19,16 @@ from ..schemas import (
     PlaylistInfo,
     TrackInfo,
 )
-from ..services import DownloadService
-from ...services import SpotifyAPI
+from ..services import (
+    WORKER_ID,
+    DownloadService,
+    get_async_spotify,
+    get_event_broker,
+    get_scheduler,
+    get_task_store,
+)
+from ..services.task_store import FINISHED_STATUSES
+from ...downloader import CancellationToken, TrackProgress
 from ...spotlog import get_logger
 from ..config import APIConfig
 
@@ -26,34 +36,29 @@ from ..config import APIConfig
 logger = get_logger("API")
 router = APIRouter()
 
-# In-memory task storage (in production, use Redis or database)
-tasks: Dict[str, DownloadStatus] = {}
-
 
 @router.post("/download", response_model=DownloadResponse)
-async def start_download(request: DownloadRequest, background_tasks: BackgroundTasks):
+async def start_download(request: DownloadRequest):
     """Start a download task for a Spotify URL.
 
-    This endpoint initiates the download process and returns a task ID
-    that can be used to track the progress of the download.
+    This endpoint queues the download and returns a task ID that can be used
+    to track its progress. At most APIConfig.MAX_CONCURRENT_DOWNLOADS tasks
+    run at the same time; the rest wait by priority, then arrival order.
     """
     try:
         # Generate unique task ID
         task_id = str(uuid.uuid4())
 
-        # Determine content type from URL
-        spotify_url = str(request.spotify_url)
-        if "track" in spotify_url:
-            content_type = "track"
-        elif "album" in spotify_url:
-            content_type = "album"
-        elif "playlist" in spotify_url:
-            content_type = "playlist"
-        else:
+        # Determine content type from the URLs
+        spotify_urls = request.get_urls()
+        content_types = {_content_type(url) for url in spotify_urls}
+        if None in content_types:
             raise HTTPException(
                 status_code=400,
                 detail="Invalid Spotify URL. Must be a track, album, or playlist.",
             )
+        spotify_url = spotify_urls[0]
+        content_type = content_types.pop() if len(spotify_urls) == 1 else "batch"
 
         # Create initial task status
         task_status = DownloadStatus(
@@ -66,22 +71,31 @@ async def start_download(request: DownloadRequest, background_tasks: BackgroundT
             started_at=datetime.now().isoformat(),
             output_format=request.output_format,
             bit_rate=request.bit_rate,
+            priority=request.priority,
+            request=request,
+            worker_id=WORKER_ID,
         )
-        tasks[task_id] = task_status
+        await _save_task(task_status)
 
-        # Start background download task
-        background_tasks.add_task(download_task, task_id, request)
+        # Queue the download task
+        task_status.queue_position = await get_scheduler().submit(
+            task_id, lambda: download_task(task_id, request), priority=request.priority
+        )
+        await _save_task(task_status)
 
-        logger.info(f"Started download task {task_id} for {spotify_url}")
+        logger.info(f"Queued download task {task_id} for {', '.join(spotify_urls)}")
 
         return DownloadResponse(
             task_id=task_id,
             status="pending",
             spotify_url=spotify_url,
+            spotify_urls=spotify_urls if len(spotify_urls) > 1 else None,
             content_type=content_type,
-            message=f"Download task started for {content_type}",
+            message=f"Download task queued for {content_type} (position {task_status.queue_position})",
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error starting download: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -90,26 +104,86 @@ async def start_download(request: DownloadRequest, background_tasks: BackgroundT
 @router.get("/download/{task_id}/status", response_model=DownloadStatus)
 async def get_download_status(task_id: str):
     """Get the current status of a download task."""
-    if task_id not in tasks:
+    task = await asyncio.to_thread(get_task_store().get, task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    _refresh_queue_position(task)
+    return task
+
+
+@router.get("/download/{task_id}/events")
+async def stream_download_events(task_id: str, request: Request):
+    """Stream the status of a download task as Server-Sent Events.
+
+    A ``status`` event carrying the DownloadStatus is sent on connection and
+    then on every change (track boundaries, status changes). The stream ends
+    once the task is completed, failed or cancelled. Clients that cannot use
+    SSE can keep polling ``/download/{task_id}/status``.
+    """
+    store = get_task_store()
+    if await asyncio.to_thread(store.get, task_id) is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return tasks[task_id]
+    broker = get_event_broker()
+    queue = broker.subscribe(task_id)
+
+    async def event_stream():
+        try:
+            task = await asyncio.to_thread(store.get, task_id)
+            last_payload = None
+            while task is not None:
+                _refresh_queue_position(task)
+                payload = task.model_dump_json()
+                if payload != last_payload:
+                    yield f"event: status\ndata: {payload}\n\n"
+                    last_payload = payload
+                if task.status in FINISHED_STATUSES:
+                    break
+
+                try:
+                    task = await asyncio.wait_for(
+                        queue.get(), timeout=APIConfig.EVENTS_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                    # Tasks run by another worker process only update the store
+                    task = await asyncio.to_thread(store.get, task_id)
+        finally:
+            broker.unsubscribe(task_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/download/{task_id}/cancel")
 async def cancel_download(task_id: str):
-    """Cancel a download task."""
-    if task_id not in tasks:
+    """Cancel a download task.
+
+    A queued task is removed from the queue. A running task stops its current
+    yt-dlp download and FFmpeg conversion, removes their partial files and
+    frees its slot for the next queued task.
+    """
+    task = await asyncio.to_thread(get_task_store().get, task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    task = tasks[task_id]
     if task.status in ["completed", "failed"]:
         raise HTTPException(
             status_code=400, detail=f"Cannot cancel task with status: {task.status}"
         )
 
     task.status = "cancelled"
+    task.queue_position = None
     task.error_message = "Task cancelled by user"
+    task.completed_at = datetime.now().isoformat()
+    await _save_task(task)
+    get_scheduler().cancel(task_id)
 
     return {"message": "Task cancelled successfully"}
 
@@ -119,32 +193,101 @@ async def list_downloads():
     """List all download tasks with their statuses.
     Returns a dictionary with keys for completed, pending, and processing tasks.
     """
+    store = get_task_store()
+    await asyncio.to_thread(store.evict_expired)
+    tasks = await asyncio.to_thread(store.list)
     if not tasks:
         return JSONResponse(
             status_code=204, content={"message": "No download tasks found"}
         )
-    tasks_completed = [
-        task
-        for task in tasks.values()
-        if task.status in ["completed", "failed", "cancelled"]
-    ]
-    tasks_pending = [task for task in tasks.values() if task.status == "pending"]
-    tasks_processing = [task for task in tasks.values() if task.status == "processing"]
 
-    return {
-        "completed": tasks_completed,
-        "pending": tasks_pending,
-        "processing": tasks_processing,
-    }
+    grouped = {"completed": [], "pending": [], "processing": []}
+    for task in tasks:
+        _refresh_queue_position(task)
+        key = task.status if task.status in ("pending", "processing") else "completed"
+        grouped[key].append(task)
+
+    return grouped
+
+
+def _content_type(spotify_url: str) -> Optional[str]:
+    """Get the content type (track, album or playlist) of a Spotify URL."""
+    for content_type in ("track", "album", "playlist"):
+        if content_type in spotify_url:
+            return content_type
+    return None
+
+
+async def _save_task(task: DownloadStatus):
+    """Store a task and push the update to its event stream subscribers.
+
+    The store is written from a worker thread, so a slow SQLite or Redis
+    write does not block the event loop.
+    """
+    await asyncio.to_thread(get_task_store().save, task)
+    get_event_broker().publish(task)
+
+
+async def _update_running_task(task: DownloadStatus) -> bool:
+    """Store a task run by this worker unless it was finished meanwhile.
+
+    Returns:
+        bool: False if the task was cancelled (or removed) in the store
+    """
+    if not await asyncio.to_thread(get_task_store().save_if_active, task):
+        return False
+    get_event_broker().publish(task)
+    return True
+
+
+class _ProgressSaver:
+    """Saves the progress of a running task from the download threads.
+
+    Every update is pushed to the event stream subscribers of this process,
+    but the task store, which rewrites the whole task, is written at most
+    once per APIConfig.PROGRESS_SAVE_SECONDS. The write is refused once the
+    task was cancelled in the store, possibly by another worker process;
+    the cancel token is then cancelled to stop the download.
+    """
+
+    def __init__(self, task: DownloadStatus, cancel_token: CancellationToken):
+        self.task = task
+        self.cancel_token = cancel_token
+        self._last_saved = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        if self.cancel_token.cancelled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            due = now - self._last_saved >= APIConfig.PROGRESS_SAVE_SECONDS
+            if due:
+                self._last_saved = now
+        if due and not get_task_store().save_if_active(self.task):
+            self.cancel_token.cancel("Task cancelled by user")
+            return
+        get_event_broker().publish(self.task)
+
+
+def _refresh_queue_position(task: DownloadStatus):
+    """Update the queue position of a task from the scheduler of this process.
+
+    Tasks queued by another worker process keep the position they were given
+    when submitted.
+    """
+    position = get_scheduler().position(task.task_id)
+    if position is not None or task.status != "pending":
+        task.queue_position = position
 
 
 @router.get("/inspect")
 async def inspect_spotify_url(spotify_url: str):
     """Inspect a Spotify URL to get metadata without downloading."""
     try:
-        spotify = SpotifyAPI()
+        spotify = get_async_spotify()
         if "track" in spotify_url:
-            track = spotify.get_track(spotify_url)
+            track = await spotify.get_track(spotify_url)
             return TrackInfo(
                 name=track.name,
                 artists=track.artists,
@@ -155,7 +298,7 @@ async def inspect_spotify_url(spotify_url: str):
             )
 
         elif "album" in spotify_url:
-            album = spotify.get_album(spotify_url)
+            album = await spotify.get_album(spotify_url)
             tracks = [
                 TrackInfo(
                     name=t.name,
@@ -177,7 +320,7 @@ async def inspect_spotify_url(spotify_url: str):
             )
 
         elif "playlist" in spotify_url:
-            playlist = spotify.get_playlist(spotify_url)
+            playlist = await spotify.get_playlist(spotify_url)
             tracks = [
                 TrackInfo(
                     name=t.name,
@@ -206,11 +349,38 @@ async def inspect_spotify_url(spotify_url: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def download_task(task_id: str, request: DownloadRequest):
-    """Background task for handling downloads."""
+async def download_task(task_id: str, request: DownloadRequest, resume: bool = False):
+    """Background task for handling downloads.
+
+    Args:
+        task_id: ID of the download task
+        request: Download request of the task
+        resume: Continue from the checkpoint journal of an interrupted run
+    """
+    store = get_task_store()
+    cancel_token = CancellationToken()
     try:
-        task = tasks[task_id]
+        task = await asyncio.to_thread(store.get, task_id)
+        if task is None or task.status == "cancelled":
+            return
         task.status = "processing"
+        task.queue_position = None
+        task.worker_id = WORKER_ID
+        if not await _update_running_task(task):
+            return
+        save_progress = _ProgressSaver(task, cancel_token)
+
+        # Byte-level progress of the current track (throttled by the downloader)
+        def byte_progress_callback(progress: TrackProgress):
+            task.phase = progress.phase
+            task.downloaded_bytes = progress.downloaded_bytes
+            task.total_bytes = progress.total_bytes
+            task.speed = progress.speed
+            task.eta = progress.eta
+            if progress.fraction is not None and task.total_tracks:
+                track_progress = (task.completed_tracks + progress.fraction) / task.total_tracks
+                task.progress = max(task.progress, min(int(track_progress * 100), 99))
+            save_progress()
 
         # Initialize the download service
         download_service = DownloadService(
@@ -220,6 +390,12 @@ async def download_task(task_id: str, request: DownloadRequest):
             generate_nfo=request.generate_nfo,
             output_format=request.output_format,
             bit_rate=request.bit_rate,
+            workers=request.workers,
+            pipeline=request.pipeline,
+            force=request.force,
+            cancel_token=cancel_token,
+            on_progress=byte_progress_callback,
+            resume=resume,
         )
 
         # Progress callback
@@ -227,12 +403,24 @@ async def download_task(task_id: str, request: DownloadRequest):
             task.current_track = track_name
             task.completed_tracks = current - 1  # current is 1-based
             task.total_tracks = total
-            task.progress = int((current / total) * 100) if total > 0 else 0
+            # Tracks before this one are done; byte progress fills in the rest
+            task.progress = max(task.progress, int(((current - 1) / total) * 100)) if total > 0 else 0
+            task.phase = task.downloaded_bytes = task.total_bytes = task.speed = task.eta = None
+            task.pipeline_stats = download_service.get_pipeline_stats()
+            save_progress()
 
         # Perform the download
-        result = await download_service.download_from_url(
-            str(request.spotify_url), progress_callback=progress_callback
-        )
+        try:
+            result = await download_service.download_from_urls(
+                request.get_urls(), progress_callback=progress_callback
+            )
+        except asyncio.CancelledError:
+            # Cancelled by the scheduler: stop the work left in the executor
+            cancel_token.cancel("Task cancelled by user")
+            raise
+
+        if cancel_token.cancelled:
+            return
 
         # Update task status
         task.status = "completed"
@@ -240,16 +428,85 @@ async def download_task(task_id: str, request: DownloadRequest):
         task.completed_tracks = result.get("completed_tracks", 0)
         task.failed_tracks = result.get("failed_tracks", 0)
         task.output_directory = result.get("output_directory")
+        task.pipeline_stats = download_service.get_pipeline_stats()
         task.completed_at = datetime.now().isoformat()
+        if not await _update_running_task(task):
+            return
 
         logger.info(f"Download task {task_id} completed successfully")
 
     except Exception as e:
         logger.error(f"Download task {task_id} failed: {str(e)}")
-        task = tasks[task_id]
+        task = await asyncio.to_thread(store.get, task_id)
+        if task is None:
+            return
         task.status = "failed"
         task.error_message = str(e)
         task.completed_at = datetime.now().isoformat()
+        await _update_running_task(task)
+
+
+async def resume_interrupted_tasks() -> int:
+    """Re-queue the tasks left pending or processing by a stopped worker process.
+
+    Only tasks whose lease was not refreshed for APIConfig.TASK_LEASE_SECONDS
+    are taken over, so the tasks of the other running workers are left alone.
+    Each task is claimed in the task store first, so when several workers
+    look at the same time only one of them resumes it. Albums and playlists
+    continue from their checkpoint journal, skipping the tracks already
+    finished.
+
+    Returns:
+        int: Number of resumed tasks
+    """
+    store = get_task_store()
+    scheduler = get_scheduler()
+    stale_before = time.time() - APIConfig.TASK_LEASE_SECONDS
+    resumed = 0
+    for task in await asyncio.to_thread(store.list, ["pending", "processing"]):
+        if task.worker_id == WORKER_ID or not await asyncio.to_thread(
+            store.claim, task.task_id, task.worker_id, WORKER_ID, stale_before
+        ):
+            continue
+
+        task = await asyncio.to_thread(store.get, task.task_id)
+        if task.request is None:
+            task.status = "failed"
+            task.error_message = "Interrupted by a server restart"
+            task.completed_at = datetime.now().isoformat()
+            await _save_task(task)
+            continue
+
+        task.status = "pending"
+        task.queue_position = await scheduler.submit(
+            task.task_id,
+            lambda task=task: download_task(task.task_id, task.request, resume=True),
+            priority=task.priority,
+        )
+        await _save_task(task)
+        resumed += 1
+
+    if resumed:
+        logger.info(f"Resumed {resumed} interrupted download tasks")
+    return resumed
+
+
+async def maintain_task_leases():
+    """Refresh the leases of the tasks of this worker and resume stale ones.
+
+    Runs until cancelled, three times per APIConfig.TASK_LEASE_SECONDS, so
+    the tasks of a live worker never look stale to the others, and the tasks
+    of a worker that stopped are picked up without waiting for a restart.
+    """
+    store = get_task_store()
+    while True:
+        await asyncio.sleep(APIConfig.TASK_LEASE_SECONDS / 3)
+        try:
+            await asyncio.to_thread(store.heartbeat, WORKER_ID)
+            if APIConfig.RESUME_TASKS:
+                await resume_interrupted_tasks()
+        except Exception as e:
+            logger.error(f"Error maintaining task leases: {e}")
 
 
 @router.get("/config/output_dir")
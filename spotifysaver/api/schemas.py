@@ -1,17 +1,22 @@
 """Pydantic schemas for API requests and responses"""
 
-from typing import List, Optional
-from pydantic import BaseModel, HttpUrl, Field
+from typing import Dict, List, Optional
+from pydantic import BaseModel, HttpUrl, Field, model_validator
 
 
 class DownloadRequest(BaseModel):
     """Schema for download request."""
 
-    spotify_url: HttpUrl = Field(
-        ...,
+    spotify_url: Optional[HttpUrl] = Field(
+        default=None,
         description="Spotify URL for track, album, or playlist",
         example="https://open.spotify.com/track/2kd0T6zgABT8P0s2h9QU5O",
     )
+    spotify_urls: Optional[List[HttpUrl]] = Field(
+        default=None,
+        description="Several Spotify URLs downloaded as one task; their metadata is fetched in batches",
+        max_length=5000,
+    )
     download_lyrics: bool = Field(
         default=False, description="Whether to download synchronized lyrics"
     )
@@ -34,6 +39,36 @@ class DownloadRequest(BaseModel):
     output_dir: Optional[str] = Field(
         default="Music", description="Custom output directory (optional)"
     )
+    workers: int = Field(
+        default=1,
+        description="Number of tracks of an album or playlist downloaded in parallel",
+        ge=1, le=16,
+    )
+    pipeline: bool = Field(
+        default=False,
+        description="Run search, download, transcode and tagging as concurrent stages",
+    )
+    force: bool = Field(
+        default=False,
+        description="Re-download tracks that already exist in the library",
+    )
+    priority: int = Field(
+        default=0,
+        description="Queue priority; higher values start first, equal values run in FIFO order",
+        ge=-10, le=10,
+    )
+
+    @model_validator(mode="after")
+    def check_urls(self):
+        if not self.get_urls():
+            raise ValueError("Provide spotify_url or spotify_urls")
+        return self
+
+    def get_urls(self) -> List[str]:
+        """Get every URL of the request, ``spotify_url`` first, without duplicates."""
+        urls = [self.spotify_url] if self.spotify_url else []
+        urls.extend(self.spotify_urls or [])
+        return list(dict.fromkeys(str(url) for url in urls))
 
 
 class TrackInfo(BaseModel):
@@ -74,9 +109,12 @@ class DownloadResponse(BaseModel):
 
     task_id: str = Field(..., description="Unique task identifier")
     status: str = Field(..., description="Current status of the download")
-    spotify_url: str = Field(..., description="Original Spotify URL")
+    spotify_url: str = Field(..., description="Original Spotify URL (the first one of a batch)")
+    spotify_urls: Optional[List[str]] = Field(
+        default=None, description="Every URL of a batch task"
+    )
     content_type: str = Field(
-        ..., description="Type of content (track, album, playlist)"
+        ..., description="Type of content (track, album, playlist or batch)"
     )
     message: str = Field(..., description="Status message")
 
@@ -97,6 +135,18 @@ class DownloadStatus(BaseModel):
     error_message: Optional[str] = None
     started_at: Optional[str] = None
     completed_at: Optional[str] = None
+    pipeline_stats: Optional[Dict[str, dict]] = None  # per-stage counters (pipeline mode)
+    queue_position: Optional[int] = None  # 1-based position while pending
+    priority: int = 0
+    # Byte-level progress of the current track
+    phase: Optional[str] = None  # downloading, postprocessing, transcoding, tagging, finished
+    downloaded_bytes: Optional[int] = None
+    total_bytes: Optional[int] = None
+    speed: Optional[float] = None  # bytes per second
+    eta: Optional[float] = None  # seconds
+    # Request of the task, kept so it can be resumed after a restart
+    request: Optional[DownloadRequest] = None
+    worker_id: Optional[str] = None  # API worker process running the task
 
 
 class ErrorResponse(BaseModel):
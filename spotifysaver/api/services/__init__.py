@@ -1,5 +1,31 @@
 """API Services Package"""
 
 from .download_service import DownloadService
+from .scheduler import DownloadScheduler
+from .events import TaskEventBroker
+from .task_store import TaskStore, SQLiteTaskStore, RedisTaskStore
+from .resources import (
+    WORKER_ID,
+    get_async_spotify,
+    get_download_executor,
+    get_scheduler,
+    get_task_store,
+    get_event_broker,
+    close_resources,
+)
 
-__all__ = ["DownloadService"]
+__all__ = [
+    "WORKER_ID",
+    "DownloadService",
+    "DownloadScheduler",
+    "TaskStore",
+    "SQLiteTaskStore",
+    "RedisTaskStore",
+    "TaskEventBroker",
+    "get_async_spotify",
+    "get_download_executor",
+    "get_scheduler",
+    "get_task_store",
+    "get_event_broker",
+    "close_resources",
+]
@@ -1,14 +1,22 @@
 """Download service for API operations"""
 
 import asyncio
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Dict, Optional, Callable, Any
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
 
-from ...services import SpotifyAPI, YoutubeMusicSearcher
-from ...downloader import YouTubeDownloader, YouTubeDownloaderForCLI
+from ...services import YoutubeMusicSearcher
+from ...services.async_spotify_api import AsyncSpotifyAPI
+from ...downloader import (
+    CancellationToken,
+    TrackProgress,
+    YouTubeDownloader,
+    YouTubeDownloaderForCLI,
+)
 from ...enums import AudioFormat, Bitrate
 from ...spotlog import get_logger
 from ..config import APIConfig
+from .resources import get_async_spotify, get_download_executor
 
 logger = get_logger("DownloadService")
 
@@ -24,6 +32,14 @@ class DownloadService:
         generate_nfo: bool = False,
         output_format: str = "m4a",
         bit_rate: int = 128,
+        workers: int = 1,
+        pipeline: bool = False,
+        force: bool = False,
+        spotify: Optional[AsyncSpotifyAPI] = None,
+        executor: Optional[Executor] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        on_progress: Optional[Callable[[TrackProgress], None]] = None,
+        resume: bool = False,
     ):
         """Initialize the download service.
 
@@ -33,6 +49,17 @@ class DownloadService:
             download_cover: Whether to download cover art
             generate_nfo: Whether to generate NFO files
             output_format: Audio format for downloads
+            bit_rate: Audio bitrate for downloads
+            workers: Number of tracks downloaded in parallel
+            pipeline: Whether to use the staged download pipeline
+            force: Whether to re-download tracks already in the library
+            spotify: Async Spotify client. Default: the client shared by the API process
+            executor: Executor for the blocking download work. Default: the
+                bounded download executor of the API process
+            cancel_token: Token that stops the download running in the executor
+            on_progress: Callback for the byte-level progress of each track
+            resume: Whether to continue albums and playlists from the
+                checkpoint journal of an interrupted run
         """
         self.output_dir = output_dir or APIConfig.get_output_dir()
         self.download_lyrics = download_lyrics
@@ -41,11 +68,20 @@ class DownloadService:
         # Convert string format to enum for internal use
         self.output_format = YouTubeDownloader.string_to_audio_format(output_format)
         self.bit_rate = YouTubeDownloader.int_to_bitrate(bit_rate)
+        self.workers = workers
+        self.pipeline = pipeline
+        self.resume = resume
 
         # Initialize services
-        self.spotify = SpotifyAPI()
+        self.spotify = spotify or get_async_spotify()
+        self.executor = executor or get_download_executor()
         self.searcher = YoutubeMusicSearcher()
-        self.downloader = YouTubeDownloaderForCLI(base_dir=self.output_dir)
+        self.downloader = YouTubeDownloaderForCLI(
+            base_dir=self.output_dir,
+            force=force,
+            cancel_token=cancel_token,
+            on_progress=on_progress,
+        )
 
     async def download_from_url(
         self,
@@ -75,21 +111,101 @@ class DownloadService:
             logger.error(f"Error downloading from {spotify_url}: {str(e)}")
             raise
 
+    async def download_from_urls(
+        self,
+        spotify_urls: List[str],
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ) -> Dict[str, Any]:
+        """Download several Spotify URLs as one task.
+
+        Every URL is resolved before the first download starts: tracks with
+        the batch endpoint (50 per request), albums with the batch endpoint
+        (20 per request) and playlists one by one. The tracks are then
+        downloaded as one job, followed by each album and playlist, and
+        progress is reported over the tracks of the whole batch.
+
+        Args:
+            spotify_urls: Spotify URLs of tracks, albums and playlists
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            Dict containing download results and statistics
+        """
+        if len(spotify_urls) == 1:
+            return await self.download_from_url(spotify_urls[0], progress_callback)
+
+        track_urls = [url for url in spotify_urls if "track" in url]
+        album_urls = [url for url in spotify_urls if "album" in url]
+        playlist_urls = [url for url in spotify_urls if "playlist" in url]
+
+        tracks = await self.spotify.get_tracks(track_urls) if track_urls else []
+        albums = await self.spotify.get_albums(album_urls) if album_urls else []
+        playlists = [(url, await self.spotify.get_playlist_info(url)) for url in playlist_urls]
+
+        total = (
+            len(tracks)
+            + sum(len(album.tracks) for album in albums)
+            + sum(playlist.total_tracks for _, playlist in playlists)
+        )
+        offset = 0
+
+        def batch_progress_callback(idx: int, _total: int, name: str):
+            if progress_callback:
+                progress_callback(offset + idx, total, name)
+
+        jobs = []
+        if tracks:
+            jobs.append((len(tracks), lambda: self.downloader.download_tracks_cli(
+                tracks, self.output_format, self.bit_rate, self.download_lyrics,
+                batch_progress_callback, self.workers, self.pipeline, self.resume,
+            )))
+        for album in albums:
+            jobs.append((len(album.tracks), lambda album=album: self.downloader.download_album_cli(
+                album, self.download_lyrics, self.output_format, self.bit_rate,
+                self.generate_nfo, self.download_cover, batch_progress_callback,
+                self.workers, self.pipeline, self.resume,
+            )))
+        loop = asyncio.get_running_loop()
+        for url, playlist in playlists:
+            jobs.append((playlist.total_tracks, lambda url=url, playlist=playlist: self.downloader.download_playlist_cli(
+                playlist, self.output_format, self.bit_rate, self.download_lyrics,
+                self.download_cover, batch_progress_callback,
+                self.workers, self.pipeline, self.resume,
+                self._iter_in_thread(self.spotify.iter_playlist_tracks(url, playlist), loop),
+            )))
+
+        completed = 0
+        for size, job in jobs:
+            if self.downloader.cancelled:
+                break
+            success, _ = await loop.run_in_executor(self.executor, job)
+            completed += success
+            offset += size
+
+        return {
+            "content_type": "batch",
+            "completed_tracks": completed,
+            "failed_tracks": total - completed,
+            "total_tracks": total,
+            "output_directory": str(self.output_dir),
+        }
+
     async def _download_track(
         self,
         track_url: str,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
     ) -> Dict[str, Any]:
         """Download a single track."""
-        track = self.spotify.get_track(track_url)
+        track = await self.spotify.get_track(track_url)
 
+        loop = asyncio.get_running_loop()
         if progress_callback:
-            progress_callback(1, 1, track.name)
+            # The callback may block (task store writes), like in the worker threads
+            await loop.run_in_executor(None, progress_callback, 1, 1, track.name)
 
         # Run download in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
         audio_path, updated_track = await loop.run_in_executor(
-            None, self._download_track_sync, track
+            self.executor, self._download_track_sync, track
         )
 
         return {
@@ -106,7 +222,7 @@ class DownloadService:
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
     ) -> Dict[str, Any]:
         """Download an entire album."""
-        album = self.spotify.get_album(album_url)
+        album = await self.spotify.get_album(album_url)
 
         # Create a wrapper for the progress callback
         def sync_progress_callback(idx: int, total: int, name: str):
@@ -114,9 +230,9 @@ class DownloadService:
                 progress_callback(idx, total, name)
 
         # Run download in thread pool
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         success, total = await loop.run_in_executor(
-            None,
+            self.executor,
             self.downloader.download_album_cli,
             album,
             self.download_lyrics,
@@ -125,6 +241,9 @@ class DownloadService:
             self.generate_nfo,
             self.download_cover,
             sync_progress_callback,
+            self.workers,
+            self.pipeline,
+            self.resume,
         )
 
         output_dir = self.downloader._get_album_dir(album)
@@ -142,8 +261,8 @@ class DownloadService:
         playlist_url: str,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
     ) -> Dict[str, Any]:
-        """Download an entire playlist."""
-        playlist = self.spotify.get_playlist(playlist_url)
+        """Download an entire playlist, streaming its tracks as pages arrive."""
+        playlist = await self.spotify.get_playlist_info(playlist_url)
 
         # Create a wrapper for the progress callback
         def sync_progress_callback(idx: int, total: int, name: str):
@@ -151,9 +270,9 @@ class DownloadService:
                 progress_callback(idx, total, name)
 
         # Run download in thread pool
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         success, total = await loop.run_in_executor(
-            None,
+            self.executor,
             self.downloader.download_playlist_cli,
             playlist,
             self.output_format,
@@ -161,6 +280,10 @@ class DownloadService:
             self.download_lyrics,
             self.download_cover,
             sync_progress_callback,
+            self.workers,
+            self.pipeline,
+            self.resume,
+            self._iter_in_thread(self.spotify.iter_playlist_tracks(playlist_url, playlist), loop),
         )
 
         output_dir = Path(self.output_dir) / playlist.name
@@ -173,6 +296,39 @@ class DownloadService:
             "output_directory": str(output_dir),
         }
 
+    @staticmethod
+    def _iter_in_thread(items: AsyncIterator, loop: asyncio.AbstractEventLoop) -> Iterator:
+        """Consume an async iterator from a download executor thread.
+
+        Each item is awaited on ``loop``, which keeps running while the
+        executor works, so the download can start on the first tracks of a
+        playlist while the next pages are fetched on the event loop.
+
+        Args:
+            items: Async iterator owned by ``loop``
+            loop: Running event loop of the API process
+
+        Yields:
+            Items of ``items`` in order
+        """
+        try:
+            while True:
+                try:
+                    yield asyncio.run_coroutine_threadsafe(items.__anext__(), loop).result()
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(items.aclose(), loop)
+
+    def get_pipeline_stats(self) -> Optional[Dict[str, dict]]:
+        """Get the per-stage statistics of the running pipeline, if any."""
+        if not self.downloader.pipeline:
+            return None
+        return {
+            name: stats.to_dict() for name, stats in self.downloader.pipeline.stats().items()
+        }
+
     def _download_track_sync(self, track):
         """Synchronous track download helper."""
         return self.downloader.download_track_cli(
@@ -0,0 +1,99 @@
+"""In-process broker pushing download task updates to event stream subscribers"""
+
+import asyncio
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from ...spotlog import get_logger
+from ..schemas import DownloadStatus
+
+logger = get_logger("TaskEventBroker")
+
+
+class TaskEventBroker:
+    """Fan out DownloadStatus updates to the subscribers of each task.
+
+    ``publish`` can be called from any thread (progress callbacks run in the
+    download executor); updates are delivered on the event loop of each
+    subscriber. An update identical to the last one published for the task
+    is dropped, so subscribers only receive actual changes. The last update
+    is only remembered while a task has subscribers and is not finished.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._last_payload: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, task_id: str) -> asyncio.Queue:
+        """Register a subscriber for the updates of a task.
+
+        Must be called from a coroutine; the queue belongs to its event loop.
+
+        Args:
+            task_id: ID of the download task
+
+        Returns:
+            asyncio.Queue: Queue receiving DownloadStatus objects
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            self._subscribers.setdefault(task_id, set()).add(
+                (asyncio.get_running_loop(), queue)
+            )
+        return queue
+
+    def unsubscribe(self, task_id: str, queue: asyncio.Queue):
+        """Remove a subscriber.
+
+        Args:
+            task_id: ID of the download task
+            queue: Queue returned by ``subscribe``
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(task_id, set())
+            for entry in [entry for entry in subscribers if entry[1] is queue]:
+                subscribers.discard(entry)
+            if not subscribers:
+                self._subscribers.pop(task_id, None)
+                self._last_payload.pop(task_id, None)
+
+    def publish(self, task: DownloadStatus):
+        """Send an update of a task to its subscribers.
+
+        Args:
+            task: Current status of the task
+        """
+        payload = task.model_dump_json()
+        with self._lock:
+            if self._last_payload.get(task.task_id) == payload:
+                return
+            subscribers: List = list(self._subscribers.get(task.task_id, ()))
+            if subscribers and task.status not in ("completed", "failed", "cancelled"):
+                self._last_payload[task.task_id] = payload
+            else:
+                self._last_payload.pop(task.task_id, None)
+        if not subscribers:
+            return
+
+        snapshot = task.model_copy(deep=True)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, snapshot)
+            except RuntimeError:
+                # The loop of the subscriber is closed
+                self.unsubscribe(task.task_id, queue)
+
+    def subscriber_count(self, task_id: Optional[str] = None) -> int:
+        """Get the number of subscribers of a task, or of every task.
+
+        Args:
+            task_id: ID of the download task
+
+        Returns:
+            int: Number of subscribers
+        """
+        with self._lock:
+            if task_id is not None:
+                return len(self._subscribers.get(task_id, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
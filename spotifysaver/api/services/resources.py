@@ -0,0 +1,116 @@
+"""Shared resources of the API process: async clients, scheduler, task store, events and executor"""
+
+import os
+import socket
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from ...services.async_spotify_api import AsyncSpotifyAPI
+from ..config import APIConfig
+from .events import TaskEventBroker
+from .scheduler import DownloadScheduler
+from .task_store import RedisTaskStore, SQLiteTaskStore, TaskStore
+
+# Identifies this API worker process in the tasks it runs
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+_spotify: Optional[AsyncSpotifyAPI] = None
+_download_executor: Optional[ThreadPoolExecutor] = None
+_scheduler: Optional[DownloadScheduler] = None
+_task_store: Optional[TaskStore] = None
+_event_broker: Optional[TaskEventBroker] = None
+
+
+def get_async_spotify() -> AsyncSpotifyAPI:
+    """Get the Spotify client shared by every request of the API process.
+
+    Returns:
+        AsyncSpotifyAPI: Shared async client (created on first use)
+    """
+    global _spotify
+    if _spotify is None:
+        _spotify = AsyncSpotifyAPI()
+    return _spotify
+
+
+def get_download_executor() -> ThreadPoolExecutor:
+    """Get the thread pool reserved for blocking yt-dlp and FFmpeg work.
+
+    Its size bounds how many downloads run at the same time, independently of
+    the default executor used by FastAPI and the event loop.
+
+    Returns:
+        ThreadPoolExecutor: Executor with APIConfig.MAX_CONCURRENT_DOWNLOADS threads
+    """
+    global _download_executor
+    if _download_executor is None:
+        _download_executor = ThreadPoolExecutor(
+            max_workers=APIConfig.MAX_CONCURRENT_DOWNLOADS,
+            thread_name_prefix="download",
+        )
+    return _download_executor
+
+
+def get_scheduler() -> DownloadScheduler:
+    """Get the scheduler that queues the download tasks of the API process.
+
+    Returns:
+        DownloadScheduler: Scheduler running APIConfig.MAX_CONCURRENT_DOWNLOADS jobs at a time
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = DownloadScheduler(APIConfig.MAX_CONCURRENT_DOWNLOADS)
+    return _scheduler
+
+
+def get_task_store() -> TaskStore:
+    """Get the store holding the download tasks.
+
+    The backend is chosen by APIConfig.TASK_STORE: "sqlite" (default) keeps
+    the tasks in APIConfig.TASK_STORE_PATH, "redis" in the server at
+    APIConfig.TASK_STORE_REDIS_URL.
+
+    Returns:
+        TaskStore: Shared task store (created on first use)
+    """
+    global _task_store
+    if _task_store is None:
+        if APIConfig.TASK_STORE == "redis":
+            _task_store = RedisTaskStore(
+                url=APIConfig.TASK_STORE_REDIS_URL, ttl_hours=APIConfig.TASK_TTL_HOURS
+            )
+        else:
+            _task_store = SQLiteTaskStore(
+                APIConfig.TASK_STORE_PATH, ttl_hours=APIConfig.TASK_TTL_HOURS
+            )
+    return _task_store
+
+
+def get_event_broker() -> TaskEventBroker:
+    """Get the broker pushing task updates to the event streams of this process.
+
+    Returns:
+        TaskEventBroker: Shared broker (created on first use)
+    """
+    global _event_broker
+    if _event_broker is None:
+        _event_broker = TaskEventBroker()
+    return _event_broker
+
+
+async def close_resources():
+    """Close the shared clients and stop accepting new downloads."""
+    global _spotify, _download_executor, _scheduler, _task_store
+    if _scheduler is not None:
+        await _scheduler.stop()
+        _scheduler = None
+    if _spotify is not None:
+        await _spotify.aclose()
+        _spotify = None
+    if _download_executor is not None:
+        _download_executor.shutdown(wait=False)
+        _download_executor = None
+    if _task_store is not None:
+        _task_store.close()
+        _task_store = None
@@ -0,0 +1,169 @@
+"""Download job scheduler for the API"""
+
+import asyncio
+import bisect
+import itertools
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from ...spotlog import get_logger
+from ..config import APIConfig
+
+logger = get_logger("DownloadScheduler")
+
+
+@dataclass(order=True)
+class _QueuedJob:
+    sort_key: tuple
+    task_id: str = field(compare=False)
+    job: Callable[[], Awaitable[None]] = field(compare=False)
+
+
+class DownloadScheduler:
+    """Runs download jobs with a bounded number of concurrent downloads.
+
+    Jobs wait in a priority queue (higher priority first, FIFO within the
+    same priority) and at most ``max_concurrent`` of them run at a time.
+    Worker coroutines are started on the first submission, inside the
+    running event loop.
+
+    Attributes:
+        max_concurrent: Maximum number of jobs running at the same time
+    """
+
+    def __init__(self, max_concurrent: Optional[int] = None):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrent: Maximum number of concurrent jobs.
+                Default: APIConfig.MAX_CONCURRENT_DOWNLOADS
+        """
+        self.max_concurrent = max(1, max_concurrent or APIConfig.MAX_CONCURRENT_DOWNLOADS)
+        self._queue: List[_QueuedJob] = []
+        self._running: Dict[str, asyncio.Task] = {}
+        self._counter = itertools.count()
+        self._workers: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Condition] = None
+
+    def _ensure_workers(self):
+        if self._workers:
+            return
+        self._wakeup = asyncio.Condition()
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"download-scheduler-{n}")
+            for n in range(self.max_concurrent)
+        ]
+
+    async def submit(
+        self, task_id: str, job: Callable[[], Awaitable[None]], priority: int = 0
+    ) -> int:
+        """Queue a job.
+
+        Args:
+            task_id: ID of the download task
+            job: Coroutine function that performs the download
+            priority: Higher values run first. Equal priorities run in FIFO order.
+
+        Returns:
+            int: 1-based position of the job in the queue
+        """
+        self._ensure_workers()
+        entry = _QueuedJob((-priority, next(self._counter)), task_id, job)
+        async with self._wakeup:
+            bisect.insort(self._queue, entry)
+            self._wakeup.notify()
+        position = self.position(task_id)
+        logger.info(f"Queued task {task_id} (priority {priority}, position {position})")
+        return position
+
+    def position(self, task_id: str) -> Optional[int]:
+        """Get the 1-based queue position of a task.
+
+        Args:
+            task_id: ID of the download task
+
+        Returns:
+            int: Position in the queue, or None if the task is not waiting
+        """
+        for index, entry in enumerate(self._queue):
+            if entry.task_id == task_id:
+                return index + 1
+        return None
+
+    def remove(self, task_id: str) -> bool:
+        """Remove a task that has not started yet.
+
+        Args:
+            task_id: ID of the download task
+
+        Returns:
+            bool: True if the task was waiting and has been removed
+        """
+        for index, entry in enumerate(self._queue):
+            if entry.task_id == task_id:
+                del self._queue[index]
+                return True
+        return False
+
+    def cancel(self, task_id: str) -> bool:
+        """Remove a waiting task, or cancel the job of a running one.
+
+        A running job receives ``asyncio.CancelledError`` and its worker
+        immediately takes the next job from the queue.
+
+        Args:
+            task_id: ID of the download task
+
+        Returns:
+            bool: True if the task was waiting or running in this scheduler
+        """
+        if self.remove(task_id):
+            return True
+        job = self._running.get(task_id)
+        if job is None:
+            return False
+        job.cancel()
+        return True
+
+    def stats(self) -> dict:
+        """Get the number of queued and running jobs.
+
+        Returns:
+            dict: Queue length, running jobs and the concurrency limit
+        """
+        return {
+            "queued": len(self._queue),
+            "running": len(self._running),
+            "max_concurrent": self.max_concurrent,
+        }
+
+    async def _worker(self):
+        """Take jobs from the queue until the scheduler is stopped."""
+        while True:
+            async with self._wakeup:
+                await self._wakeup.wait_for(lambda: self._queue)
+                entry = self._queue.pop(0)
+
+            job = asyncio.ensure_future(entry.job())
+            self._running[entry.task_id] = job
+            try:
+                # wait() does not raise when only the job is cancelled
+                await asyncio.wait({job})
+            except asyncio.CancelledError:
+                job.cancel()
+                raise
+            finally:
+                self._running.pop(entry.task_id, None)
+
+            if job.cancelled():
+                logger.info(f"Scheduled task {entry.task_id} cancelled")
+            elif job.exception():
+                logger.error(f"Scheduled task {entry.task_id} failed: {job.exception()}")
+
+    async def stop(self):
+        """Stop the workers. Queued jobs are discarded."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue.clear()
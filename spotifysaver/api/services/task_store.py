@@ -0,0 +1,513 @@
+"""Persistent storage for the download tasks of the API"""
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from ...spotlog import get_logger
+from ..schemas import DownloadStatus
+
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+ALL_STATUSES = ("pending", "processing", *FINISHED_STATUSES)
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    """Convert an ISO 8601 date of DownloadStatus to a UNIX timestamp."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+class WatchError(Exception):
+    """Raised by a Redis stand-in when a watched key changed before EXEC."""
+
+
+def _watch_errors() -> Tuple[type, ...]:
+    """Get the exceptions that mean a Redis WATCH transaction was aborted."""
+    try:
+        from redis.exceptions import WatchError as RedisWatchError
+    except ImportError:
+        return (WatchError,)
+    return (RedisWatchError, WatchError)
+
+
+class TaskStore(ABC):
+    """Storage backend for DownloadStatus objects.
+
+    Every API worker process reads and writes the tasks through a store, so
+    several workers behind one load balancer see the same tasks. Finished
+    tasks are evicted once they are older than the TTL.
+
+    Unfinished tasks hold a lease: a timestamp refreshed on every save and by
+    ``heartbeat``. A task whose lease is older than the lease timeout belongs
+    to a worker that stopped, and only then can another worker ``claim`` it.
+
+    Attributes:
+        ttl: Seconds a finished task is kept (None or 0 means forever)
+    """
+
+    def __init__(self, ttl_hours: Optional[float] = None):
+        self.ttl = ttl_hours * 3600 if ttl_hours else None
+        self.logger = get_logger(f"{self.__class__.__name__}")
+
+    @abstractmethod
+    def get(self, task_id: str) -> Optional[DownloadStatus]:
+        """Get a task.
+
+        Args:
+            task_id: ID of the download task
+
+        Returns:
+            DownloadStatus: Stored task, or None if it does not exist
+        """
+
+    @abstractmethod
+    def save(self, task: DownloadStatus):
+        """Store (or replace) a task.
+
+        Args:
+            task: Task to store
+        """
+
+    @abstractmethod
+    def save_if_active(self, task: DownloadStatus) -> bool:
+        """Replace a stored task unless it was finished meanwhile.
+
+        Used by the worker running the task, so its progress updates never
+        overwrite a cancellation written by a request (possibly handled by
+        another worker process).
+
+        Args:
+            task: Task to store
+
+        Returns:
+            bool: False if the stored task is missing, completed, failed or
+                cancelled; the store is left unchanged
+        """
+
+    @abstractmethod
+    def list(self, statuses: Optional[Iterable[str]] = None) -> List[DownloadStatus]:
+        """List tasks ordered by start date.
+
+        Args:
+            statuses: Only return tasks with one of these statuses
+
+        Returns:
+            List[DownloadStatus]: Tasks, oldest first
+        """
+
+    @abstractmethod
+    def delete(self, task_id: str) -> bool:
+        """Remove a task.
+
+        Args:
+            task_id: ID of the download task
+
+        Returns:
+            bool: True if the task existed
+        """
+
+    @abstractmethod
+    def heartbeat(self, owner: str) -> int:
+        """Refresh the lease of the unfinished tasks of a worker process.
+
+        Args:
+            owner: ``worker_id`` of the caller
+
+        Returns:
+            int: Number of refreshed tasks
+        """
+
+    @abstractmethod
+    def claim(
+        self, task_id: str, expected_owner: Optional[str], owner: str, stale_before: float
+    ) -> bool:
+        """Take over a task left by a worker process that stopped.
+
+        The owner is swapped only if it is still ``expected_owner`` and the
+        lease was last refreshed before ``stale_before``, in one atomic step,
+        so a live worker never loses its tasks and several workers claiming
+        at the same time never resume the same task twice. The claim
+        refreshes the lease.
+
+        Args:
+            task_id: ID of the download task
+            expected_owner: ``worker_id`` the task currently has
+            owner: ``worker_id`` of the caller
+            stale_before: UNIX timestamp a lease must be older than
+
+        Returns:
+            bool: True if the caller now owns the task
+        """
+
+    @abstractmethod
+    def evict_expired(self) -> int:
+        """Remove finished tasks older than the TTL.
+
+        Returns:
+            int: Number of removed tasks
+        """
+
+    def close(self):
+        """Release the resources of the store."""
+
+
+class SQLiteTaskStore(TaskStore):
+    """Task store backed by a SQLite database.
+
+    The database can be shared by every worker process of one host.
+
+    Attributes:
+        db_path: Path of the SQLite database
+    """
+
+    def __init__(self, db_path: Path, ttl_hours: Optional[float] = None):
+        """Initialize the store and create its table if needed.
+
+        Args:
+            db_path: Path of the SQLite database
+            ttl_hours: Hours a finished task is kept
+        """
+        super().__init__(ttl_hours)
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tasks (
+                    task_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    started_at REAL,
+                    completed_at REAL,
+                    heartbeat REAL,
+                    data TEXT NOT NULL
+                )
+                """
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")}
+            if "heartbeat" not in columns:
+                # Database created before task leases; its tasks count as stale
+                self._conn.execute("ALTER TABLE tasks ADD COLUMN heartbeat REAL")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_started_at ON tasks (started_at)"
+            )
+
+    def get(self, task_id: str) -> Optional[DownloadStatus]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM tasks WHERE task_id = ?", (task_id,)
+            ).fetchone()
+        return DownloadStatus.model_validate_json(row[0]) if row else None
+
+    def save(self, task: DownloadStatus):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tasks "
+                "(task_id, status, started_at, completed_at, heartbeat, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    task.task_id,
+                    task.status,
+                    _timestamp(task.started_at),
+                    _timestamp(task.completed_at),
+                    time.time(),
+                    task.model_dump_json(),
+                ),
+            )
+
+    def save_if_active(self, task: DownloadStatus) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET status = ?, started_at = ?, completed_at = ?, heartbeat = ?, "
+                "data = ? WHERE task_id = ? "
+                f"AND status NOT IN ({', '.join('?' * len(FINISHED_STATUSES))})",
+                (
+                    task.status,
+                    _timestamp(task.started_at),
+                    _timestamp(task.completed_at),
+                    time.time(),
+                    task.model_dump_json(),
+                    task.task_id,
+                    *FINISHED_STATUSES,
+                ),
+            )
+        return cursor.rowcount > 0
+
+    def list(self, statuses: Optional[Iterable[str]] = None) -> List[DownloadStatus]:
+        query, params = "SELECT data FROM tasks", []
+        if statuses is not None:
+            params = list(statuses)
+            query += f" WHERE status IN ({', '.join('?' * len(params))})"
+        query += " ORDER BY started_at"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [DownloadStatus.model_validate_json(row[0]) for row in rows]
+
+    def delete(self, task_id: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+        return cursor.rowcount > 0
+
+    def heartbeat(self, owner: str) -> int:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET heartbeat = ? "
+                "WHERE status IN ('pending', 'processing') AND json_extract(data, '$.worker_id') = ?",
+                (time.time(), owner),
+            )
+        return cursor.rowcount
+
+    def claim(
+        self, task_id: str, expected_owner: Optional[str], owner: str, stale_before: float
+    ) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET data = json_set(data, '$.worker_id', ?), heartbeat = ? "
+                "WHERE task_id = ? AND COALESCE(json_extract(data, '$.worker_id'), '') = ? "
+                "AND COALESCE(heartbeat, 0) < ?",
+                (owner, time.time(), task_id, expected_owner or "", stale_before),
+            )
+        return cursor.rowcount > 0
+
+    def evict_expired(self) -> int:
+        if self.ttl is None:
+            return 0
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"DELETE FROM tasks WHERE status IN ({', '.join('?' * len(FINISHED_STATUSES))}) "
+                "AND COALESCE(completed_at, started_at) < ?",
+                (*FINISHED_STATUSES, time.time() - self.ttl),
+            )
+        if cursor.rowcount:
+            self.logger.info(f"Evicted {cursor.rowcount} finished tasks")
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RedisTaskStore(TaskStore):
+    """Task store backed by Redis, shared by API workers on several hosts.
+
+    Each task is a JSON string under ``<prefix>:task:<id>``. Sorted sets
+    scored by start date index the tasks by status, and one scored by the
+    completion date tracks finished tasks for eviction. The lease of an
+    unfinished task is a timestamp under ``<prefix>:lease:<id>``.
+
+    Every read-modify-write runs in a WATCH/MULTI transaction, retried when
+    another worker changes the task meanwhile.
+
+    Any client with the redis-py interface can be injected, so a local
+    stand-in works in place of a server. Stand-ins signal an aborted
+    transaction with ``WatchError`` from this module.
+
+    Attributes:
+        client: Redis client
+        prefix: Prefix of every key written by the store
+    """
+
+    def __init__(
+        self,
+        client=None,
+        url: Optional[str] = None,
+        prefix: str = "spotifysaver",
+        ttl_hours: Optional[float] = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            client: Redis client to use. Default: a new client connected to ``url``
+            url: Redis URL, used when no client is given
+            prefix: Prefix of every key written by the store
+            ttl_hours: Hours a finished task is kept
+
+        Raises:
+            ImportError: If no client is given and the redis package is not installed
+        """
+        super().__init__(ttl_hours)
+        self._owns_client = client is None
+        if client is None:
+            client = self._connect(url)
+        self.client = client
+        self.prefix = prefix
+        self._watch_errors = _watch_errors()
+
+    @staticmethod
+    def _connect(url: Optional[str]):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "The Redis task store requires the 'redis' package: pip install redis"
+            ) from e
+        return redis.Redis.from_url(url or "redis://localhost:6379/0")
+
+    def _task_key(self, task_id: str) -> str:
+        return f"{self.prefix}:task:{task_id}"
+
+    def _lease_key(self, task_id: str) -> str:
+        return f"{self.prefix}:lease:{task_id}"
+
+    def _status_key(self, status: str) -> str:
+        return f"{self.prefix}:status:{status}"
+
+    @property
+    def _finished_key(self) -> str:
+        return f"{self.prefix}:finished"
+
+    def get(self, task_id: str) -> Optional[DownloadStatus]:
+        data = self.client.get(self._task_key(task_id))
+        return DownloadStatus.model_validate_json(data) if data else None
+
+    def _transaction(self, keys: List[str], body: Callable[[Any], Any]) -> Any:
+        """Run ``body`` in a WATCH transaction on ``keys``, retrying when they change.
+
+        ``body`` receives the pipeline in immediate mode to read the watched
+        keys, then calls ``multi`` and ``execute`` itself to write them.
+        """
+        while True:
+            with self.client.pipeline() as pipe:
+                try:
+                    pipe.watch(*keys)
+                    return body(pipe)
+                except self._watch_errors:
+                    continue
+
+    @staticmethod
+    def _status_of(data) -> Optional[str]:
+        return DownloadStatus.model_validate_json(data).status if data else None
+
+    def _queue_save(self, pipe, task: DownloadStatus, previous_status: Optional[str]):
+        """Queue the writes of a task and its indexes in a MULTI block."""
+        started_at = _timestamp(task.started_at) or time.time()
+        pipe.set(self._task_key(task.task_id), task.model_dump_json())
+        if previous_status is not None and previous_status != task.status:
+            pipe.zrem(self._status_key(previous_status), task.task_id)
+        pipe.zadd(self._status_key(task.status), {task.task_id: started_at})
+        if task.status in FINISHED_STATUSES:
+            finished_at = _timestamp(task.completed_at) or started_at
+            pipe.zadd(self._finished_key, {task.task_id: finished_at})
+            pipe.delete(self._lease_key(task.task_id))
+        else:
+            pipe.set(self._lease_key(task.task_id), time.time())
+
+    def save(self, task: DownloadStatus):
+        task_key = self._task_key(task.task_id)
+
+        def write(pipe):
+            previous_status = self._status_of(pipe.get(task_key))
+            pipe.multi()
+            self._queue_save(pipe, task, previous_status)
+            pipe.execute()
+
+        self._transaction([task_key], write)
+
+    def save_if_active(self, task: DownloadStatus) -> bool:
+        task_key = self._task_key(task.task_id)
+
+        def write(pipe) -> bool:
+            previous_status = self._status_of(pipe.get(task_key))
+            if previous_status is None or previous_status in FINISHED_STATUSES:
+                return False
+            pipe.multi()
+            self._queue_save(pipe, task, previous_status)
+            pipe.execute()
+            return True
+
+        return self._transaction([task_key], write)
+
+    def list(self, statuses: Optional[Iterable[str]] = None) -> List[DownloadStatus]:
+        statuses = list(statuses) if statuses is not None else ALL_STATUSES
+        scored = []
+        for status in statuses:
+            scored.extend(self.client.zrange(self._status_key(status), 0, -1, withscores=True))
+        scored.sort(key=lambda item: item[1])
+
+        task_ids = [
+            task_id.decode() if isinstance(task_id, bytes) else task_id for task_id, _ in scored
+        ]
+        if not task_ids:
+            return []
+        values = self.client.mget([self._task_key(task_id) for task_id in task_ids])
+        return [DownloadStatus.model_validate_json(data) for data in values if data]
+
+    def delete(self, task_id: str) -> bool:
+        task_key = self._task_key(task_id)
+
+        def remove(pipe) -> bool:
+            status = self._status_of(pipe.get(task_key))
+            if status is None:
+                return False
+            pipe.multi()
+            pipe.delete(task_key)
+            pipe.delete(self._lease_key(task_id))
+            pipe.zrem(self._status_key(status), task_id)
+            pipe.zrem(self._finished_key, task_id)
+            pipe.execute()
+            return True
+
+        return self._transaction([task_key], remove)
+
+    def heartbeat(self, owner: str) -> int:
+        tasks = [task for task in self.list(["pending", "processing"]) if task.worker_id == owner]
+        if not tasks:
+            return 0
+        now = time.time()
+        pipe = self.client.pipeline()
+        for task in tasks:
+            pipe.set(self._lease_key(task.task_id), now)
+        pipe.execute()
+        return len(tasks)
+
+    def claim(
+        self, task_id: str, expected_owner: Optional[str], owner: str, stale_before: float
+    ) -> bool:
+        task_key, lease_key = self._task_key(task_id), self._lease_key(task_id)
+
+        def take_over(pipe) -> bool:
+            data, lease = pipe.get(task_key), pipe.get(lease_key)
+            if not data or float(lease or 0) >= stale_before:
+                return False
+            task = DownloadStatus.model_validate_json(data)
+            if task.worker_id != expected_owner:
+                return False
+            task.worker_id = owner
+            pipe.multi()
+            pipe.set(task_key, task.model_dump_json())
+            pipe.set(lease_key, time.time())
+            pipe.execute()
+            return True
+
+        return self._transaction([task_key, lease_key], take_over)
+
+    def evict_expired(self) -> int:
+        if self.ttl is None:
+            return 0
+        expired = self.client.zrangebyscore(self._finished_key, "-inf", time.time() - self.ttl)
+        removed = 0
+        for task_id in expired:
+            task_id = task_id.decode() if isinstance(task_id, bytes) else task_id
+            if self.delete(task_id):
+                removed += 1
+            else:
+                self.client.zrem(self._finished_key, task_id)
+        if removed:
+            self.logger.info(f"Evicted {removed} finished tasks")
+        return removed
+
+    def close(self):
+        if self._owns_client:
+            self.client.close()
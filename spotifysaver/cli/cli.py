@@ -8,16 +8,42 @@ preservation and organization features.
 
 from click import group
 
-from spotifysaver.cli.commands import (
-    download,
-    version,
-    inspect,
-    show_log,
-    init as init_command,
-)
-
-
-@group()
+from spotifysaver.cli.lazy_group import LazyGroup
+
+# Commands are imported only when invoked: name -> ("module:attribute", short help)
+COMMANDS = {
+    "cache": (
+        "spotifysaver.cli.commands.cache.cache:cache",
+        "Inspect or invalidate the persistent caches.",
+    ),
+    "download": (
+        "spotifysaver.cli.commands.download.download:download",
+        "Download music from Spotify URLs via YouTube Music.",
+    ),
+    "init": (
+        "spotifysaver.cli.commands.init:init",
+        "Initialize SpotifySaver configuration.",
+    ),
+    "inspect": (
+        "spotifysaver.cli.commands.inspect.inspect:inspect",
+        "Display detailed metadata of Spotify content.",
+    ),
+    "show-log": (
+        "spotifysaver.cli.commands.log.log:show_log",
+        "Display the last lines of the application log file.",
+    ),
+    "sync": (
+        "spotifysaver.cli.commands.sync.sync:sync",
+        "Incrementally sync a Spotify playlist to the local library.",
+    ),
+    "version": (
+        "spotifysaver.cli.commands.version:version",
+        "Display the current version of SpotifySaver.",
+    ),
+}
+
+
+@group(cls=LazyGroup, lazy_commands=COMMANDS)
 def cli():
     """SpotifySaver - Download music from Spotify via YouTube Music.
 
@@ -26,11 +52,3 @@ def cli():
     preservation, lyrics fetching, and organized file management.
     """
     pass
-
-
-# Register all available commands
-cli.add_command(download)
-cli.add_command(inspect)
-cli.add_command(version)
-cli.add_command(show_log)
-cli.add_command(init_command)
@@ -1,11 +1,33 @@
 """
 This module provides the command line interface commands for SpotifySaver.
+
+Commands are imported on first access (PEP 562) so that importing this
+package does not load the dependencies of every command.
 """
 
-from spotifysaver.cli.commands.download import download
-from spotifysaver.cli.commands.version import version
-from spotifysaver.cli.commands.inspect import inspect
-from spotifysaver.cli.commands.log import show_log
-from spotifysaver.cli.commands.init import init
+from importlib import import_module
+
+_COMMANDS = {
+    "download": "spotifysaver.cli.commands.download.download",
+    "version": "spotifysaver.cli.commands.version",
+    "inspect": "spotifysaver.cli.commands.inspect.inspect",
+    "show_log": "spotifysaver.cli.commands.log.log",
+    "init": "spotifysaver.cli.commands.init",
+    "cache": "spotifysaver.cli.commands.cache.cache",
+    "sync": "spotifysaver.cli.commands.sync.sync",
+}
+
+__all__ = ["download", "version", "inspect", "show_log", "init", "cache", "sync"]
+
+
+def __getattr__(name):
+    if name not in _COMMANDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    command = getattr(import_module(_COMMANDS[name]), name)
+    # Importing a submodule binds it on this package; bind the command instead
+    globals()[name] = command
+    return command
+
 
-__all__ = ["download", "version", "inspect", "show_log", "init"]
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,5 @@
+"""SpotifySaver CLI Cache Command"""
+
+from spotifysaver.cli.commands.cache.cache import cache
+
+__all__ = ["cache"]
@@ -0,0 +1,63 @@
+"""Cache Management Command Module.
+
+This module provides CLI commands to inspect and invalidate the persistent
+caches used by SpotifySaver, such as the Spotify to YouTube Music match cache.
+"""
+
+from typing import Optional
+
+import click
+
+from spotifysaver.config import Config
+from spotifysaver.services.match_cache import MatchCache
+
+
+@click.group("cache")
+def cache():
+    """Inspect or invalidate the persistent caches."""
+    pass
+
+
+@cache.command("stats")
+def stats():
+    """Show the location and size of the match, metadata and image caches."""
+    info = MatchCache().stats()
+    click.echo(f"📁 Match cache: {info['path']}")
+    click.echo(f"🎵 Entries: {info['entries']} ({info['expired']} expired)")
+
+    if Config.SPOTIFY_CACHE_PERSIST:
+        from spotifysaver.services.spotify_api import get_spotify_cache
+
+        metadata = get_spotify_cache().stats()
+        click.echo(f"📁 Spotify metadata cache: {Config.SPOTIFY_CACHE_PATH}")
+        click.echo(f"💿 Entries: {metadata['disk_entries']}")
+
+    if Config.IMAGE_CACHE_PERSIST:
+        from spotifysaver.downloader.image_cache import get_image_cache
+
+        images = get_image_cache().stats()
+        click.echo(f"📁 Image cache: {Config.IMAGE_CACHE_PATH}")
+        click.echo(f"🖼  Images: {images['disk_entries']}")
+
+
+@cache.command("clear")
+@click.option("--uri", help="Only invalidate the match of this Spotify track URI")
+@click.option(
+    "--older-than", type=float, help="Only invalidate matches resolved more than N days ago"
+)
+@click.option("--expired", is_flag=True, help="Only remove matches past their TTL")
+def clear(uri: Optional[str], older_than: Optional[float], expired: bool):
+    """Invalidate cached YouTube Music matches.
+
+    Without options every cached match is removed, so the next download
+    searches YouTube Music again for all tracks.
+
+    Args:
+        uri: Spotify track URI whose match should be removed
+        older_than: Remove matches resolved more than this many days ago
+        expired: Remove only matches past the configured TTL
+    """
+    removed = MatchCache().invalidate(
+        spotify_uri=uri, older_than_days=older_than, expired_only=expired
+    )
+    click.secho(f"✔ Removed {removed} cached matches", fg="green")
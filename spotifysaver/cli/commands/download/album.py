@@ -4,9 +4,14 @@ This module handles the download process for complete Spotify albums,
 including progress tracking, metadata generation, and cover art download.
 """
 
+from typing import Optional
+
 import click
 from spotifysaver.downloader import YouTubeDownloader, YouTubeDownloaderForCLI
 from spotifysaver.services import SpotifyAPI, YoutubeMusicSearcher, ScoreMatchCalculator
+from spotifysaver.models import Album
+from spotifysaver.cli.commands.download.pipeline_stats import show_pipeline_stats
+from spotifysaver.cli.commands.download.byte_progress import show_byte_progress
 
 
 def process_album(
@@ -20,7 +25,11 @@ def process_album(
         output_format, 
         bitrate, 
         explain=False,
-        dry_run=False
+        dry_run=False,
+        workers=1,
+        pipeline=False,
+        resume=False,
+        album: Optional[Album] = None
         ):
     """Process and download a complete Spotify album with progress tracking.
     
@@ -38,8 +47,12 @@ def process_album(
         format: Audio format for downloaded files
         bitrate: Audio bitrate in kbps (96, 128, 192, 256)
         explain: Whether to show score breakdown for each track without downloading
+        workers: Number of tracks downloaded in parallel
+        pipeline: Whether to use the staged download pipeline
+        resume: Whether to continue an interrupted download from its checkpoint journal
+        album: Album already fetched by a batch request; ``url`` is not fetched again
     """
-    album = spotify.get_album(url)
+    album = album or spotify.get_album(url)
     click.secho(f"\nDownloading album: {album.name}", fg="cyan")
 
     # Explain mode: show score breakdown without downloading
@@ -105,15 +118,22 @@ def process_album(
             )
             bar.update(1)
 
-        success, total = downloader.download_album_cli(
-            album,
-            download_lyrics=lyrics,
-            output_format=YouTubeDownloader.string_to_audio_format(output_format),
-            bitrate=YouTubeDownloader.int_to_bitrate(bitrate),
-            nfo=nfo,
-            cover=cover,
-            progress_callback=update_progress,
-        )
+        with show_byte_progress(downloader, bar):
+            success, total = downloader.download_album_cli(
+                album,
+                download_lyrics=lyrics,
+                output_format=YouTubeDownloader.string_to_audio_format(output_format),
+                bitrate=YouTubeDownloader.int_to_bitrate(bitrate),
+                nfo=nfo,
+                cover=cover,
+                progress_callback=update_progress,
+                workers=workers,
+                pipeline=pipeline,
+                resume=resume,
+            )
+
+    if pipeline and downloader.pipeline:
+        show_pipeline_stats(downloader.pipeline)
 
     # Display summary
     if success > 0:
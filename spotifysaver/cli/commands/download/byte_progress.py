@@ -0,0 +1,63 @@
+"""Byte-level progress display module for SpotifySaver CLI.
+
+This module shows the bytes, speed, ETA and processing phase of the track
+being downloaded in the label of the click progress bar.
+"""
+
+from contextlib import contextmanager
+
+from spotifysaver.downloader import TrackProgress, YouTubeDownloader
+
+
+def _format_size(num_bytes: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f}{unit}" if unit != "B" else f"{int(num_bytes)}B"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f}GiB"
+
+
+def format_track_progress(progress: TrackProgress) -> str:
+    """Build the progress bar label for a track progress update.
+
+    Args:
+        progress: Latest progress of the track
+
+    Returns:
+        str: Label like "  Downloading: Song 45% 1.2MiB/s ETA 12s"
+    """
+    name = progress.track_name
+    name = f"{name[:20]}..." if len(name) > 20 else name
+    if progress.phase != "downloading":
+        return f"  {progress.phase.capitalize()}: {name}"
+
+    label = f"  Downloading: {name}"
+    if progress.fraction is not None:
+        label += f" {progress.fraction:.0%}"
+    else:
+        label += f" {_format_size(progress.downloaded_bytes)}"
+    if progress.speed:
+        label += f" {_format_size(progress.speed)}/s"
+    if progress.eta:
+        label += f" ETA {int(progress.eta)}s"
+    return label
+
+
+@contextmanager
+def show_byte_progress(downloader: YouTubeDownloader, bar):
+    """Show the byte-level progress of the downloader in a click progress bar.
+
+    Args:
+        downloader: Downloader whose ``on_progress`` is set while the context is active
+        bar: Progress bar returned by ``click.progressbar``
+    """
+
+    def on_progress(progress: TrackProgress):
+        bar.label = format_track_progress(progress)
+        bar.render_progress()
+
+    downloader.on_progress = on_progress
+    try:
+        yield
+    finally:
+        downloader.on_progress = None
@@ -6,6 +6,7 @@ YouTube Music and applying Spotify metadata.
 """
 
 from pathlib import Path
+from typing import List, Optional, TextIO, Tuple
 
 import click
 
@@ -15,29 +16,58 @@ from spotifysaver.downloader import YouTubeDownloaderForCLI
 from spotifysaver.spotlog import LoggerConfig
 from spotifysaver.cli.commands.download.album import process_album
 from spotifysaver.cli.commands.download.playlist import process_playlist
-from spotifysaver.cli.commands.download.track import process_track
+from spotifysaver.cli.commands.download.track import process_track, process_tracks
+
+
+def read_url_list(source: TextIO) -> List[str]:
+    """Read Spotify URLs from a file, one per line.
+
+    Blank lines and lines starting with ``#`` are ignored.
+
+    Args:
+        source: Open text file (or stdin)
+
+    Returns:
+        list: URLs in file order
+    """
+    urls = []
+    for line in source:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.append(line)
+    return urls
 
 
 @click.command("download")
-@click.argument("spotify_url")
+@click.argument("spotify_urls", nargs=-1)
+@click.option("--from-file", type=click.File("r"), help="Read Spotify URLs from a file, one per line ('-' for stdin)")
 @click.option("--lyrics", is_flag=True, help="Download synced lyrics (.lrc)")
 @click.option("--nfo", is_flag=True, help="Generate Jellyfin NFO file for albums")
 @click.option("--cover", is_flag=True, help="Download album cover art")
 @click.option("--output", type=Path, default=Config.OUTPUT_DIR, help="Output directory")#"Music", help="Output directory")
 @click.option("--format", type=click.Choice(["m4a", "mp3", "opus"]), default="m4a")
 @click.option("--bitrate", type=int, default=128, help="Audio bitrate in kbps")
+@click.option("--workers", type=click.IntRange(min=1), default=1, help="Number of tracks to download in parallel")
+@click.option("--pipeline", is_flag=True, help="Run search, download, transcode and tagging as concurrent stages")
+@click.option("--force", is_flag=True, help="Re-download tracks that already exist in the output directory")
+@click.option("--resume", is_flag=True, help="Continue an interrupted album or playlist download from its checkpoint journal")
 @click.option("--verbose", is_flag=True, help="Show debug output")
 @click.option("--explain", is_flag=True, help="Show score breakdown for each track without downloading (for error analysis)")
 @click.option("--dry-run", is_flag=True, help="Simulate download without saving files")
 
 def download(
-    spotify_url: str,
+    spotify_urls: Tuple[str, ...],
+    from_file: Optional[TextIO],
     lyrics: bool,
     nfo: bool,
     cover: bool,
     output: Path,
     format: str,
     bitrate: int,
+    workers: int,
+    pipeline: bool,
+    force: bool,
+    resume: bool,
     verbose: bool,
     explain: bool,
     dry_run: bool,
@@ -48,35 +78,71 @@ def download(
     Spotify tracks, albums, or playlists, then applies the original Spotify
     metadata to create properly organized music files.
     
+    Several URLs can be given at once, as arguments or with ``--from-file``.
+    Their metadata is then fetched with the batch endpoints of the Spotify
+    API: tracks are downloaded together as one job and each album and
+    playlist as its own job.
+    
     Args:
-        spotify_url: Spotify URL for track, album, or playlist
+        spotify_urls: Spotify URLs for tracks, albums, or playlists
+        from_file: File with more Spotify URLs, one per line
         lyrics: Whether to download synchronized lyrics files
         nfo: Whether to generate Jellyfin-compatible metadata files
         cover: Whether to download album/playlist cover art
         output: Base directory for downloaded files
         format: Audio format for downloaded files
         bitrate: Audio bitrate in kbps (96, 128, 192, 256)
+        workers: Number of tracks of an album or playlist downloaded in parallel
+        pipeline: Whether to use the staged download pipeline for albums and playlists
+        force: Whether to re-download tracks already present in the library
+        resume: Whether to skip the work done by an interrupted run of the same album or playlist
         verbose: Whether to show detailed debug information
         explain: Whether to show score breakdown for each track without downloading
     """
     LoggerConfig.setup(level="DEBUG" if verbose else "INFO")
 
+    urls = list(spotify_urls)
+    if from_file:
+        urls.extend(read_url_list(from_file))
+    if not urls:
+        raise click.UsageError("Provide at least one Spotify URL or --from-file")
+
     try:
         spotify = SpotifyAPI()
         searcher = YoutubeMusicSearcher()
-        downloader = YouTubeDownloaderForCLI(base_dir=output)
+        downloader = YouTubeDownloaderForCLI(base_dir=output, force=force)
+
+        if len(urls) > 1:
+            failed = process_url_list(
+                spotify, searcher, downloader, urls, lyrics, nfo, cover, format, bitrate, explain, dry_run,
+                workers=workers,
+                pipeline=pipeline,
+                resume=resume,
+            )
+            if failed:
+                raise click.ClickException(f"{failed} of {len(urls)} URLs failed")
+            return
 
+        spotify_url = urls[0]
         if "album" in spotify_url:
             process_album(
-                spotify, searcher, downloader, spotify_url, lyrics, nfo, cover, format, bitrate, explain, dry_run
+                spotify, searcher, downloader, spotify_url, lyrics, nfo, cover, format, bitrate, explain, dry_run,
+                workers=workers,
+                pipeline=pipeline,
+                resume=resume,
             )
         elif "playlist" in spotify_url:
             process_playlist(
-                spotify, searcher, downloader, spotify_url, lyrics, nfo, cover, format, bitrate, dry_run
+                spotify, searcher, downloader, spotify_url, lyrics, nfo, cover, format, bitrate, dry_run,
+                workers=workers,
+                pipeline=pipeline,
+                resume=resume,
             )
         else:
             process_track(spotify, searcher, downloader, spotify_url, lyrics, format, bitrate, explain, dry_run)
 
+    except click.ClickException:
+        raise
     except Exception as e:
         click.secho(f"Error: {str(e)}", fg="red", err=True)
         if verbose:
@@ -84,3 +150,98 @@ def download(
 
             traceback.print_exc()
         raise click.Abort()
+
+
+def process_url_list(
+        spotify: SpotifyAPI,
+        searcher: YoutubeMusicSearcher,
+        downloader: YouTubeDownloaderForCLI,
+        urls: List[str],
+        lyrics,
+        nfo,
+        cover,
+        output_format,
+        bitrate,
+        explain=False,
+        dry_run=False,
+        workers=1,
+        pipeline=False,
+        resume=False
+        ) -> int:
+    """Download several Spotify URLs, resolving their metadata in batches.
+
+    Track URLs are fetched 50 per request and downloaded as one job; album
+    URLs are fetched 20 per request and downloaded one after the other.
+    Playlists have no batch endpoint and are fetched one by one. A failing
+    URL is reported and the next ones still run.
+
+    Args:
+        spotify: SpotifyAPI instance for fetching metadata
+        searcher: YoutubeMusicSearcher for finding YouTube matches
+        downloader: YouTubeDownloader for downloading and processing files
+        urls: Spotify URLs of tracks, albums and playlists
+        lyrics: Whether to download synchronized lyrics
+        nfo: Whether to generate Jellyfin metadata files
+        cover: Whether to download cover art
+        output_format: Audio format for downloaded files
+        bitrate: Audio bitrate in kbps
+        explain: Whether to show score breakdowns without downloading
+        dry_run: Whether to show the selected candidates without downloading
+        workers: Number of tracks downloaded in parallel
+        pipeline: Whether to use the staged download pipeline
+        resume: Whether to continue interrupted downloads from their checkpoint journals
+
+    Returns:
+        int: Number of URLs (or groups of track URLs) that failed
+    """
+    track_urls = [url for url in urls if "track" in url]
+    album_urls = [url for url in urls if "album" in url]
+    playlist_urls = [url for url in urls if "playlist" in url]
+    failed = 0
+
+    for url in [url for url in urls if url not in {*track_urls, *album_urls, *playlist_urls}]:
+        click.secho(f"Skipping unsupported URL: {url}", fg="yellow", err=True)
+        failed += 1
+
+    options = dict(workers=workers, pipeline=pipeline, resume=resume)
+    try:
+        if track_urls:
+            process_tracks(
+                spotify, searcher, downloader, track_urls, lyrics, output_format, bitrate, explain, dry_run,
+                **options,
+            )
+    except Exception as e:
+        click.secho(f"Error downloading tracks: {str(e)}", fg="red", err=True)
+        failed += 1
+
+    try:
+        albums = spotify.get_albums(album_urls) if album_urls else []
+    except Exception as e:
+        click.secho(f"Error fetching albums: {str(e)}", fg="red", err=True)
+        albums, failed = [], failed + len(album_urls)
+    for album in albums:
+        if downloader.cancelled:
+            break
+        try:
+            process_album(
+                spotify, searcher, downloader, None, lyrics, nfo, cover, output_format, bitrate, explain, dry_run,
+                album=album,
+                **options,
+            )
+        except Exception as e:
+            click.secho(f"Error downloading album {album.name}: {str(e)}", fg="red", err=True)
+            failed += 1
+
+    for url in playlist_urls:
+        if downloader.cancelled:
+            break
+        try:
+            process_playlist(
+                spotify, searcher, downloader, url, lyrics, nfo, cover, output_format, bitrate, dry_run,
+                **options,
+            )
+        except Exception as e:
+            click.secho(f"Error downloading playlist {url}: {str(e)}", fg="red", err=True)
+            failed += 1
+
+    return failed
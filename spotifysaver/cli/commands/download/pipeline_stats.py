@@ -0,0 +1,24 @@
+"""Pipeline statistics display module for SpotifySaver CLI.
+
+This module prints the per-stage counters of the staged download pipeline,
+which helps tuning the ``PIPELINE_*_WORKERS`` settings.
+"""
+
+import click
+
+from spotifysaver.downloader.pipeline import DownloadPipeline
+
+
+def show_pipeline_stats(pipeline: DownloadPipeline):
+    """Display queue depth, throughput and utilization of each pipeline stage.
+
+    Args:
+        pipeline: Pipeline used for the last download
+    """
+    click.secho("\nPipeline stages:", fg="cyan")
+    for name, stats in pipeline.stats().items():
+        click.echo(
+            f"  {name:<10} workers={stats.workers:<3} ok={stats.processed:<4} "
+            f"failed={stats.failed:<4} {stats.throughput:.2f} items/s "
+            f"utilization={stats.utilization:.0%}"
+        )
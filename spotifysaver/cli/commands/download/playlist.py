@@ -7,6 +7,8 @@ including progress tracking and optional metadata generation.
 import click
 from spotifysaver.downloader import YouTubeDownloader, YouTubeDownloaderForCLI
 from spotifysaver.services import SpotifyAPI, YoutubeMusicSearcher, ScoreMatchCalculator
+from spotifysaver.cli.commands.download.pipeline_stats import show_pipeline_stats
+from spotifysaver.cli.commands.download.byte_progress import show_byte_progress
 
 
 def process_playlist(
@@ -19,7 +21,10 @@ def process_playlist(
         cover, 
         output_format, 
         bitrate,
-        dry_run=False
+        dry_run=False,
+        workers=1,
+        pipeline=False,
+        resume=False
         ):
     """Process and download a complete Spotify playlist with progress tracking.
     
@@ -36,8 +41,13 @@ def process_playlist(
         nfo: Whether to generate metadata files (in development)
         cover: Whether to download playlist cover art
         output_format: Audio format for downloaded files
+        workers: Number of tracks downloaded in parallel
+        pipeline: Whether to use the staged download pipeline
+        resume: Whether to continue an interrupted download from its checkpoint journal
     """
-    playlist = spotify.get_playlist(url)
+    # Tracks are streamed: downloads start while later pages are still fetched
+    playlist = spotify.get_playlist_info(url)
+    tracks = spotify.iter_playlist_tracks(url, playlist)
     click.secho(f"\nDownloading playlist: {playlist.name}", fg="magenta")
 
     # Dry run mode: explain matches without downloading
@@ -45,7 +55,7 @@ def process_playlist(
         scorer = ScoreMatchCalculator()
         click.secho(f"\n🧪 Dry run for playlist: {playlist.name}", fg="magenta")
 
-        for track in playlist.tracks:
+        for track in tracks:
             result = searcher.search_track(track)
             explanation = scorer.explain_score(result, track, strict=True)
             click.secho(f"\n🎵 Track: {track.name}", fg="yellow")
@@ -56,7 +66,7 @@ def process_playlist(
 
     # Configure progress bar
     with click.progressbar(
-        length=len(playlist.tracks),
+        length=playlist.total_tracks,
         label="  Processing",
         fill_char="█",
         show_percent=True,
@@ -72,14 +82,22 @@ def process_playlist(
             bar.update(1)
 
         # Delegate everything to the downloader
-        success, total = downloader.download_playlist_cli(
-            playlist,
-            download_lyrics=lyrics,
-            output_format=YouTubeDownloader.string_to_audio_format(output_format),
-            bitrate=YouTubeDownloader.int_to_bitrate(bitrate),
-            cover=cover,
-            progress_callback=update_progress,
-        )
+        with show_byte_progress(downloader, bar):
+            success, total = downloader.download_playlist_cli(
+                playlist,
+                download_lyrics=lyrics,
+                output_format=YouTubeDownloader.string_to_audio_format(output_format),
+                bitrate=YouTubeDownloader.int_to_bitrate(bitrate),
+                cover=cover,
+                progress_callback=update_progress,
+                workers=workers,
+                pipeline=pipeline,
+                resume=resume,
+                tracks=tracks,
+            )
+
+    if pipeline and downloader.pipeline:
+        show_pipeline_stats(downloader.pipeline)
 
     # Display results
     if success > 0:
@@ -4,9 +4,49 @@ This module handles the download process for individual Spotify tracks,
 including YouTube Music search and metadata application.
 """
 
+from typing import List
+
 import click
 from spotifysaver.downloader import YouTubeDownloaderForCLI, YouTubeDownloader
 from spotifysaver.services import SpotifyAPI, YoutubeMusicSearcher, ScoreMatchCalculator
+from spotifysaver.models import Track
+from spotifysaver.cli.commands.download.byte_progress import show_byte_progress
+from spotifysaver.cli.commands.download.pipeline_stats import show_pipeline_stats
+
+
+def _explain_track(searcher: YoutubeMusicSearcher, scorer: ScoreMatchCalculator, track: Track):
+    """Print the score breakdown of every YouTube Music candidate of a track."""
+    click.secho(f"\n🎵 Track: {track.name}", fg="yellow")
+    results = searcher.search_raw(track)
+
+    if not results:
+        click.echo("  ⚠ No candidates found.")
+        return
+
+    for result in results:
+        explanation = scorer.explain_score(result, track, strict=True)
+        click.echo(f"  - Candidate: {explanation['yt_title']}")
+        click.echo(f"    Video ID: {explanation['yt_videoId']}")
+        click.echo(f"    Duration: {explanation['duration_score']}")
+        click.echo(f"    Artist:   {explanation['artist_score']}")
+        click.echo(f"    Title:    {explanation['title_score']}")
+        click.echo(f"    Album:    {explanation['album_bonus']}")
+        click.echo(f"    → Total:  {explanation['total_score']} (passed: {explanation['passed']})")
+        click.echo("-" * 40)
+
+    best = max(results, key=lambda r: scorer.explain_score(r, track)["total_score"])
+    best_expl = scorer.explain_score(best, track)
+    click.secho(f"\n✅ Best candidate: {best_expl['yt_title']} (score: {best_expl['total_score']})", fg="green")
+
+
+def _dry_run_track(searcher: YoutubeMusicSearcher, scorer: ScoreMatchCalculator, track: Track):
+    """Print the YouTube Music candidate that would be downloaded for a track."""
+    result = searcher.search_track(track)
+    explanation = scorer.explain_score(result, track, strict=True)
+    click.echo(f"  → Selected candidate: {explanation['yt_title']}")
+    click.echo(f"    Video ID: {explanation['yt_videoId']}")
+    click.echo(f"    Total score: {explanation['total_score']} (passed: {explanation['passed']})")
+
 
 def process_track(
         spotify: SpotifyAPI, 
@@ -41,38 +81,14 @@ def process_track(
         scorer = ScoreMatchCalculator()
         click.secho(f"\n🔍 Explaining matches for track: {track.name}", fg="cyan")
         
-        click.secho(f"\n🎵 Track: {track.name}", fg="yellow")
-        results = searcher.search_raw(track)
-        
-        if not results:
-            click.echo("  ⚠ No candidates found.")
-            return
-        
-        for result in results:
-            explanation = scorer.explain_score(result, track, strict=True)
-            click.echo(f"  - Candidate: {explanation['yt_title']}")
-            click.echo(f"    Video ID: {explanation['yt_videoId']}")
-            click.echo(f"    Duration: {explanation['duration_score']}")
-            click.echo(f"    Artist:   {explanation['artist_score']}")
-            click.echo(f"    Title:    {explanation['title_score']}")
-            click.echo(f"    Album:    {explanation['album_bonus']}")
-            click.echo(f"    → Total:  {explanation['total_score']} (passed: {explanation['passed']})")
-            click.echo("-" * 40)
-
-        best = max(results, key=lambda r: scorer.explain_score(r, track)["total_score"])
-        best_expl = scorer.explain_score(best, track)
-        click.secho(f"\n✅ Best candidate: {best_expl['yt_title']} (score: {best_expl['total_score']})", fg="green")
+        _explain_track(searcher, scorer, track)
         return
 
     # Dry run mode: explain matches without downloading
     if dry_run:
         scorer = ScoreMatchCalculator()
         click.secho(f"\n🧪 Dry run for track: {track.name}", fg="cyan")
-        result = searcher.search_track(track)
-        explanation = scorer.explain_score(result, track, strict=True)
-        click.echo(f"  → Selected candidate: {explanation['yt_title']}")
-        click.echo(f"    Video ID: {explanation['yt_videoId']}")
-        click.echo(f"    Total score: {explanation['total_score']} (passed: {explanation['passed']})")
+        _dry_run_track(searcher, scorer, track)
         return
 
     with click.progressbar(
@@ -91,13 +107,14 @@ def process_track(
             )
             bar.update(1)
 
-        audio_path, updated_track = downloader.download_track_cli(
-            track,
-            output_format=YouTubeDownloader.string_to_audio_format(output_format),
-            bitrate=YouTubeDownloader.int_to_bitrate(bitrate),
-            download_lyrics=lyrics,
-            progress_callback=update_progress,
-        )
+        with show_byte_progress(downloader, bar):
+            audio_path, updated_track = downloader.download_track_cli(
+                track,
+                output_format=YouTubeDownloader.string_to_audio_format(output_format),
+                bitrate=YouTubeDownloader.int_to_bitrate(bitrate),
+                download_lyrics=lyrics,
+                progress_callback=update_progress,
+            )
 
 
     if audio_path:
@@ -107,3 +124,87 @@ def process_track(
         click.secho(msg, fg="green")
     else:
         click.secho(f"Failed to download: {track.name}", fg="yellow")
+
+
+def process_tracks(
+        spotify: SpotifyAPI,
+        searcher: YoutubeMusicSearcher,
+        downloader: YouTubeDownloaderForCLI,
+        urls: List[str],
+        lyrics,
+        output_format,
+        bitrate,
+        explain=False,
+        dry_run=False,
+        workers=1,
+        pipeline=False,
+        resume=False
+        ):
+    """Process and download several Spotify tracks as one job.
+
+    The metadata of every track is fetched with the batch endpoint of the
+    Spotify API (50 tracks per request) before downloading them with a
+    single progress bar.
+
+    Args:
+        spotify: SpotifyAPI instance for fetching track data
+        searcher: YoutubeMusicSearcher for finding YouTube matches
+        downloader: YouTubeDownloader for downloading and processing files
+        urls: Spotify track URLs
+        lyrics: Whether to download synchronized lyrics
+        output_format: Audio format for downloaded files
+        bitrate: Audio bitrate in kbps (96, 128, 192, 256)
+        explain: Whether to show score breakdown without downloading
+        dry_run: Whether to show the selected candidates without downloading
+        workers: Number of tracks downloaded in parallel
+        pipeline: Whether to use the staged download pipeline
+        resume: Whether to continue an interrupted download from its checkpoint journal
+    """
+    tracks = spotify.get_tracks(urls)
+    click.secho(f"\nDownloading {len(tracks)} tracks", fg="cyan")
+
+    if explain or dry_run:
+        scorer = ScoreMatchCalculator()
+        for track in tracks:
+            if explain:
+                _explain_track(searcher, scorer, track)
+            else:
+                click.secho(f"\n🎵 Track: {track.name}", fg="yellow")
+                _dry_run_track(searcher, scorer, track)
+        return
+
+    with click.progressbar(
+        length=len(tracks),
+        label="  Processing",
+        fill_char="█",
+        show_percent=True,
+        item_show_func=lambda t: t.name[:25] + "..." if t else "",
+    ) as bar:
+
+        def update_progress(idx, total, name):
+            bar.label = (
+                f"  Downloading: {name[:20]}..."
+                if len(name) > 20
+                else f"  Downloading: {name}"
+            )
+            bar.update(1)
+
+        with show_byte_progress(downloader, bar):
+            success, total = downloader.download_tracks_cli(
+                tracks,
+                output_format=YouTubeDownloader.string_to_audio_format(output_format),
+                bitrate=YouTubeDownloader.int_to_bitrate(bitrate),
+                download_lyrics=lyrics,
+                progress_callback=update_progress,
+                workers=workers,
+                pipeline=pipeline,
+                resume=resume,
+            )
+
+    if pipeline and downloader.pipeline:
+        show_pipeline_stats(downloader.pipeline)
+
+    if success > 0:
+        click.secho(f"\n✔ Downloaded {success}/{total} tracks", fg="green")
+    else:
+        click.secho("\n⚠ No tracks downloaded", fg="yellow")
@@ -0,0 +1,5 @@
+"""SpotifySaver CLI Sync Command"""
+
+from spotifysaver.cli.commands.sync.sync import sync
+
+__all__ = ["sync"]
@@ -0,0 +1,122 @@
+"""Playlist sync command module for SpotifySaver CLI.
+
+This module provides the sync command, which keeps a local copy of a Spotify
+playlist up to date by downloading only the tracks added since the last run.
+"""
+
+from pathlib import Path
+
+import click
+
+from spotifysaver.config import Config
+from spotifysaver.services import SpotifyAPI
+from spotifysaver.downloader import YouTubeDownloader, YouTubeDownloaderForCLI, PlaylistSync
+from spotifysaver.spotlog import LoggerConfig
+from spotifysaver.cli.commands.download.pipeline_stats import show_pipeline_stats
+from spotifysaver.cli.commands.download.byte_progress import format_track_progress
+
+
+@click.command("sync")
+@click.argument("playlist_url")
+@click.option("--lyrics", is_flag=True, help="Download synced lyrics (.lrc)")
+@click.option("--cover", is_flag=True, help="Download playlist cover art")
+@click.option("--output", type=Path, default=Config.OUTPUT_DIR, help="Output directory")
+@click.option("--format", type=click.Choice(["m4a", "mp3", "opus"]), default="m4a")
+@click.option("--bitrate", type=int, default=128, help="Audio bitrate in kbps")
+@click.option("--workers", type=click.IntRange(min=1), default=1, help="Number of tracks to download in parallel")
+@click.option("--pipeline", is_flag=True, help="Run search, download, transcode and tagging as concurrent stages")
+@click.option("--prune", is_flag=True, help="Delete local files of tracks removed from the playlist")
+@click.option("--verbose", is_flag=True, help="Show debug output")
+def sync(
+    playlist_url: str,
+    lyrics: bool,
+    cover: bool,
+    output: Path,
+    format: str,
+    bitrate: int,
+    workers: int,
+    pipeline: bool,
+    prune: bool,
+    verbose: bool,
+):
+    """Incrementally sync a Spotify playlist to the local library.
+
+    Skips the playlist entirely when its snapshot has not changed since the
+    last sync; otherwise only downloads tracks that are not on disk yet.
+
+    Args:
+        playlist_url: Spotify URL or URI of the playlist
+        lyrics: Whether to download synchronized lyrics files
+        cover: Whether to download playlist cover art
+        output: Base directory for downloaded files
+        format: Audio format for downloaded files
+        bitrate: Audio bitrate in kbps (96, 128, 192, 256)
+        workers: Number of tracks downloaded in parallel
+        pipeline: Whether to use the staged download pipeline
+        prune: Whether to delete files of tracks removed from the playlist
+        verbose: Whether to show detailed debug information
+    """
+    LoggerConfig.setup(level="DEBUG" if verbose else "INFO")
+
+    try:
+        downloader = YouTubeDownloaderForCLI(base_dir=output)
+        syncer = PlaylistSync(SpotifyAPI(), downloader)
+        bar = None
+
+        def on_start(playlist, pending):
+            nonlocal bar
+            click.secho(f"\nSyncing playlist: {playlist.name}", fg="magenta")
+            if pending:
+                bar = click.progressbar(length=pending, label="  Processing", fill_char="█", show_percent=True)
+                bar.__enter__()
+                downloader.on_progress = show_track_progress
+
+        def show_track_progress(progress):
+            bar.label = format_track_progress(progress)
+            bar.render_progress()
+
+        def update_progress(idx, total, name):
+            bar.label = f"  Downloading: {name[:20]}..." if len(name) > 20 else f"  Downloading: {name}"
+            bar.update(1)
+
+        try:
+            result = syncer.sync(
+                playlist_url,
+                output_format=YouTubeDownloader.string_to_audio_format(format),
+                bitrate=YouTubeDownloader.int_to_bitrate(bitrate),
+                download_lyrics=lyrics,
+                cover=cover,
+                prune=prune,
+                workers=workers,
+                pipeline=pipeline,
+                progress_callback=update_progress,
+                on_start=on_start,
+            )
+        finally:
+            downloader.on_progress = None
+            if bar:
+                bar.__exit__(None, None, None)
+
+        if result.unchanged:
+            click.secho(f"\n✔ Playlist unchanged ({result.total} tracks up to date)", fg="green")
+            return
+
+        if pipeline and downloader.pipeline:
+            show_pipeline_stats(downloader.pipeline)
+
+        click.secho(
+            f"\n✔ {result.total - result.added} up to date, "
+            f"{result.downloaded}/{result.added} new tracks downloaded",
+            fg="green" if result.failed == 0 else "yellow",
+        )
+        if result.removed:
+            action = f"{result.pruned} files deleted" if prune else "use --prune to delete them"
+            click.secho(f"  {result.removed} tracks removed from the playlist ({action})", fg="cyan")
+
+    except Exception as e:
+        click.secho(f"Error: {str(e)}", fg="red", err=True)
+        if verbose:
+            import traceback
+
+            traceback.print_exc()
+        raise click.Abort()
@@ -0,0 +1,58 @@
+"""Lazy-loading command group for the SpotifySaver CLI.
+
+Importing a command module pulls in its whole dependency tree (yt-dlp,
+ytmusicapi, spotipy, mutagen, pydantic...). This group only imports the
+module of the command that is actually invoked, so ``--help``, ``version``
+and ``show-log`` start without loading the download stack.
+"""
+
+from importlib import import_module
+from typing import Dict, Optional, Tuple
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Click group whose subcommands are imported on first use.
+
+    Attributes:
+        lazy_commands: Command name -> (``"module:attribute"``, short help).
+            The short help is shown by ``--help`` so listing the commands
+            does not import them.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, Tuple[str, str]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context):
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path, _ = self.lazy_commands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        command = getattr(import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy command {import_path} is not a click command")
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                short_help = command.get_short_help_str(formatter.width)
+            else:
+                short_help = self.lazy_commands[name][1]
+            rows.append((name, short_help))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
@@ -39,6 +39,17 @@ class Config:
         SPOTIFY_REDIRECT_URI: OAuth redirect URI for Spotify authentication
         LOG_LEVEL: Application logging level (default: 'info')
         YTDLP_COOKIES_PATH: Path to YouTube Music cookies file for age-restricted content
+        YTDLP_NATIVE_FORMAT: Prefer streams already in the target codec (remux, no re-encode)
+        FFMPEG_TAGGING: Write tags and cover art during the FFmpeg conversion
+        MATCH_CACHE_*: Location and lifetime of the persistent YouTube match cache
+        AUDIODB_CACHE_*: Lifetime and persistence of memoized TheAudioDB lookups
+        SPOTIFY_CACHE_*: Lifetime, size limits and persistence of the Spotify metadata cache
+        IMAGE_CACHE_*: Size limit and persistence of the cover art cache
+        SPOTIFY_PAGE_CONCURRENCY: Playlist pages fetched concurrently from the Spotify API
+        PIPELINE_*_WORKERS: Concurrency limits of the staged download pipeline
+        TRANSCODE_*: Process limit, CPU affinity and niceness of the FFmpeg processes
+        PROGRESS_UPDATE_INTERVAL: Minimum seconds between byte-level progress updates
+        HTTP_*: Pool size, retries and timeouts of the shared HTTP client
     """
 
     SPOTIFY_CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
@@ -53,11 +64,76 @@ class Config:
     # YouTube cookies file for bypassing age restrictions
     YTDLP_COOKIES_PATH = os.getenv("YTDLP_COOKIES_PATH", None)
 
+    # Prefer YouTube streams already in the target codec so they are remuxed
+    # instead of re-encoded
+    YTDLP_NATIVE_FORMAT = os.getenv("YTDLP_NATIVE_FORMAT", "true").lower() == "true"
+
+    # Write tags and cover art with FFmpeg during the conversion instead of
+    # rewriting the converted file with mutagen
+    FFMPEG_TAGGING = os.getenv("FFMPEG_TAGGING", "true").lower() == "true"
+
     # Default output directory
     OUTPUT_DIR = os.getenv("SPOTIFYSAVER_OUTPUT_DIR", "Music")
 
+    # User configuration and cache directory (created by the init command)
+    CONFIG_DIR = Path.home() / ".spotify-saver"
+
+    # Persistent Spotify URI -> YouTube Music match cache
+    MATCH_CACHE_ENABLED = os.getenv("MATCH_CACHE_ENABLED", "true").lower() == "true"
+    MATCH_CACHE_PATH = Path(os.getenv("MATCH_CACHE_PATH", CONFIG_DIR / "match_cache.db"))
+    MATCH_CACHE_TTL_DAYS = float(os.getenv("MATCH_CACHE_TTL_DAYS", 90))
+
+    # TheAudioDB lookup memoization (genres and NFO data)
+    AUDIODB_CACHE_TTL_HOURS = float(os.getenv("AUDIODB_CACHE_TTL_HOURS", 24 * 7))
+    AUDIODB_CACHE_NEGATIVE_TTL_HOURS = float(os.getenv("AUDIODB_CACHE_NEGATIVE_TTL_HOURS", 24))
+    AUDIODB_CACHE_SIZE = int(os.getenv("AUDIODB_CACHE_SIZE", 2048))
+    AUDIODB_CACHE_PERSIST = os.getenv("AUDIODB_CACHE_PERSIST", "true").lower() == "true"
+    AUDIODB_CACHE_PATH = Path(os.getenv("AUDIODB_CACHE_PATH", CONFIG_DIR / "audiodb_cache.db"))
+
+    # Spotify metadata cache (tracks, albums, artists and playlists by ID)
+    SPOTIFY_CACHE_TTL_HOURS = float(os.getenv("SPOTIFY_CACHE_TTL_HOURS", 1))
+    SPOTIFY_CACHE_MAX_MB = float(os.getenv("SPOTIFY_CACHE_MAX_MB", 64))
+    SPOTIFY_CACHE_SIZE = int(os.getenv("SPOTIFY_CACHE_SIZE", 4096))
+    SPOTIFY_CACHE_PERSIST = os.getenv("SPOTIFY_CACHE_PERSIST", "false").lower() == "true"
+    SPOTIFY_CACHE_PATH = Path(os.getenv("SPOTIFY_CACHE_PATH", CONFIG_DIR / "spotify_cache.db"))
+
+    # Cover art cache, shared by the embedded covers and the cover.jpg files
+    IMAGE_CACHE_MAX_MB = float(os.getenv("IMAGE_CACHE_MAX_MB", 32))
+    IMAGE_CACHE_PERSIST = os.getenv("IMAGE_CACHE_PERSIST", "false").lower() == "true"
+    IMAGE_CACHE_PATH = Path(os.getenv("IMAGE_CACHE_PATH", CONFIG_DIR / "images"))
+
     # Downloader configuration
-    DOWNLOAD_TIMEOUT = os.getenv("DOWNLOAD_TIMEOUT", 10)
+    DOWNLOAD_TIMEOUT = float(os.getenv("DOWNLOAD_TIMEOUT", 10))
+
+    # Shared HTTP client (lyrics, TheAudioDB, cover art)
+    HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 10))
+    HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", 3))
+    HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", 0.5))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 5))
+    HTTP_ASYNC_MAX_CONNECTIONS = int(os.getenv("HTTP_ASYNC_MAX_CONNECTIONS", 100))
+
+    # Playlist pages (100 tracks each) fetched concurrently from the Spotify API
+    SPOTIFY_PAGE_CONCURRENCY = int(os.getenv("SPOTIFY_PAGE_CONCURRENCY", 4))
+
+    # Staged download pipeline: concurrency limit of each stage
+    PIPELINE_SEARCH_WORKERS = int(os.getenv("PIPELINE_SEARCH_WORKERS", 8))
+    PIPELINE_FETCH_WORKERS = int(os.getenv("PIPELINE_FETCH_WORKERS", 4))
+    PIPELINE_TRANSCODE_WORKERS = int(
+        os.getenv("PIPELINE_TRANSCODE_WORKERS", max(1, (os.cpu_count() or 2) - 1))
+    )
+    PIPELINE_TAG_WORKERS = int(os.getenv("PIPELINE_TAG_WORKERS", 2))
+    PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", 16))
+
+    # FFmpeg processes: process-wide limit, CPU cores to pin them to
+    # (e.g. "0-3,6") and niceness added to them
+    TRANSCODE_MAX_PROCESSES = int(
+        os.getenv("TRANSCODE_MAX_PROCESSES", max(1, (os.cpu_count() or 2) - 1))
+    )
+    TRANSCODE_CPU_AFFINITY = os.getenv("TRANSCODE_CPU_AFFINITY", "")
+    TRANSCODE_NICE = int(os.getenv("TRANSCODE_NICE", 10))
+
+    # Minimum seconds between two byte-level progress updates of a track
+    PROGRESS_UPDATE_INTERVAL = float(os.getenv("PROGRESS_UPDATE_INTERVAL", 0.5))
 
     @classmethod
     def validate(cls):
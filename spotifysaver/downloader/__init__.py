@@ -1,7 +1,51 @@
-"""SpotifySaver Downloader Module"""
+"""SpotifySaver Downloader Module
 
-from spotifysaver.downloader.youtube_downloader import YouTubeDownloader
-from spotifysaver.downloader.youtube_downloader_for_cli import YouTubeDownloaderForCLI
-from spotifysaver.downloader.image_downloader import ImageDownloader
+Classes are imported on first access (PEP 562) so that importing one of them
+does not load yt-dlp, mutagen and the service clients for the others.
+"""
 
-__all__ = ["YouTubeDownloader", "YouTubeDownloaderForCLI", "ImageDownloader"]
+from importlib import import_module
+
+_EXPORTS = {
+    "YouTubeDownloader": "spotifysaver.downloader.youtube_downloader",
+    "YouTubeDownloaderForCLI": "spotifysaver.downloader.youtube_downloader_for_cli",
+    "ImageDownloader": "spotifysaver.downloader.image_downloader",
+    "ImageCache": "spotifysaver.downloader.image_cache",
+    "AudioTranscoder": "spotifysaver.downloader.transcoder",
+    "TranscodeScheduler": "spotifysaver.downloader.transcode_scheduler",
+    "CancellationToken": "spotifysaver.downloader.cancellation",
+    "DownloadCancelled": "spotifysaver.downloader.cancellation",
+    "TrackProgress": "spotifysaver.downloader.progress",
+    "JobJournal": "spotifysaver.downloader.job_journal",
+    "DownloadPipeline": "spotifysaver.downloader.pipeline",
+    "PipelineStage": "spotifysaver.downloader.pipeline",
+    "PlaylistSync": "spotifysaver.downloader.playlist_sync",
+}
+
+__all__ = [
+    "YouTubeDownloader",
+    "YouTubeDownloaderForCLI",
+    "ImageDownloader",
+    "ImageCache",
+    "AudioTranscoder",
+    "TranscodeScheduler",
+    "CancellationToken",
+    "DownloadCancelled",
+    "TrackProgress",
+    "JobJournal",
+    "DownloadPipeline",
+    "PipelineStage",
+    "PlaylistSync",
+]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
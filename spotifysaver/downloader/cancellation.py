@@ -0,0 +1,98 @@
+"""Cooperative Cancellation Module"""
+
+import threading
+from typing import Callable, List, Optional
+
+from yt_dlp.utils import DownloadCancelled as YDLDownloadCancelled
+
+
+class DownloadCancelled(YDLDownloadCancelled):
+    """Raised when a download is stopped through its CancellationToken.
+
+    Subclasses yt-dlp's exception so that raising it from a progress hook
+    aborts the running download instead of being reported as an extractor
+    error.
+    """
+
+    msg = "Download cancelled"
+
+
+class CancellationToken:
+    """Thread-safe flag shared by every step of a download job.
+
+    The track loops, the pipeline stages and the yt-dlp progress hooks poll
+    the token; long blocking work (the FFmpeg subprocess) registers a
+    callback that runs as soon as the token is cancelled.
+
+    Attributes:
+        reason: Why the token was cancelled, or None while it is active
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "Download cancelled"):
+        """Request cancellation and run the registered callbacks.
+
+        Args:
+            reason: Message of the DownloadCancelled exceptions raised afterwards
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def raise_if_cancelled(self):
+        """Raise DownloadCancelled if cancellation has been requested.
+
+        Raises:
+            DownloadCancelled: If the token is cancelled
+        """
+        if self._event.is_set():
+            raise DownloadCancelled(self.reason)
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Register a callback to run when the token is cancelled.
+
+        The callback runs immediately if the token is already cancelled.
+
+        Args:
+            callback: Function without arguments
+
+        Returns:
+            callable: Function that unregisters the callback
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._unregister(callback)
+        callback()
+        return lambda: None
+
+    def _unregister(self, callback: Callable[[], None]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def progress_hook(self, status: dict):
+        """yt-dlp progress hook that aborts the download once cancelled.
+
+        Args:
+            status: Progress dictionary passed by yt-dlp
+        """
+        self.raise_if_cancelled()
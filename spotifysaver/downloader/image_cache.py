@@ -0,0 +1,297 @@
+"""Content-addressed Image Cache Module"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from spotifysaver.config import Config
+from spotifysaver.spotlog import get_logger
+
+
+class ImageCache:
+    """Cache of downloaded images, shared by cover embedding and cover files.
+
+    Images are stored once per content (SHA-256 of the bytes) and looked up
+    by URL, so the 15 tracks of an album and its ``cover.jpg`` all reuse the
+    same download. The memory tier is an LRU bounded by the total size of
+    the images. With a cache directory the images are also kept on disk as
+    ``<dir>/<digest[:2]>/<digest>``, which survives restarts and gives
+    FFmpeg and ``cover.jpg`` a file to read or hardlink.
+
+    Only successful downloads are cached.
+
+    Attributes:
+        maxbytes: Maximum size of the images kept in memory
+        cache_dir: Directory of the disk tier, or None for memory only
+        hits: Lookups answered from memory
+        disk_hits: Lookups answered from the disk tier
+        misses: Lookups that found no image
+        evictions: Images dropped from memory to respect ``maxbytes``
+    """
+
+    # URL to digest mappings kept in memory
+    MAX_URLS = 4096
+
+    def __init__(self, maxbytes: int, cache_dir: Optional[Path] = None):
+        """Initialize the cache.
+
+        Args:
+            maxbytes: Maximum size of the images kept in memory
+            cache_dir: Optional directory for the disk tier
+        """
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.maxbytes = maxbytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._urls: "OrderedDict[str, str]" = OrderedDict()
+        self._blobs: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # URL -> [lock, number of threads holding or waiting for it]
+        self._url_locks: Dict[str, List[Any]] = {}
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+        if self.cache_dir:
+            (self.cache_dir / "urls").mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """Get the content address of an image.
+
+        Args:
+            data: Image bytes
+
+        Returns:
+            str: Hex SHA-256 of the bytes
+        """
+        return hashlib.sha256(data).hexdigest()
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.cache_dir / digest[:2] / digest
+
+    def _url_path(self, url: str) -> Path:
+        return self.cache_dir / "urls" / hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _remember(self, url: str, digest: str, data: bytes):
+        """Store an image in memory, evicting the least recently used. Caller holds the lock."""
+        self._urls[url] = digest
+        self._urls.move_to_end(url)
+        while len(self._urls) > self.MAX_URLS:
+            self._urls.popitem(last=False)
+
+        if digest in self._blobs:
+            self._blobs.move_to_end(digest)
+            return
+        if len(data) > self.maxbytes:
+            return
+        self._blobs[digest] = data
+        self._bytes += len(data)
+        while self._bytes > self.maxbytes:
+            _, evicted = self._blobs.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def _read_disk(self, url: str) -> Optional[bytes]:
+        """Read the image of a URL from the disk tier, verifying its digest."""
+        try:
+            digest = self._url_path(url).read_text(encoding="ascii").strip()
+            data = self._blob_path(digest).read_bytes()
+        except (OSError, ValueError):
+            return None
+        if self.digest(data) != digest:
+            # Modified through a hardlinked cover file; only the cache's link is removed
+            self.logger.debug(f"Discarding modified cached image {digest}")
+            self._blob_path(digest).unlink(missing_ok=True)
+            return None
+        with self._lock:
+            self._remember(url, digest, data)
+        return data
+
+    def _write_disk(self, url: str, digest: str, data: bytes):
+        try:
+            blob = self._blob_path(digest)
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                temp = blob.with_name(f"{digest}.{threading.get_ident()}.tmp")
+                temp.write_bytes(data)
+                os.replace(temp, blob)
+            url_path = self._url_path(url)
+            temp = url_path.with_name(f"{url_path.name}.{threading.get_ident()}.tmp")
+            temp.write_text(digest, encoding="ascii")
+            os.replace(temp, url_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write image to the cache: {e}")
+
+    def _lookup(self, url: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """Find the image of a URL in memory, then on disk, without counting the lookup.
+
+        Returns:
+            tuple: Image data and the tier it came from ("memory" or "disk"),
+                or (None, None) on a miss
+        """
+        with self._lock:
+            digest = self._urls.get(url)
+            data = self._blobs.get(digest) if digest else None
+            if data is not None:
+                self._urls.move_to_end(url)
+                self._blobs.move_to_end(digest)
+                return data, "memory"
+
+        data = self._read_disk(url) if self.cache_dir else None
+        return data, "disk" if data is not None else None
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Get the cached image of a URL.
+
+        Args:
+            url: Image URL
+
+        Returns:
+            bytes: Image data, or None if it is not cached
+        """
+        data, tier = self._lookup(url)
+        with self._lock:
+            if tier == "memory":
+                self.hits += 1
+            elif tier == "disk":
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+        return data
+
+    def put(self, url: str, data: bytes) -> str:
+        """Store the image of a URL.
+
+        Args:
+            url: Image URL
+            data: Image bytes
+
+        Returns:
+            str: Content address of the image
+        """
+        digest = self.digest(data)
+        with self._lock:
+            self._remember(url, digest, data)
+        if self.cache_dir:
+            self._write_disk(url, digest, data)
+        return digest
+
+    def get_or_load(self, url: str, loader: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+        """Get the image of a URL, calling ``loader`` once on a miss.
+
+        Concurrent callers asking for the same URL wait for the first one
+        instead of downloading the image in parallel.
+
+        Args:
+            url: Image URL
+            loader: Downloads the image; None (failed download) is not cached
+
+        Returns:
+            bytes: Image data, or None if it could not be loaded
+        """
+        data = self.get(url)
+        if data is not None:
+            return data
+
+        with self._lock:
+            entry = self._url_locks.setdefault(url, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                # Loaded by the thread that held the lock, or by another process
+                data, _ = self._lookup(url)
+                if data is None:
+                    data = loader()
+                    if data:
+                        self.put(url, data)
+                return data
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._url_locks[url]
+
+    def path(self, url: str) -> Optional[Path]:
+        """Get the file of the cached image of a URL in the disk tier.
+
+        Args:
+            url: Image URL
+
+        Returns:
+            Path: Cached image file, or None without a disk tier or if the
+                image is not cached
+        """
+        if not self.cache_dir:
+            return None
+        with self._lock:
+            digest = self._urls.get(url)
+        if not digest:
+            try:
+                digest = self._url_path(url).read_text(encoding="ascii").strip()
+            except OSError:
+                return None
+        blob = self._blob_path(digest)
+        return blob if blob.exists() else None
+
+    def clear(self):
+        """Remove every image, in memory and on disk."""
+        with self._lock:
+            self._urls.clear()
+            self._blobs.clear()
+            self._bytes = 0
+        if not self.cache_dir:
+            return
+        for path in self.cache_dir.glob("*/*"):
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the size and hit/miss counters of the cache.
+
+        Returns:
+            dict: entries, bytes and maxbytes of the memory tier, disk_entries
+                (None without a disk tier), hits, disk_hits, misses,
+                evictions and hit_rate
+        """
+        disk_entries = None
+        if self.cache_dir:
+            disk_entries = sum(
+                1 for path in self.cache_dir.glob("*/*") if path.parent.name != "urls"
+            )
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._blobs),
+                "bytes": self._bytes,
+                "maxbytes": self.maxbytes,
+                "disk_entries": disk_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+
+_default_cache: Optional[ImageCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """Get the process-wide image cache.
+
+    The memory tier is bounded by Config.IMAGE_CACHE_MAX_MB; images are also
+    kept in Config.IMAGE_CACHE_PATH when Config.IMAGE_CACHE_PERSIST is set.
+
+    Returns:
+        ImageCache: Shared cache
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ImageCache(
+                maxbytes=int(Config.IMAGE_CACHE_MAX_MB * 1024 * 1024),
+                cache_dir=Config.IMAGE_CACHE_PATH if Config.IMAGE_CACHE_PERSIST else None,
+            )
+        return _default_cache
@@ -1,20 +1,38 @@
 import logging
+import os
 import requests
 from pathlib import Path
 from typing import Optional
-from spotifysaver.config import Config
+from spotifysaver.downloader.image_cache import ImageCache, get_image_cache
+from spotifysaver.services.http_client import HTTPClient, get_http_client
 from spotifysaver.spotlog import get_logger
 
 class ImageDownloader:
-    """Downloads images from URLs."""
+    """Downloads images from URLs.
 
-    def __init__(self):
-        """Initialize the ImageDownloader."""
+    Images go through an ``ImageCache``, so a cover shared by many tracks is
+    only downloaded once.
+    """
+
+    def __init__(
+        self, http_client: Optional[HTTPClient] = None, cache: Optional[ImageCache] = None
+    ):
+        """Initialize the ImageDownloader.
+
+        Args:
+            http_client: HTTP client to use. Default: the process-wide client
+            cache: Image cache to use. Default: the process-wide cache
+        """
         self.logger = get_logger(f"{self.__class__.__name__}")
+        self.http = http_client or get_http_client()
+        self.cache = cache or get_image_cache()
 
     def download_image(self, url: str, output_path: Path) -> Optional[Path]:
         """Download an image from a URL and save it to a specified path.
 
+        When the image is in the disk tier of the cache the file is
+        hardlinked to it instead of being written again.
+
         Args:
             url: The URL of the image to download.
             output_path: The full path (including filename and extension)
@@ -28,31 +46,58 @@ class ImageDownloader:
             return None
 
         try:
-            response = requests.get(url, timeout=Config.DOWNLOAD_TIMEOUT)
-            response.raise_for_status()  # Raise an exception for HTTP errors
+            data = self.get_image_from_url(url)
+            if data is None:
+                return None
 
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(response.content)
+            if not self._link_cached(url, output_path):
+                output_path.write_bytes(data)
             self.logger.debug(f"Image downloaded successfully to: {output_path}")
             return output_path
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error downloading image from {url}: {e}")
-            return None
         except Exception as e:
             self.logger.error(f"An unexpected error occurred while downloading image from {url}: {e}")
             return None
-        
+
+    def _link_cached(self, url: str, output_path: Path) -> bool:
+        """Hardlink a file to the cached copy of an image.
+
+        Args:
+            url: The URL of the image
+            output_path: Path of the file to create or replace
+
+        Returns:
+            bool: True if the file was linked, False if it must be written
+        """
+        blob = self.cache.path(url)
+        if not blob:
+            return False
+        temp_path = output_path.with_name(f"{output_path.name}.tmp")
+        try:
+            temp_path.unlink(missing_ok=True)
+            os.link(blob, temp_path)
+            os.replace(temp_path, output_path)
+            return True
+        except OSError as e:
+            # Different filesystem or no hardlink support
+            self.logger.debug(f"Could not link cached image: {e}")
+            temp_path.unlink(missing_ok=True)
+            return False
+
     def get_image_from_url(self, url: str) -> Optional[bytes]:
         """Get an image from a URL.
-        
+
         Args:
             url: The URL of the image to download.
-            
+
         Returns:
             bytes: The image data if successful, None otherwise.
         """
+        return self.cache.get_or_load(url, lambda: self._fetch_image(url))
+
+    def _fetch_image(self, url: str) -> Optional[bytes]:
         try:
-            response = requests.get(url, timeout=Config.DOWNLOAD_TIMEOUT)
+            response = self.http.get(url)
             response.raise_for_status()  # Raise an exception for HTTP errors
             self.logger.debug(f"Image downloaded successfully from {url}")
             return response.content if response.status_code == 200 else None
@@ -0,0 +1,213 @@
+"""Checkpoint Journal Module for resumable batch downloads"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from spotifysaver.models import Playlist, Track, TrackMatch
+from spotifysaver.spotlog import get_logger
+
+# States a track goes through, in order
+RESOLVED = "resolved"
+FETCHED = "fetched"
+TRANSCODED = "transcoded"
+TAGGED = "tagged"
+FAILED = "failed"
+
+
+class JobJournal:
+    """Append-only JSON lines journal of the tracks of a batch download.
+
+    Every state change of a track (resolved, fetched, transcoded, tagged or
+    failed) is appended as one line, so the journal survives a crash at any
+    point. Resuming a job replays the journal: tagged tracks whose file still
+    exists are skipped, and resolved matches are reused instead of searching
+    YouTube Music again. Journals live in
+    ``<base_dir>/.spotifysaver/jobs/<job_id>.jsonl``.
+
+    Attributes:
+        path: Path of the journal file
+        entries: Last journal entry of each track URI
+        matches: Match recorded for each resolved track URI
+    """
+
+    def __init__(self, path: Path, resume: bool = False):
+        """Open a journal.
+
+        Args:
+            path: Path of the journal file
+            resume: Load the existing journal instead of starting a new one
+        """
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.path = path
+        self.entries: Dict[str, dict] = {}
+        self.matches: Dict[str, TrackMatch] = {}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            self._load()
+        else:
+            self.path.write_text("", encoding="utf-8")
+        self._file = self.path.open("a", encoding="utf-8")
+
+    @staticmethod
+    def job_id(kind: str, tracks: Iterable[Track], output_format: str) -> str:
+        """Build a stable job ID from the content of a batch download.
+
+        Args:
+            kind: "album", "playlist", "tracks" or "sync"
+            tracks: Tracks of the job
+            output_format: Audio format of the job
+
+        Returns:
+            str: ID like ``album-<hash>``, identical across runs for the same tracks
+        """
+        digest = hashlib.sha1(output_format.encode())
+        for track in tracks:
+            digest.update(track.uri.encode())
+        return f"{kind}-{digest.hexdigest()[:16]}"
+
+    @staticmethod
+    def playlist_job_id(playlist: Playlist, output_format: str) -> str:
+        """Build a stable job ID for a playlist without listing its tracks.
+
+        The snapshot ID changes whenever the playlist is modified, so it
+        identifies the track list as well as hashing every track URI while
+        allowing the tracks to be streamed.
+
+        Args:
+            playlist: Playlist of the job
+            output_format: Audio format of the job
+
+        Returns:
+            str: ID like ``playlist-<hash>``
+        """
+        digest = hashlib.sha1(output_format.encode())
+        digest.update(playlist.uri.encode())
+        digest.update((playlist.snapshot_id or "").encode())
+        return f"playlist-{digest.hexdigest()[:16]}"
+
+    @classmethod
+    def for_job(cls, base_dir: Path, job_id: str, resume: bool = False) -> "JobJournal":
+        """Open the journal of a job inside a library.
+
+        Args:
+            base_dir: Library base directory
+            job_id: ID of the job (see ``job_id``)
+            resume: Load the existing journal instead of starting a new one
+
+        Returns:
+            JobJournal: Opened journal
+        """
+        return cls(Path(base_dir) / ".spotifysaver" / "jobs" / f"{job_id}.jsonl", resume)
+
+    def _load(self):
+        with self.path.open(encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Last line cut short by a crash
+                    continue
+                self._apply(entry)
+        done = sum(1 for entry in self.entries.values() if entry["state"] == TAGGED)
+        self.logger.info(f"Resuming job from {self.path.name}: {done} tracks already done")
+
+    def _apply(self, entry: dict):
+        self.entries[entry["uri"]] = entry
+        if entry.get("video_id"):
+            self.matches[entry["uri"]] = TrackMatch(
+                video_id=entry["video_id"],
+                score=entry.get("score", 0.0),
+                strategy=entry.get("strategy"),
+                title=entry.get("title"),
+            )
+
+    def record(self, track: Track, state: str, **extra):
+        """Append a state change of a track.
+
+        Args:
+            track: Track whose state changed
+            state: New state
+            **extra: Additional JSON-serializable fields (match, path, error)
+        """
+        entry = {"uri": track.uri, "state": state, "at": time.time(), **extra}
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            if self._file.closed:
+                return
+            self._apply(entry)
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def record_match(self, track: Track, match: TrackMatch):
+        """Record that a track was resolved to a YouTube Music video.
+
+        Args:
+            track: Resolved track
+            match: Selected YouTube Music match
+        """
+        self.record(
+            track,
+            RESOLVED,
+            video_id=match.video_id,
+            score=match.score,
+            strategy=match.strategy,
+            title=match.title,
+        )
+
+    def is_done(self, track: Track, output_path: Path) -> bool:
+        """Check whether a track was completed by a previous run of the job.
+
+        Args:
+            track: Track to check
+            output_path: Path of its audio file
+
+        Returns:
+            bool: True if the track was tagged and its file still exists
+        """
+        entry = self.entries.get(track.uri)
+        return bool(entry and entry["state"] == TAGGED and output_path.exists())
+
+    def get_match(self, track: Track) -> Optional[TrackMatch]:
+        """Get the match recorded for a track by a previous run.
+
+        Args:
+            track: Track to look up
+
+        Returns:
+            TrackMatch: Recorded match, or None if the track was never resolved
+        """
+        return self.matches.get(track.uri)
+
+    def is_complete(self, track_count: int) -> bool:
+        """Check whether every track of the job was tagged.
+
+        Entries are kept per track URI, so a track listed twice (a playlist
+        can contain duplicates) counts once; ``track_count`` must count
+        unique URIs too.
+
+        Args:
+            track_count: Number of unique track URIs of the job
+
+        Returns:
+            bool: True if no track failed and ``track_count`` tracks were tagged
+        """
+        states = [entry["state"] for entry in self.entries.values()]
+        return FAILED not in states and states.count(TAGGED) >= track_count
+
+    def close(self, completed: bool = False):
+        """Close the journal.
+
+        Args:
+            completed: The job finished without failures; the journal is
+                deleted since there is nothing left to resume
+        """
+        with self._lock:
+            self._file.close()
+        if completed:
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,281 @@
+"""Local Library Index Module"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from spotifysaver.metadata import MusicFileMetadata
+from spotifysaver.spotlog import get_logger
+
+
+class LibraryIndex:
+    """SQLite index of the audio files already present in a music library.
+
+    Every file under ``base_dir`` is recorded with its Spotify URI (read from
+    the ``SPOTIFY_URI`` tag), size, modification time and a checksum of its
+    identifying tags. The library is scanned once; afterwards only files whose
+    size or mtime changed are read again, and new downloads are added as they
+    finish. Files also remember the kind of download that wrote or claimed
+    them (``origin``), so a playlist sync can tell its own files from album
+    downloads. The database lives in ``<base_dir>/.spotifysaver/library.db``.
+
+    Attributes:
+        base_dir: Root directory of the music library
+        db_path: Path of the SQLite database
+    """
+
+    AUDIO_EXTENSIONS = (".m4a", ".mp3", ".opus")
+
+    def __init__(self, base_dir: Path, db_path: Optional[Path] = None):
+        """Initialize the index and create its table if needed.
+
+        Args:
+            base_dir: Root directory of the music library
+            db_path: Path of the SQLite database. Default: <base_dir>/.spotifysaver/library.db
+        """
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.base_dir = Path(base_dir).resolve()
+        self.db_path = Path(db_path or self.base_dir / ".spotifysaver" / "library.db")
+        self._lock = threading.RLock()
+        self._scanned = False
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    spotify_uri TEXT,
+                    title TEXT,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    tag_checksum TEXT,
+                    indexed_at REAL NOT NULL,
+                    origin TEXT
+                )
+                """
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(files)")}
+            if "origin" not in columns:
+                # Index created before origins were recorded
+                self._conn.execute("ALTER TABLE files ADD COLUMN origin TEXT")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_files_uri ON files (spotify_uri)"
+            )
+
+    def _relative(self, path: Path) -> str:
+        return Path(path).resolve().relative_to(self.base_dir).as_posix()
+
+    @staticmethod
+    def _tag_checksum(tags: dict) -> str:
+        return hashlib.sha1(json.dumps(tags, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _is_audio_file(self, name: str) -> bool:
+        # Skip streams and conversions that are still in progress
+        return name.endswith(self.AUDIO_EXTENSIONS) and ".source." not in name and ".temp." not in name
+
+    def _index_file(self, path: Path, stat: os.stat_result) -> Optional[tuple]:
+        """Read the tags of a file and store its row. Caller holds the lock."""
+        tags = MusicFileMetadata.read_tags(path)
+        row = (
+            self._relative(path),
+            tags["spotify_uri"] if tags else None,
+            tags["title"] if tags else None,
+            stat.st_size,
+            stat.st_mtime,
+            self._tag_checksum(tags) if tags else None,
+            time.time(),
+        )
+        with self._conn:
+            # Upsert, so re-reading the tags keeps the origin of the file
+            self._conn.execute(
+                "INSERT INTO files "
+                "(path, spotify_uri, title, size, mtime, tag_checksum, indexed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET spotify_uri = excluded.spotify_uri, "
+                "title = excluded.title, size = excluded.size, mtime = excluded.mtime, "
+                "tag_checksum = excluded.tag_checksum, indexed_at = excluded.indexed_at",
+                row,
+            )
+        return row
+
+    def scan(self) -> Dict[str, int]:
+        """Bring the index in line with the files on disk.
+
+        Unchanged files (same size and mtime) are not read again.
+
+        Returns:
+            dict: Number of files indexed, unchanged and removed
+        """
+        counts = {"indexed": 0, "unchanged": 0, "removed": 0}
+        with self._lock:
+            known = {
+                row[0]: (row[1], row[2])
+                for row in self._conn.execute("SELECT path, size, mtime FROM files")
+            }
+            seen = set()
+            for root, dirs, files in os.walk(self.base_dir):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                for name in files:
+                    if not self._is_audio_file(name):
+                        continue
+                    path = Path(root) / name
+                    stat = path.stat()
+                    relative = self._relative(path)
+                    seen.add(relative)
+                    if known.get(relative) == (stat.st_size, stat.st_mtime):
+                        counts["unchanged"] += 1
+                    else:
+                        self._index_file(path, stat)
+                        counts["indexed"] += 1
+
+            missing = [(path,) for path in known if path not in seen]
+            if missing:
+                with self._conn:
+                    self._conn.executemany("DELETE FROM files WHERE path = ?", missing)
+            counts["removed"] = len(missing)
+            self._scanned = True
+
+        self.logger.info(
+            f"Library index updated: {counts['indexed']} indexed, "
+            f"{counts['unchanged']} unchanged, {counts['removed']} removed"
+        )
+        return counts
+
+    def record(self, path: Path, origin: Optional[str] = None):
+        """Add or refresh a single file, e.g. right after it was downloaded.
+
+        Args:
+            path: Audio file inside the library
+            origin: Kind of download that wrote the file ("album" or "playlist")
+        """
+        path = Path(path)
+        with self._lock:
+            self._index_file(path, path.stat())
+            if origin:
+                self.claim(path, origin)
+
+    def claim(self, path: Path, origin: str):
+        """Record that a download wrote or reused an indexed file.
+
+        Any origin other than "playlist" is kept for good: once an album or
+        single track download owns a file, playlist syncs never prune it.
+
+        Args:
+            path: Audio file inside the library
+            origin: Kind of download ("album" or "playlist")
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE files SET origin = ? "
+                "WHERE path = ? AND (origin IS NULL OR origin = 'playlist')",
+                (origin, self._relative(path)),
+            )
+
+    def get_origin(self, path: Path) -> Optional[str]:
+        """Get the kind of download that owns a file.
+
+        Args:
+            path: Audio file inside the library
+
+        Returns:
+            str: Recorded origin, or None for unknown or unindexed files
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT origin FROM files WHERE path = ?", (self._relative(path),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def forget(self, path: Path):
+        """Remove a file from the index, e.g. after deleting it.
+
+        Args:
+            path: Audio file inside the library
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM files WHERE path = ?", (self._relative(path),))
+
+    def is_present(self, path: Path, spotify_uri: Optional[str], title: Optional[str] = None) -> bool:
+        """Check whether a valid, tagged copy of a track exists at a path.
+
+        Files tagged with a Spotify URI must match ``spotify_uri``. Files
+        downloaded before the URI tag existed are accepted when their title
+        tag matches ``title``.
+
+        Args:
+            path: Expected location of the track
+            spotify_uri: Spotify URI of the track
+            title: Track name, used for files without a URI tag
+
+        Returns:
+            bool: True if the file exists, is readable and belongs to the track
+        """
+        path = Path(path)
+        with self._lock:
+            if not self._scanned:
+                self.scan()
+
+            relative = self._relative(path)
+            if not path.exists():
+                with self._conn:
+                    self._conn.execute("DELETE FROM files WHERE path = ?", (relative,))
+                return False
+
+            stat = path.stat()
+            row = self._conn.execute(
+                "SELECT path, spotify_uri, title, size, mtime, tag_checksum "
+                "FROM files WHERE path = ?",
+                (relative,),
+            ).fetchone()
+            if not row or (row[3], row[4]) != (stat.st_size, stat.st_mtime):
+                row = self._index_file(path, stat)
+
+        _, indexed_uri, indexed_title, _, _, tag_checksum = row[:6]
+        if not tag_checksum:
+            return False
+        if indexed_uri:
+            return indexed_uri == spotify_uri
+        return bool(title) and indexed_title == title
+
+    def stats(self) -> dict:
+        """Get the number of indexed files.
+
+        Returns:
+            dict: Total files, files with a Spotify URI and the database path
+        """
+        with self._lock:
+            total, tagged = self._conn.execute(
+                "SELECT COUNT(*), COUNT(spotify_uri) FROM files"
+            ).fetchone()
+        return {"path": str(self.db_path), "files": total, "with_uri": tagged}
+
+
+_indexes: Dict[Path, LibraryIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_library_index(base_dir: Path) -> LibraryIndex:
+    """Get the process-wide index of a library directory.
+
+    Sharing one instance per directory means the initial scan runs once per
+    process, no matter how many downloaders point at the same library.
+
+    Args:
+        base_dir: Root directory of the music library
+
+    Returns:
+        LibraryIndex: Shared index for the directory
+    """
+    key = Path(base_dir).resolve()
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = LibraryIndex(base_dir)
+        return _indexes[key]
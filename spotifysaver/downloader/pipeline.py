@@ -0,0 +1,315 @@
+"""Staged Download Pipeline Module"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+
+from spotifysaver.downloader.cancellation import CancellationToken, DownloadCancelled
+from spotifysaver.models import Track, TrackMatch
+from spotifysaver.spotlog import get_logger
+
+if TYPE_CHECKING:
+    from spotifysaver.metadata import MusicFileMetadata
+
+_STOP = object()
+
+
+@dataclass
+class TrackJob:
+    """Work item carried through the download pipeline for a single track.
+
+    Attributes:
+        track: Track being downloaded
+        output_path: Path of the final audio file
+        match: YouTube Music match resolved by the search stage
+        source_path: Stream downloaded by the fetch stage
+        source_codec: Normalized codec of the downloaded stream
+        metadata: Metadata written by FFmpeg in the transcode stage, if any
+        updated_track: Track returned by the tag stage (with lyrics status)
+        skipped: True if the track was already in the library; later stages
+            pass it through untouched
+        claimed: True once the search stage claimed ``output_path``
+    """
+
+    track: Track
+    output_path: Path
+    match: Optional[TrackMatch] = None
+    source_path: Optional[Path] = None
+    source_codec: Optional[str] = None
+    metadata: Optional["MusicFileMetadata"] = None
+    updated_track: Optional[Track] = None
+    skipped: bool = False
+    claimed: bool = False
+
+
+@dataclass
+class PipelineStage:
+    """A step of the pipeline with its own concurrency limit.
+
+    Attributes:
+        name: Stage name used in logs and statistics
+        handler: Function that receives a work item and returns it for the
+            next stage. Returning None drops the item as failed.
+        workers: Number of threads running the handler
+    """
+
+    name: str
+    handler: Callable[[Any], Any]
+    workers: int = 1
+
+
+@dataclass
+class StageStats:
+    """Runtime counters of a pipeline stage.
+
+    Attributes:
+        name: Stage name
+        workers: Configured concurrency limit
+        queue_depth: Items waiting in the stage input queue
+        busy: Workers currently running the handler
+        processed: Items that completed the stage
+        failed: Items dropped or raised inside the stage
+        busy_seconds: Total time spent inside the handler
+        elapsed: Wall time since the pipeline started
+    """
+
+    name: str
+    workers: int
+    queue_depth: int = 0
+    busy: int = 0
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items per second that left the stage since the pipeline started."""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the available worker time spent inside the handler (0-1)."""
+        capacity = self.elapsed * self.workers
+        return min(self.busy_seconds / capacity, 1.0) if capacity > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert the statistics to a dictionary for logging or serialization."""
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "queue_depth": self.queue_depth,
+            "busy": self.busy,
+            "processed": self.processed,
+            "failed": self.failed,
+            "throughput": round(self.throughput, 3),
+            "utilization": round(self.utilization, 3),
+        }
+
+
+@dataclass
+class _StageState:
+    stage: PipelineStage
+    inbox: queue.Queue
+    stats: StageStats
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    alive: int = 0
+
+
+class DownloadPipeline:
+    """Runs work items through a chain of stages connected by bounded queues.
+
+    Each stage gets its own thread pool, so network-bound, bandwidth-bound,
+    CPU-bound and disk-bound steps can all make progress at the same time.
+    Bounded queues apply back-pressure: a slow stage blocks the stage in
+    front of it instead of letting work pile up in memory.
+
+    Once the cancel token is set, no new items are fed and queued items are
+    dropped as failed without running their handlers.
+
+    Attributes:
+        stages: Ordered list of pipeline stages
+        queue_size: Capacity of each inter-stage queue
+        cancel_token: Token that stops the pipeline
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        queue_size: int = 16,
+        cancel_token: Optional[CancellationToken] = None,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            stages: Ordered list of pipeline stages
+            queue_size: Capacity of each inter-stage queue
+            cancel_token: Token that stops the pipeline. Default: a new token
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.cancel_token = cancel_token or CancellationToken()
+        self._states: List[_StageState] = []
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    def stats(self) -> Dict[str, StageStats]:
+        """Return a snapshot of the per-stage statistics.
+
+        Returns:
+            dict: Stage name mapped to its StageStats
+        """
+        now = self._finished_at or time.monotonic()
+        elapsed = now - self._started_at if self._started_at else 0.0
+        snapshot = {}
+        for state in self._states:
+            with state.lock:
+                snapshot[state.stage.name] = StageStats(
+                    name=state.stats.name,
+                    workers=state.stats.workers,
+                    queue_depth=state.inbox.qsize(),
+                    busy=state.stats.busy,
+                    processed=state.stats.processed,
+                    failed=state.stats.failed,
+                    busy_seconds=state.stats.busy_seconds,
+                    elapsed=elapsed,
+                )
+        return snapshot
+
+    def run(
+        self,
+        items: Iterable[Any],
+        on_complete: Optional[Callable[[Any, bool], None]] = None,
+    ) -> int:
+        """Push all items through the pipeline and wait for them to finish.
+
+        Args:
+            items: Work items fed to the first stage
+            on_complete: Called once per item with (item, success) when it
+                leaves the pipeline. Calls are serialized.
+
+        Returns:
+            int: Number of items that completed every stage
+        """
+        self._states = [
+            _StageState(
+                stage=stage,
+                inbox=queue.Queue(maxsize=self.queue_size),
+                stats=StageStats(name=stage.name, workers=max(1, stage.workers)),
+            )
+            for stage in self.stages
+        ]
+        self._started_at = time.monotonic()
+        self._finished_at = None
+
+        done_lock = threading.Lock()
+        succeeded = 0
+
+        def finish(item: Any, success: bool):
+            nonlocal succeeded
+            with done_lock:
+                if success:
+                    succeeded += 1
+                if on_complete:
+                    try:
+                        on_complete(item, success)
+                    except Exception as e:
+                        self.logger.error(f"Pipeline completion callback failed: {e}")
+
+        threads = []
+        for position, state in enumerate(self._states):
+            next_state = self._states[position + 1] if position + 1 < len(self._states) else None
+            state.alive = state.stats.workers
+            for worker in range(state.stats.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(state, next_state, finish),
+                    name=f"pipeline-{state.stage.name}-{worker}",
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+        first = self._states[0]
+        try:
+            for item in items:
+                if self.cancel_token.cancelled:
+                    break
+                first.inbox.put(item)
+        except KeyboardInterrupt:
+            self.cancel_token.cancel("Interrupted")
+            raise
+        finally:
+            for _ in range(first.stats.workers):
+                first.inbox.put(_STOP)
+            for thread in threads:
+                thread.join()
+            self._finished_at = time.monotonic()
+
+        self.logger.info(
+            "Pipeline finished: "
+            + ", ".join(
+                f"{name} {s.processed} ok/{s.failed} failed ({s.throughput:.2f}/s)"
+                for name, s in self.stats().items()
+            )
+        )
+        return succeeded
+
+    def _worker(
+        self,
+        state: _StageState,
+        next_state: Optional[_StageState],
+        finish: Callable[[Any, bool], None],
+    ):
+        """Consume the stage queue until the stop marker arrives."""
+        while True:
+            item = state.inbox.get()
+            if item is _STOP:
+                with state.lock:
+                    state.alive -= 1
+                    last_worker = state.alive == 0
+                if last_worker and next_state:
+                    for _ in range(next_state.stats.workers):
+                        next_state.inbox.put(_STOP)
+                return
+
+            if self.cancel_token.cancelled:
+                with state.lock:
+                    state.stats.failed += 1
+                finish(item, False)
+                continue
+
+            with state.lock:
+                state.stats.busy += 1
+            started = time.monotonic()
+            try:
+                result = state.stage.handler(item)
+            except DownloadCancelled:
+                result = None
+            except Exception as e:
+                self.logger.error(f"Stage '{state.stage.name}' failed: {e}")
+                result = None
+            finally:
+                with state.lock:
+                    state.stats.busy -= 1
+                    state.stats.busy_seconds += time.monotonic() - started
+
+            with state.lock:
+                if result is None:
+                    state.stats.failed += 1
+                else:
+                    state.stats.processed += 1
+
+            if result is None:
+                finish(item, False)
+            elif next_state:
+                next_state.inbox.put(result)
+            else:
+                finish(result, True)
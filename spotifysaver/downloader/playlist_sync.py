@@ -0,0 +1,272 @@
+"""Incremental Playlist Sync Module"""
+
+import json
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from spotifysaver.downloader.job_journal import JobJournal
+from spotifysaver.downloader.youtube_downloader_for_cli import YouTubeDownloaderForCLI
+from spotifysaver.enums import AudioFormat, Bitrate
+from spotifysaver.services import SpotifyAPI
+from spotifysaver.spotlog import get_logger
+
+
+class PlaylistManifest:
+    """Local record of what was downloaded for a synced playlist.
+
+    The manifest stores the playlist ``snapshot_id`` seen on the last sync and
+    the file written for every track URI (relative to the library base
+    directory). It lives in ``<base_dir>/.spotifysaver/playlists/<id>.json``.
+
+    Attributes:
+        path: Path of the manifest file
+        snapshot_id: Snapshot ID of the last complete sync
+        tracks: Track URI mapped to its file path relative to base_dir
+        downloaded: Paths of ``tracks`` downloaded by the sync itself, as
+            opposed to files that were already in the library
+    """
+
+    def __init__(self, path: Path):
+        """Load the manifest if it exists.
+
+        Args:
+            path: Path of the manifest file
+        """
+        self.path = path
+        self.snapshot_id: Optional[str] = None
+        self.tracks: Dict[str, str] = {}
+        self.downloaded: Set[str] = set()
+
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.snapshot_id = data.get("snapshot_id")
+            self.tracks = data.get("tracks", {})
+            self.downloaded = set(data.get("downloaded", []))
+
+    @classmethod
+    def for_playlist(cls, base_dir: Path, playlist_id: str) -> "PlaylistManifest":
+        """Load the manifest of a playlist inside a library.
+
+        Args:
+            base_dir: Library base directory
+            playlist_id: Spotify ID of the playlist
+
+        Returns:
+            PlaylistManifest: Loaded (or empty) manifest
+        """
+        return cls(base_dir / ".spotifysaver" / "playlists" / f"{playlist_id}.json")
+
+    def save(self, name: str):
+        """Write the manifest to disk.
+
+        Args:
+            name: Playlist name, stored for readability
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "name": name,
+            "snapshot_id": self.snapshot_id,
+            "synced_at": datetime.now().isoformat(),
+            "tracks": self.tracks,
+            "downloaded": sorted(self.downloaded & set(self.tracks.values())),
+        }
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        temp_path.replace(self.path)
+
+
+@dataclass
+class SyncResult:
+    """Summary of a playlist sync.
+
+    Attributes:
+        name: Playlist name (None when the playlist was unchanged)
+        unchanged: True if the snapshot matched and nothing was fetched
+        total: Tracks in the playlist
+        added: Tracks missing locally that were scheduled for download
+        downloaded: Added tracks downloaded successfully
+        removed: Tracks no longer in the playlist
+        pruned: Files deleted because their track was removed
+    """
+
+    name: Optional[str] = None
+    unchanged: bool = False
+    total: int = 0
+    added: int = 0
+    downloaded: int = 0
+    removed: int = 0
+    pruned: int = 0
+
+    @property
+    def failed(self) -> int:
+        """Added tracks that could not be downloaded."""
+        return self.added - self.downloaded
+
+
+class PlaylistSync:
+    """Keeps a local copy of a Spotify playlist up to date.
+
+    Compares the playlist ``snapshot_id`` and track URIs with the local
+    manifest: unchanged playlists are skipped without fetching their tracks,
+    otherwise only added (or locally missing) tracks are downloaded and,
+    optionally, removed tracks are deleted.
+
+    Attributes:
+        spotify: SpotifyAPI instance for fetching playlist data
+        downloader: Downloader used for the new tracks
+    """
+
+    def __init__(self, spotify: SpotifyAPI, downloader: YouTubeDownloaderForCLI):
+        """Initialize the playlist sync.
+
+        Args:
+            spotify: SpotifyAPI instance for fetching playlist data
+            downloader: Downloader used for the new tracks
+        """
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.spotify = spotify
+        self.downloader = downloader
+
+    def _all_present(self, manifest: PlaylistManifest) -> bool:
+        return all((self.downloader.base_dir / p).exists() for p in manifest.tracks.values())
+
+    def _shared_paths(self, manifest: PlaylistManifest) -> Set[str]:
+        """Collect the files referenced by the manifests of other playlists."""
+        shared = set()
+        for path in manifest.path.parent.glob("*.json"):
+            if path != manifest.path:
+                shared.update(PlaylistManifest(path).tracks.values())
+        return shared
+
+    def _can_prune(self, relative_path: str, manifest: PlaylistManifest, shared: Set[str]) -> bool:
+        """Check that a removed track's file belongs to this playlist alone.
+
+        Playlists share the ``Artist/Album`` tree with album downloads, so
+        only files this playlist downloaded itself are deleted, and only if
+        no other playlist lists them and no album or single track download
+        claimed them in the library index.
+        """
+        if relative_path not in manifest.downloaded or relative_path in shared:
+            return False
+        origin = self.downloader.library.get_origin(self.downloader.base_dir / relative_path)
+        return origin in (None, "playlist")
+
+    def _prune(self, relative_path: str) -> bool:
+        """Delete a synced file and its lyrics, and drop it from the library index."""
+        audio_path = self.downloader.base_dir / relative_path
+        self.downloader.library.forget(audio_path)
+        removed = False
+        for path in (audio_path, audio_path.with_suffix(".lrc")):
+            if path.exists():
+                path.unlink()
+                removed = True
+        if removed:
+            self.logger.info(f"Pruned: {audio_path}")
+        return removed
+
+    def sync(
+        self,
+        playlist_url: str,
+        output_format: AudioFormat = AudioFormat.M4A,
+        bitrate: Bitrate = Bitrate.B128,
+        download_lyrics: bool = False,
+        cover: bool = False,
+        prune: bool = False,
+        workers: int = 1,
+        pipeline: bool = False,
+        progress_callback: Optional[callable] = None,
+        on_start: Optional[callable] = None,
+    ) -> SyncResult:
+        """Bring the local copy of a playlist up to date.
+
+        Args:
+            playlist_url: Spotify URL or URI for the playlist
+            output_format: Audio format enum
+            bitrate: Audio bitrate enum
+            download_lyrics: Whether to download lyrics for new tracks
+            cover: Whether to download the playlist cover
+            prune: Whether to delete files of tracks removed from the playlist
+            workers: Number of tracks to download in parallel
+            pipeline: Whether to use the staged download pipeline
+            progress_callback: Function that receives (current_track, total_tracks, track_name)
+            on_start: Called with (playlist, tracks_to_download) before downloading
+
+        Returns:
+            SyncResult: Summary of the sync
+        """
+        playlist_id = self.spotify._extract_spotify_id(playlist_url)
+        if not playlist_id:
+            raise ValueError("Invalid playlist URL")
+
+        manifest = PlaylistManifest.for_playlist(self.downloader.base_dir, playlist_id)
+        snapshot_id = self.spotify.get_playlist_snapshot_id(playlist_url)
+
+        if snapshot_id and manifest.snapshot_id == snapshot_id and self._all_present(manifest):
+            self.logger.info(f"Playlist {playlist_id} unchanged (snapshot {snapshot_id})")
+            return SyncResult(unchanged=True, total=len(manifest.tracks))
+
+        playlist = self.spotify.get_playlist(playlist_url, snapshot_id)
+        current = {track.uri: track for track in playlist.tracks}
+
+        # Resolve where every track belongs and keep the ones already on disk
+        synced: Dict[str, str] = {}
+        pending = []
+        for uri, track in current.items():
+            audio_path = self.downloader._build_output_path(track, None, output_format)
+            if audio_path.exists():
+                synced[uri] = audio_path.relative_to(self.downloader.base_dir).as_posix()
+            else:
+                pending.append((uri, track, audio_path))
+
+        result = SyncResult(name=playlist.name, total=len(current), added=len(pending))
+        removed = [uri for uri in manifest.tracks if uri not in current]
+        result.removed = len(removed)
+
+        if on_start:
+            on_start(playlist, len(pending))
+
+        if pending:
+            self.logger.info(f"Syncing {len(pending)} new tracks of playlist '{playlist.name}'")
+            pending_tracks = [track for _, track, _ in pending]
+            result.downloaded, _ = self.downloader.download_playlist_cli(
+                replace(playlist, tracks=pending_tracks),
+                output_format=output_format,
+                bitrate=bitrate,
+                download_lyrics=download_lyrics,
+                cover=cover,
+                progress_callback=progress_callback,
+                workers=workers,
+                pipeline=pipeline,
+                # Not the full-download ID, whose checkpoint this would truncate
+                job_id=JobJournal.job_id("sync", pending_tracks, output_format.value),
+            )
+            for uri, _, audio_path in pending:
+                if audio_path.exists():
+                    synced[uri] = audio_path.relative_to(self.downloader.base_dir).as_posix()
+                    manifest.downloaded.add(synced[uri])
+        elif cover and playlist.cover_url:
+            output_dir = self.downloader.base_dir / playlist.name
+            cover_path = output_dir / "cover.jpg"
+            if not cover_path.exists():
+                self.downloader._save_cover_album(playlist.cover_url, cover_path)
+
+        kept = set(synced.values())
+        shared = self._shared_paths(manifest) if prune else set()
+        for uri in removed:
+            relative_path = manifest.tracks[uri]
+            if relative_path in kept:
+                continue
+            if prune and self._can_prune(relative_path, manifest, shared):
+                if self._prune(relative_path):
+                    result.pruned += 1
+            else:
+                # Keep remembering files we did not delete
+                synced[uri] = relative_path
+
+        manifest.tracks = synced
+        # Only trust the snapshot when every track is on disk, so failures retry next run
+        manifest.snapshot_id = snapshot_id if result.failed == 0 else None
+        manifest.save(playlist.name)
+        return result
@@ -0,0 +1,113 @@
+"""Byte-level Track Progress Module"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from spotifysaver.spotlog import get_logger
+
+logger = get_logger("TrackProgress")
+
+
+@dataclass
+class TrackProgress:
+    """Progress of the track being downloaded or processed.
+
+    Attributes:
+        track_name: Name of the track
+        phase: "downloading", "postprocessing" (yt-dlp fixups), "transcoding",
+            "tagging" or "finished"
+        downloaded_bytes: Bytes of the source stream downloaded so far
+        total_bytes: Size of the source stream (exact or estimated), if known
+        speed: Download speed in bytes per second, if known
+        eta: Estimated seconds until the download finishes, if known
+    """
+
+    track_name: str
+    phase: str
+    downloaded_bytes: int = 0
+    total_bytes: Optional[int] = None
+    speed: Optional[float] = None
+    eta: Optional[float] = None
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Downloaded fraction of the stream (0-1), or None if the size is unknown."""
+        if self.phase in ("transcoding", "tagging", "finished"):
+            return 1.0
+        if not self.total_bytes:
+            return None
+        return min(self.downloaded_bytes / self.total_bytes, 1.0)
+
+
+class YDLProgressReporter:
+    """Turns yt-dlp progress and postprocessor hooks into TrackProgress updates.
+
+    yt-dlp calls the progress hook for every downloaded chunk, so updates are
+    throttled to one every ``interval`` seconds; phase changes and the end of
+    the download are always reported.
+
+    Attributes:
+        track_name: Name of the track being downloaded
+        callback: Function receiving TrackProgress updates
+        interval: Minimum seconds between two ``downloading`` updates
+    """
+
+    def __init__(
+        self, track_name: str, callback: Callable[[TrackProgress], None], interval: float
+    ):
+        self.track_name = track_name
+        self.callback = callback
+        self.interval = interval
+        self._last_emit = 0.0
+        self._last_phase: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _emit(self, progress: TrackProgress, force: bool = False):
+        now = time.monotonic()
+        with self._lock:
+            if (
+                not force
+                and progress.phase == self._last_phase
+                and now - self._last_emit < self.interval
+            ):
+                return
+            self._last_emit = now
+            self._last_phase = progress.phase
+        try:
+            self.callback(progress)
+        except Exception as e:
+            logger.debug(f"Progress callback failed: {e}")
+
+    def progress_hook(self, status: dict):
+        """yt-dlp progress hook.
+
+        Args:
+            status: Progress dictionary passed by yt-dlp
+        """
+        state = status.get("status")
+        if state not in ("downloading", "finished"):
+            return
+        downloaded = status.get("downloaded_bytes") or 0
+        total = status.get("total_bytes") or status.get("total_bytes_estimate")
+        self._emit(
+            TrackProgress(
+                track_name=self.track_name,
+                phase="downloading",
+                downloaded_bytes=downloaded,
+                total_bytes=int(total) if total else (downloaded if state == "finished" else None),
+                speed=status.get("speed"),
+                eta=0 if state == "finished" else status.get("eta"),
+            ),
+            force=state == "finished",
+        )
+
+    def postprocessor_hook(self, status: dict):
+        """yt-dlp postprocessor hook.
+
+        Args:
+            status: Postprocessor dictionary passed by yt-dlp
+        """
+        if status.get("status") == "started":
+            self._emit(TrackProgress(self.track_name, "postprocessing"), force=True)
@@ -0,0 +1,197 @@
+"""Transcode Scheduler Module"""
+
+import os
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, Set
+
+from spotifysaver.config import Config
+from spotifysaver.downloader.cancellation import CancellationToken
+from spotifysaver.spotlog import get_logger
+
+
+class TranscodeScheduler:
+    """Process-wide limits for the FFmpeg processes started by the transcoders.
+
+    At most ``max_processes`` conversions run at the same time, whatever
+    mix of CLI workers, pipeline stages and API tasks asks for them; the
+    others wait for a free slot. Every FFmpeg process can also be pinned to
+    a set of CPU cores and given a higher nice value, so encoding does not
+    starve the API event loop or the search workers on the same host.
+
+    Attributes:
+        max_processes: Maximum number of concurrent FFmpeg processes
+        cpu_affinity: Cores FFmpeg processes are pinned to, or None
+        nice: Niceness added to FFmpeg processes, relative to this process
+    """
+
+    # Seconds between two cancellation checks while waiting for a slot
+    POLL_INTERVAL = 0.2
+
+    def __init__(
+        self,
+        max_processes: int = 1,
+        cpu_affinity: Optional[Set[int]] = None,
+        nice: int = 0,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_processes: Maximum number of concurrent FFmpeg processes
+            cpu_affinity: Cores to pin FFmpeg processes to. Cores not
+                available to this process are ignored. Default: no pinning
+            nice: Niceness added to FFmpeg processes (0 to 19)
+        """
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.max_processes = max(1, max_processes)
+        self.cpu_affinity = self._usable_cpus(cpu_affinity)
+        self.nice = min(max(nice, 0), 19)
+        self._slots = threading.BoundedSemaphore(self.max_processes)
+        self._lock = threading.Lock()
+        self.running = 0
+        self.waiting = 0
+        self.completed = 0
+
+    @staticmethod
+    def parse_cpu_list(spec: Optional[str]) -> Optional[Set[int]]:
+        """Parse a CPU list like ``0-3,6``.
+
+        Args:
+            spec: Comma-separated core numbers and ranges
+
+        Returns:
+            set: Core numbers, or None if ``spec`` is empty
+
+        Raises:
+            ValueError: If ``spec`` is not a valid CPU list
+        """
+        if not spec or not spec.strip():
+            return None
+        cpus = set()
+        for part in spec.split(","):
+            part = part.strip()
+            if "-" in part:
+                first, last = (int(bound) for bound in part.split("-", 1))
+                cpus.update(range(first, last + 1))
+            elif part:
+                cpus.add(int(part))
+        return cpus or None
+
+    def _usable_cpus(self, cpus: Optional[Set[int]]) -> Optional[Set[int]]:
+        if not cpus:
+            return None
+        if not hasattr(os, "sched_setaffinity"):
+            self.logger.warning("CPU affinity is not supported on this platform, ignoring it")
+            return None
+        usable = cpus & os.sched_getaffinity(0)
+        if not usable:
+            self.logger.warning(f"None of the CPUs {sorted(cpus)} are available, ignoring affinity")
+            return None
+        return usable
+
+    @contextmanager
+    def slot(self, cancel_token: Optional[CancellationToken] = None) -> Iterator[None]:
+        """Wait for a free FFmpeg slot and hold it during the context.
+
+        Args:
+            cancel_token: Token that stops the wait when cancelled
+
+        Raises:
+            DownloadCancelled: If the token is cancelled while waiting
+        """
+        with self._lock:
+            self.waiting += 1
+        try:
+            while not self._slots.acquire(timeout=self.POLL_INTERVAL):
+                if cancel_token:
+                    cancel_token.raise_if_cancelled()
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+        with self._lock:
+            self.running += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+            self._slots.release()
+
+    def popen_kwargs(self) -> dict:
+        """Get the ``subprocess.Popen`` arguments that apply the limits at start.
+
+        Only needed on Windows, where the priority can be set through the
+        creation flags; elsewhere ``apply_limits`` is used once the process
+        runs.
+
+        Returns:
+            dict: Keyword arguments for ``subprocess.Popen``
+        """
+        if sys.platform == "win32" and self.nice:
+            return {"creationflags": subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+        return {}
+
+    def apply_limits(self, pid: int):
+        """Apply the priority and CPU affinity to a started FFmpeg process.
+
+        Failures are logged and ignored; the conversion runs unrestricted.
+
+        Args:
+            pid: Process ID of FFmpeg
+        """
+        if self.nice and hasattr(os, "setpriority"):
+            try:
+                niceness = min(os.getpriority(os.PRIO_PROCESS, 0) + self.nice, 19)
+                os.setpriority(os.PRIO_PROCESS, pid, niceness)
+            except OSError as e:
+                self.logger.debug(f"Could not lower the priority of FFmpeg ({pid}): {e}")
+        if self.cpu_affinity:
+            try:
+                os.sched_setaffinity(pid, self.cpu_affinity)
+            except OSError as e:
+                self.logger.debug(f"Could not set the CPU affinity of FFmpeg ({pid}): {e}")
+
+    def stats(self) -> dict:
+        """Get the current load of the scheduler.
+
+        Returns:
+            dict: Slot limit, running, waiting and completed conversions,
+                CPU affinity and niceness
+        """
+        with self._lock:
+            return {
+                "max_processes": self.max_processes,
+                "running": self.running,
+                "waiting": self.waiting,
+                "completed": self.completed,
+                "cpu_affinity": sorted(self.cpu_affinity) if self.cpu_affinity else None,
+                "nice": self.nice,
+            }
+
+
+_default_scheduler: Optional[TranscodeScheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_transcode_scheduler() -> TranscodeScheduler:
+    """Get the process-wide transcode scheduler.
+
+    Configured with Config.TRANSCODE_MAX_PROCESSES,
+    Config.TRANSCODE_CPU_AFFINITY and Config.TRANSCODE_NICE.
+
+    Returns:
+        TranscodeScheduler: Shared scheduler
+    """
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = TranscodeScheduler(
+                max_processes=Config.TRANSCODE_MAX_PROCESSES,
+                cpu_affinity=TranscodeScheduler.parse_cpu_list(Config.TRANSCODE_CPU_AFFINITY),
+                nice=Config.TRANSCODE_NICE,
+            )
+        return _default_scheduler
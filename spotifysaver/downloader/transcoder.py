@@ -0,0 +1,225 @@
+"""Audio Transcoder Module"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from spotifysaver import check_ffmpeg_installed
+from spotifysaver.downloader.cancellation import CancellationToken
+from spotifysaver.downloader.transcode_scheduler import (
+    TranscodeScheduler,
+    get_transcode_scheduler,
+)
+from spotifysaver.enums import AudioFormat, Bitrate
+from spotifysaver.spotlog import get_logger
+
+
+class TranscodeError(RuntimeError):
+    """Raised when FFmpeg fails to produce the requested output file."""
+
+
+class AudioTranscoder:
+    """Converts downloaded audio streams to the requested format with FFmpeg.
+
+    This is the CPU-bound step of a download. It mirrors the behaviour of
+    yt-dlp's ``FFmpegExtractAudio`` postprocessor: streams that already use
+    the target codec are remuxed, everything else is re-encoded at the
+    requested bitrate. FFmpeg processes are started through a
+    ``TranscodeScheduler``, which caps how many run at the same time.
+
+    Attributes:
+        ffmpeg_path: FFmpeg executable used for conversions
+        scheduler: Scheduler limiting the concurrent FFmpeg processes
+    """
+
+    # format: (encoder, source codec that can be copied, muxer, extra args)
+    CODECS = {
+        AudioFormat.M4A: ("aac", "aac", "ipod", ["-bsf:a", "aac_adtstoasc"]),
+        AudioFormat.MP3: ("libmp3lame", "mp3", "mp3", []),
+        AudioFormat.OPUS: ("libopus", "opus", "opus", []),
+    }
+
+    def __init__(
+        self, ffmpeg_path: str = "ffmpeg", scheduler: Optional[TranscodeScheduler] = None
+    ):
+        """Initialize the transcoder.
+
+        Args:
+            ffmpeg_path: FFmpeg executable used for conversions
+            scheduler: Scheduler limiting the concurrent FFmpeg processes.
+                Default: the process-wide one (see ``get_transcode_scheduler``)
+        """
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.ffmpeg_path = ffmpeg_path
+        self.scheduler = scheduler or get_transcode_scheduler()
+
+    @staticmethod
+    def normalize_codec(acodec: Optional[str]) -> Optional[str]:
+        """Normalize a yt-dlp ``acodec`` value (e.g. ``mp4a.40.2``) to a codec name.
+
+        Args:
+            acodec: Audio codec reported by yt-dlp
+
+        Returns:
+            str: Normalized codec name, or None if unknown
+        """
+        if not acodec or acodec == "none":
+            return None
+        acodec = acodec.lower()
+        if acodec.startswith("mp4a") or acodec == "aac":
+            return "aac"
+        if acodec.startswith("mp3"):
+            return "mp3"
+        if acodec.startswith("opus"):
+            return "opus"
+        return acodec.split(".")[0]
+
+    def build_command(
+        self,
+        source_path: Path,
+        output_path: Path,
+        output_format: AudioFormat,
+        bitrate: Bitrate,
+        source_codec: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        cover_path: Optional[Path] = None,
+    ) -> List[str]:
+        """Build the FFmpeg command line for a conversion.
+
+        Args:
+            source_path: Downloaded audio stream
+            output_path: Destination file
+            output_format: Target audio format
+            bitrate: Target bitrate
+            source_codec: Normalized codec of the source stream, if known
+            metadata: Tags written into the output (FFmpeg metadata keys).
+                Tags of the source stream are dropped when given
+            cover_path: JPEG image embedded as the attached front cover
+                (MP3 and M4A only)
+
+        Returns:
+            list: FFmpeg arguments
+        """
+        encoder, copy_codec, muxer, copy_args = self.CODECS[output_format]
+        if source_codec == copy_codec:
+            codec_args = ["-c:a", "copy", *copy_args]
+        else:
+            codec_args = ["-c:a", encoder, "-b:a", f"{bitrate.value}k"]
+
+        inputs = ["-i", str(source_path)]
+        stream_args = ["-vn"]
+        if cover_path:
+            inputs += ["-i", str(cover_path)]
+            stream_args = [
+                "-map", "0:a",
+                "-map", "1:v",
+                "-c:v", "copy",
+                "-disposition:v", "attached_pic",
+                "-metadata:s:v", "title=Album cover",
+                "-metadata:s:v", "comment=Cover (front)",
+            ]
+
+        tag_args = []
+        if metadata is not None:
+            tag_args = ["-map_metadata", "-1"]
+            for key, value in metadata.items():
+                tag_args += ["-metadata", f"{key}={value}"]
+        if output_format == AudioFormat.MP3 and (metadata is not None or cover_path):
+            # ID3v2.3 for maximum compatibility, as written by mutagen
+            tag_args += ["-id3v2_version", "3"]
+
+        return [
+            self.ffmpeg_path,
+            "-y",
+            "-nostdin",
+            "-loglevel", "error",
+            *inputs,
+            *stream_args,
+            *codec_args,
+            *tag_args,
+            "-f", muxer,
+            str(output_path),
+        ]
+
+    def transcode(
+        self,
+        source_path: Path,
+        output_path: Path,
+        output_format: AudioFormat = AudioFormat.M4A,
+        bitrate: Bitrate = Bitrate.B128,
+        source_codec: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        cover_path: Optional[Path] = None,
+    ) -> Path:
+        """Convert a downloaded stream into the final audio file.
+
+        The output is written to a temporary file first and moved into place
+        once FFmpeg succeeds, so a failed conversion never leaves a truncated
+        file at ``output_path``. The source stream is removed afterwards.
+        Blocks until the scheduler has a free FFmpeg slot.
+
+        Args:
+            source_path: Downloaded audio stream
+            output_path: Destination file
+            output_format: Target audio format
+            bitrate: Target bitrate
+            source_codec: Normalized codec of the source stream, if known
+            cancel_token: Token that kills the FFmpeg process when cancelled
+            metadata: Tags written into the output (see ``build_command``)
+            cover_path: Image embedded as the front cover (MP3 and M4A only)
+
+        Returns:
+            Path: The converted file
+
+        Raises:
+            TranscodeError: If FFmpeg is missing or exits with an error
+            DownloadCancelled: If the token is cancelled while waiting for a
+                slot or during the conversion
+        """
+        temp_path = output_path.with_name(f"{output_path.stem}.temp{output_path.suffix}")
+        cmd = self.build_command(
+            source_path, temp_path, output_format, bitrate, source_codec, metadata, cover_path
+        )
+        self.logger.debug(f"Running FFmpeg: {' '.join(cmd)}")
+
+        if cancel_token:
+            cancel_token.raise_if_cancelled()
+        if not check_ffmpeg_installed(self.ffmpeg_path):
+            raise TranscodeError(
+                "ffmpeg is not installed. Please install ffmpeg to use SpotifySaver."
+            )
+        with self.scheduler.slot(cancel_token):
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    **self.scheduler.popen_kwargs(),
+                )
+            except FileNotFoundError as e:
+                raise TranscodeError("ffmpeg is not installed") from e
+            self.scheduler.apply_limits(process.pid)
+
+            unregister = cancel_token.on_cancel(process.kill) if cancel_token else None
+            try:
+                _, stderr = process.communicate()
+            finally:
+                if unregister:
+                    unregister()
+
+        if cancel_token and cancel_token.cancelled:
+            temp_path.unlink(missing_ok=True)
+            cancel_token.raise_if_cancelled()
+
+        if process.returncode != 0:
+            if temp_path.exists():
+                temp_path.unlink()
+            error = stderr.decode("utf-8", errors="replace").strip()
+            raise TranscodeError(f"FFmpeg failed for {source_path.name}: {error}")
+
+        os.replace(temp_path, output_path)
+        if source_path != output_path and source_path.exists():
+            source_path.unlink()
+        return output_path
@@ -0,0 +1,140 @@
+"""Reusable yt-dlp Session Module"""
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterator, List, Tuple
+
+import yt_dlp
+
+from spotifysaver.spotlog import get_logger
+
+
+class YDLSession:
+    """Long-lived YoutubeDL instance reused for several downloads.
+
+    Creating a YoutubeDL loads the extractors, reads the cookie file and
+    sets up the HTTP handlers, so it is done once per session instead of
+    once per track. The per-track settings (output template and progress
+    hooks) are swapped in by ``download`` for the duration of each call.
+
+    A session must only be used by one thread at a time; ``YDLSessionPool``
+    hands out one session per thread.
+
+    Attributes:
+        ydl: Underlying YoutubeDL instance
+        downloads: Number of downloads run through the session
+    """
+
+    def __init__(self, opts: dict):
+        """Create the YoutubeDL instance of the session.
+
+        Args:
+            opts: yt-dlp options shared by every download of the session.
+                Hooks given here are kept; per-track hooks are passed to
+                ``download``.
+        """
+        self._progress_hooks: List[Callable[[dict], None]] = []
+        self._postprocessor_hooks: List[Callable[[dict], None]] = []
+        self.downloads = 0
+        self.ydl = yt_dlp.YoutubeDL(
+            {
+                **opts,
+                "progress_hooks": [*opts.get("progress_hooks", ()), self._on_progress],
+                "postprocessor_hooks": [
+                    *opts.get("postprocessor_hooks", ()),
+                    self._on_postprocess,
+                ],
+            }
+        )
+
+    def _on_progress(self, status: dict):
+        for hook in self._progress_hooks:
+            hook(status)
+
+    def _on_postprocess(self, status: dict):
+        for hook in self._postprocessor_hooks:
+            hook(status)
+
+    @contextmanager
+    def download(
+        self,
+        outtmpl: str,
+        progress_hooks: List[Callable[[dict], None]] = (),
+        postprocessor_hooks: List[Callable[[dict], None]] = (),
+    ) -> Iterator[yt_dlp.YoutubeDL]:
+        """Prepare the session for the download of one track.
+
+        Args:
+            outtmpl: Output template of the track
+            progress_hooks: yt-dlp progress hooks of the track
+            postprocessor_hooks: yt-dlp postprocessor hooks of the track
+
+        Yields:
+            YoutubeDL: Instance configured for the track
+        """
+        self.ydl.params["outtmpl"]["default"] = outtmpl
+        self._progress_hooks = list(progress_hooks)
+        self._postprocessor_hooks = list(postprocessor_hooks)
+        self.downloads += 1
+        try:
+            yield self.ydl
+        finally:
+            self._progress_hooks = []
+            self._postprocessor_hooks = []
+
+    def close(self):
+        """Save the cookies and close the HTTP handlers of the session."""
+        self.ydl.close()
+
+
+class YDLSessionPool:
+    """One YDLSession per worker thread and set of session options.
+
+    Sessions are keyed by the options that change the YoutubeDL instance
+    itself (format selector, cookie file, verbosity); everything that
+    changes per track is applied by ``YDLSession.download``.
+    """
+
+    def __init__(self):
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self._sessions: Dict[Tuple[int, Hashable], YDLSession] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, opts_factory: Callable[[], dict]) -> YDLSession:
+        """Get the session of the current thread for a set of options.
+
+        Args:
+            key: Hashable summary of the session options
+            opts_factory: Function building the yt-dlp options, only called
+                when the thread has no session for ``key`` yet
+
+        Returns:
+            YDLSession: Session owned by the current thread
+        """
+        session_key = (threading.get_ident(), key)
+        with self._lock:
+            session = self._sessions.get(session_key)
+        if session is None:
+            session = YDLSession(opts_factory())
+            with self._lock:
+                self._sessions[session_key] = session
+            self.logger.debug(f"Created yt-dlp session for {key}")
+        return session
+
+    def close(self):
+        """Close every session of the pool.
+
+        Call it once the workers using the pool are done; later ``get``
+        calls create new sessions.
+        """
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing yt-dlp session: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
@@ -1,16 +1,30 @@
 """Youtube Downloader Module"""
 
+import glob
 import logging
+import math
 import re
 import requests
-import yt_dlp
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from spotifysaver.services import YoutubeMusicSearcher, LrclibAPI
 from spotifysaver.metadata import NFOGenerator, MusicFileMetadata
 from spotifysaver.downloader.image_downloader import ImageDownloader
-from spotifysaver.models import Track, Album, Playlist
+from spotifysaver.downloader.transcoder import AudioTranscoder
+from spotifysaver.downloader.cancellation import CancellationToken, DownloadCancelled
+from spotifysaver.downloader.progress import TrackProgress, YDLProgressReporter
+from spotifysaver.downloader.ydl_session import YDLSession, YDLSessionPool
+from spotifysaver.downloader.job_journal import (
+    FAILED,
+    FETCHED,
+    TAGGED,
+    TRANSCODED,
+    JobJournal,
+)
+from spotifysaver.downloader.library_index import get_library_index
+from spotifysaver.models import Track, Album, Playlist, TrackMatch
 from spotifysaver.enums import AudioFormat, Bitrate
 from spotifysaver.config import Config
 from spotifysaver.spotlog import get_logger
@@ -27,20 +41,78 @@ class YouTubeDownloader:
         searcher: YouTube Music searcher instance
         lrc_client: LRC Lib API client for lyrics
         image_downloader: Image downloader instance
+        transcoder: FFmpeg transcoder for downloaded streams
+        library: Index of the files already present in base_dir
+        force: Whether to download tracks that already exist in the library
+        cancel_token: Token that stops the downloads of this instance
+        on_progress: Function receiving byte-level TrackProgress updates
+        journal: Checkpoint journal of the running batch job, if any
+        ydl_sessions: Pool of the yt-dlp sessions reused across tracks
     """
 
-    def __init__(self, base_dir: str = "Music"):
+    # yt-dlp format filters of the streams that can be remuxed into each format
+    NATIVE_CODEC_FILTERS = {
+        AudioFormat.M4A: "acodec^=mp4a",
+        AudioFormat.OPUS: "acodec=opus",
+    }
+
+    def __init__(
+        self,
+        base_dir: str = "Music",
+        force: bool = False,
+        cancel_token: Optional[CancellationToken] = None,
+        on_progress: Optional[Callable[[TrackProgress], None]] = None,
+    ):
         """Initialize the YouTube downloader.
 
         Args:
             base_dir: Base directory where music will be downloaded
+            force: Re-download tracks even if a valid copy already exists
+            cancel_token: Token checked between and during downloads.
+                Default: a new token, cancelled with ``cancel()``
+            on_progress: Function receiving TrackProgress updates (bytes,
+                speed, ETA and phase) of each track, at most every
+                Config.PROGRESS_UPDATE_INTERVAL seconds while downloading
         """
         self.logger = get_logger(f"{self.__class__.__name__}")
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(exist_ok=True)
+        self.force = force
+        self.cancel_token = cancel_token or CancellationToken()
+        self.on_progress = on_progress
+        self.journal: Optional[JobJournal] = None
+        self.library = get_library_index(self.base_dir)
         self.searcher = YoutubeMusicSearcher()
         self.lrc_client = LrclibAPI()
         self.image_downloader = ImageDownloader()
+        self.transcoder = AudioTranscoder()
+        self.ydl_sessions = YDLSessionPool()
+        self._output_claims: Dict[Path, threading.Event] = {}
+        self._output_claims_lock = threading.Lock()
+
+    def close(self):
+        """Close the yt-dlp sessions kept open between downloads.
+
+        The downloader can still be used afterwards; new sessions are
+        created on demand.
+        """
+        self.ydl_sessions.close()
+
+    def cancel(self, reason: str = "Download cancelled"):
+        """Stop the running downloads of this instance.
+
+        The current yt-dlp download and FFmpeg process are aborted, their
+        partial files removed, and remaining tracks are skipped.
+
+        Args:
+            reason: Why the downloads are cancelled
+        """
+        self.cancel_token.cancel(reason)
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the downloads of this instance have been cancelled."""
+        return self.cancel_token.cancelled
 
     @staticmethod
     def string_to_audio_format(format_str: str) -> AudioFormat:
@@ -95,16 +167,47 @@ class YouTubeDownloader:
 
         return bitrate_map[bitrate_int]
 
+    def _get_format_selector(
+        self,
+        output_format: AudioFormat = AudioFormat.M4A,
+        bitrate: Bitrate = Bitrate.B128,
+    ) -> str:
+        """Get the yt-dlp format selector for a target format.
+
+        With ``Config.YTDLP_NATIVE_FORMAT`` a stream already encoded in the
+        target codec at about the requested bitrate (at most 5% above, since
+        YouTube's nominal rates are slightly over 128/256 kbps, and not far
+        below, so a 48 kbps HE-AAC stream is not picked for 96 kbps) is
+        preferred, so ``AudioTranscoder`` only has to remux it. The best
+        audio stream remains the fallback and is re-encoded as before.
+
+        Args:
+            output_format: Audio format enum
+            bitrate: Audio bitrate enum
+
+        Returns:
+            str: yt-dlp ``format`` option
+        """
+        codec_filter = self.NATIVE_CODEC_FILTERS.get(output_format)
+        if not Config.YTDLP_NATIVE_FORMAT or not codec_filter:
+            return "bestaudio/best"
+        min_abr = math.floor(bitrate.value * 0.75)
+        max_abr = math.ceil(bitrate.value * 1.05)
+        return f"bestaudio[{codec_filter}][abr>=?{min_abr}][abr<=?{max_abr}]/bestaudio/best"
+
     def _get_ydl_opts(
         self,
-        output_path: Path,
         output_format: AudioFormat = AudioFormat.M4A,
         bitrate: Bitrate = Bitrate.B128,
     ) -> dict:
         """Get robust yt-dlp configuration with cookie support.
 
+        yt-dlp only fetches the source stream; conversion to the requested
+        format happens afterwards in ``AudioTranscoder``. The options are
+        shared by every download of a yt-dlp session, so they contain
+        nothing specific to a track (see ``_get_ydl_hooks``).
+
         Args:
-            output_path: Path where the file should be saved
             output_format: Audio format enum (M4A, MP3, OPUS). Default: M4A.
             bitrate: Bitrate enum (B96, B128, B192, B256). Default: B128.
 
@@ -114,20 +217,8 @@ class YouTubeDownloader:
         is_verbose = self.logger.getEffectiveLevel() <= logging.DEBUG
         ytm_base_url = "https://music.youtube.com"
 
-        # Use enum values instead of hardcoded validation
-        format_value = output_format.value
-        bitrate_value = bitrate.value
-
-        opts = {
-            "format": "bestaudio/best",
-            "outtmpl": str(output_path.with_suffix(f".%(ext)s")),
-            "postprocessors": [
-                {
-                    "key": "FFmpegExtractAudio",
-                    "preferredcodec": format_value,
-                    "preferredquality": str(bitrate_value),
-                }
-            ],
+        return {
+            "format": self._get_format_selector(output_format, bitrate),
             "quiet": not is_verbose,
             "verbose": is_verbose,
             "extract_flat": False,
@@ -153,9 +244,71 @@ class YouTubeDownloader:
             "skip_unavailable_fragments": True,
             "allow_unplayable_formats": True,
             "force_keyframes_at_cuts": True,
+            "progress_hooks": [self.cancel_token.progress_hook],
         }
 
-        return opts
+    def _get_ydl_session(
+        self,
+        output_format: AudioFormat = AudioFormat.M4A,
+        bitrate: Bitrate = Bitrate.B128,
+    ) -> YDLSession:
+        """Get the yt-dlp session of the current worker thread.
+
+        Sessions are keyed by the options that end up in the YoutubeDL
+        instance, so changing the format selector, the cookie file or the
+        log level opens a new one instead of reusing a stale session.
+
+        Args:
+            output_format: Audio format enum
+            bitrate: Audio bitrate enum
+
+        Returns:
+            YDLSession: Session to download the source stream with
+        """
+        key = (
+            self._get_format_selector(output_format, bitrate),
+            Config.YTDLP_COOKIES_PATH,
+            self.logger.getEffectiveLevel() <= logging.DEBUG,
+        )
+        return self.ydl_sessions.get(
+            key, lambda: self._get_ydl_opts(output_format, bitrate)
+        )
+
+    def _get_ydl_hooks(
+        self, output_path: Path, track_name: Optional[str] = None
+    ) -> Tuple[List[Callable], List[Callable]]:
+        """Get the yt-dlp hooks reporting the progress of one track.
+
+        Args:
+            output_path: Path where the final file will be saved
+            track_name: Name reported in the progress updates. Default: the
+                file name
+
+        Returns:
+            tuple: (progress hooks, postprocessor hooks)
+        """
+        if not self.on_progress:
+            return [], []
+        reporter = YDLProgressReporter(
+            track_name or output_path.stem,
+            self.on_progress,
+            Config.PROGRESS_UPDATE_INTERVAL,
+        )
+        return [reporter.progress_hook], [reporter.postprocessor_hook]
+
+    def _report_phase(self, track: Track, phase: str):
+        """Report a processing phase of a track to ``on_progress``.
+
+        Args:
+            track: Track being processed
+            phase: "transcoding", "tagging" or "finished"
+        """
+        if not self.on_progress:
+            return
+        try:
+            self.on_progress(TrackProgress(track.name, phase))
+        except Exception as e:
+            self.logger.debug(f"Progress callback failed: {e}")
 
     def _get_ydl_logger(self):
         """Create a yt-dlp logger that integrates with the application logger.
@@ -174,6 +327,9 @@ class YouTubeDownloader:
     ) -> Path:
         """Generate output paths: Music/Artist/Album (Year)/Track.m4a.
 
+        The album directory is created; use ``_build_output_path`` to only
+        compute the path.
+
         Args:
             track: Track object containing metadata
             album_artist: Artist name for album organization
@@ -182,6 +338,26 @@ class YouTubeDownloader:
         Returns:
             Path: Complete file path where the track should be saved
         """
+        output_path = self._build_output_path(track, album_artist, output_format)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return output_path
+
+    def _build_output_path(
+        self,
+        track: Track,
+        album_artist: str = None,
+        output_format: AudioFormat = AudioFormat.M4A,
+    ) -> Path:
+        """Compute the output path of a track without touching the filesystem.
+
+        Args:
+            track: Track object containing metadata
+            album_artist: Artist name for album organization
+            output_format: Audio format enum
+
+        Returns:
+            Path: Complete file path where the track would be saved
+        """
         artist_name = (
             album_artist or track.artists[0] if track.artists else "Unknown Artist"
         )
@@ -190,13 +366,283 @@ class YouTubeDownloader:
         year = track.release_date[:4] if track.release_date else "Unknown"
         dir_path = self.base_dir / artist_name / f"{album_name} ({year})"
 
-        dir_path.mkdir(parents=True, exist_ok=True)
         track_name = self._sanitize_filename(track.name or "Unknown Track")
         return dir_path / f"{track.number} - {artist_name} - {track_name}.{output_format.value}"
 
+    @staticmethod
+    def _get_source_template(output_path: Path) -> Path:
+        """Get the yt-dlp output template for the not yet converted stream.
+
+        Args:
+            output_path: Path of the final audio file
+
+        Returns:
+            Path: Template like ``Track.source.%(ext)s`` next to the final file
+        """
+        return output_path.with_suffix(".source.%(ext)s")
+
+    def _claim_output(self, output_path: Path):
+        """Wait until no other download of this instance writes an output path, then claim it.
+
+        A playlist can list the same track twice; with parallel workers both
+        copies would share the same stream and temporary files. The second
+        one waits for the first and then finds its file already in the
+        library. Release the claim with ``_release_output``.
+
+        Args:
+            output_path: Path of the final audio file
+        """
+        while True:
+            with self._output_claims_lock:
+                claim = self._output_claims.get(output_path)
+                if claim is None:
+                    self._output_claims[output_path] = threading.Event()
+                    return
+            claim.wait()
+
+    def _release_output(self, output_path: Path):
+        """Release an output path claimed with ``_claim_output``.
+
+        Args:
+            output_path: Path of the final audio file
+        """
+        with self._output_claims_lock:
+            claim = self._output_claims.pop(output_path)
+        claim.set()
+
+    def _cleanup_partial(self, output_path: Path):
+        """Remove the final file and any leftover source streams of a failed download.
+
+        Args:
+            output_path: Path of the final audio file
+        """
+        if output_path.exists():
+            self.logger.debug(f"Removing corrupt file: {output_path}")
+            output_path.unlink()
+        pattern = glob.escape(output_path.stem) + ".source.*"
+        for leftover in output_path.parent.glob(pattern):
+            self.logger.debug(f"Removing partial stream: {leftover}")
+            leftover.unlink(missing_ok=True)
+
+    def _fetch_audio(
+        self,
+        yt_url: str,
+        output_path: Path,
+        output_format: AudioFormat = AudioFormat.M4A,
+        bitrate: Bitrate = Bitrate.B128,
+        track_name: Optional[str] = None,
+    ) -> Tuple[Path, Optional[str]]:
+        """Download the source audio stream of a track without converting it.
+
+        Args:
+            yt_url: YouTube Music URL of the track
+            output_path: Path of the final audio file
+            output_format: Audio format enum
+            bitrate: Audio bitrate enum
+            track_name: Name reported in the progress updates
+
+        Returns:
+            tuple: (Path of the downloaded stream, normalized source codec)
+        """
+        self.cancel_token.raise_if_cancelled()
+        session = self._get_ydl_session(output_format, bitrate)
+        progress_hooks, postprocessor_hooks = self._get_ydl_hooks(output_path, track_name)
+        with session.download(
+            str(self._get_source_template(output_path)), progress_hooks, postprocessor_hooks
+        ) as ydl:
+            info = ydl.extract_info(yt_url, download=True)
+            downloads = info.get("requested_downloads") or []
+            source_path = (
+                Path(downloads[0]["filepath"])
+                if downloads and downloads[0].get("filepath")
+                else Path(ydl.prepare_filename(info))
+            )
+
+        source_codec = AudioTranscoder.normalize_codec(info.get("acodec"))
+        return source_path, source_codec
+
+    def _transcode_audio(
+        self,
+        source_path: Path,
+        output_path: Path,
+        output_format: AudioFormat = AudioFormat.M4A,
+        bitrate: Bitrate = Bitrate.B128,
+        source_codec: Optional[str] = None,
+        metadata: Optional[MusicFileMetadata] = None,
+    ) -> Path:
+        """Convert a downloaded stream into the final audio file.
+
+        Args:
+            source_path: Path of the downloaded stream
+            output_path: Path of the final audio file
+            output_format: Audio format enum
+            bitrate: Audio bitrate enum
+            source_codec: Normalized codec of the downloaded stream
+            metadata: Metadata written by FFmpeg during the conversion (see
+                ``_prepare_metadata``)
+
+        Returns:
+            Path: Path of the converted file
+        """
+        if metadata is None:
+            return self.transcoder.transcode(
+                source_path, output_path, output_format, bitrate, source_codec, self.cancel_token
+            )
+
+        cover_path = temp_cover = None
+        if metadata.cover_data and output_path.suffix.lower() in metadata.FFMPEG_COVER_SUFFIXES:
+            cover_path = self.image_downloader.cache.path(metadata.track.cover_url)
+            if not cover_path:
+                # Named like the source stream so _cleanup_partial removes it too
+                cover_path = temp_cover = output_path.with_suffix(".source.cover.jpg")
+                temp_cover.write_bytes(metadata.cover_data)
+        try:
+            return self.transcoder.transcode(
+                source_path,
+                output_path,
+                output_format,
+                bitrate,
+                source_codec,
+                self.cancel_token,
+                metadata.ffmpeg_tags(),
+                cover_path,
+            )
+        finally:
+            if temp_cover:
+                temp_cover.unlink(missing_ok=True)
+
+    def _prepare_metadata(self, track: Track, output_path: Path) -> Optional[MusicFileMetadata]:
+        """Prepare the metadata FFmpeg writes while converting a track.
+
+        With ``Config.FFMPEG_TAGGING`` the tags and the cover are written by
+        the FFmpeg conversion, so the file is produced already tagged
+        instead of being rewritten by mutagen afterwards.
+
+        Args:
+            track: Track object with metadata
+            output_path: Path of the final audio file
+
+        Returns:
+            MusicFileMetadata: Metadata to pass to ``_transcode_audio`` and
+                ``_tag_audio``, or None when tagging is left to mutagen
+        """
+        if not Config.FFMPEG_TAGGING:
+            return None
+        return MusicFileMetadata(
+            file_path=output_path, track=track, cover_data=self._download_cover(track)
+        )
+
+    def _tag_audio(
+        self,
+        track: Track,
+        output_path: Path,
+        download_lyrics: bool = False,
+        metadata: Optional[MusicFileMetadata] = None,
+    ) -> Track:
+        """Add metadata, cover art and (optionally) lyrics to a converted file.
+
+        Args:
+            track: Track object with metadata
+            output_path: Path of the converted audio file
+            download_lyrics: Whether to download lyrics
+            metadata: Metadata already written by FFmpeg; only the fields
+                FFmpeg cannot set are added
+
+        Returns:
+            Track: Track updated with its lyrics status
+        """
+        if metadata is not None:
+            metadata.add_remaining_metadata()
+        else:
+            cover_data = self._download_cover(track)
+            metadata = MusicFileMetadata(
+                file_path=output_path, track=track, cover_data=cover_data
+            )
+            metadata.add_metadata()
+
+        updated_track = track
+        if download_lyrics:
+            success = self._save_lyrics(track, output_path)
+            updated_track = track.with_lyrics_status(success)
+
+        self.library.record(output_path, track.source_type)
+        return updated_track
+
+    def _checkpoint(self, track: Track, state: str, **extra):
+        """Record a state change of a track in the job journal, if any.
+
+        Args:
+            track: Track whose state changed
+            state: New state (RESOLVED, FETCHED, TRANSCODED, TAGGED or FAILED)
+            **extra: Additional fields of the journal entry
+        """
+        if self.journal:
+            self.journal.record(track, state, **extra)
+
+    def _resolve(self, track: Track) -> Optional[TrackMatch]:
+        """Resolve a track to a YouTube Music match.
+
+        A match recorded in the journal by a previous run of the job is
+        reused; new matches are recorded.
+
+        Args:
+            track: Track to resolve
+
+        Returns:
+            TrackMatch: Selected match, or None if no candidate passed
+        """
+        match = self.journal.get_match(track) if self.journal else None
+        if match:
+            return match
+
+        match = self.searcher.resolve_track(track)
+        if match and self.journal:
+            self.journal.record_match(track, match)
+        elif not match:
+            self._checkpoint(track, FAILED, error="No match found")
+        return match
+
+    def _find_existing(
+        self, track: Track, output_path: Path, download_lyrics: bool = False
+    ) -> Optional[Track]:
+        """Check the job journal and the library index for a valid copy of a track.
+
+        Runs before any search, download or conversion so that re-runs skip
+        tracks that are already on disk. Tracks completed by a previous run
+        of a resumed job are skipped even with ``force``. Missing lyrics are
+        still fetched when requested.
+
+        Args:
+            track: Track object with metadata
+            output_path: Path where the track would be saved
+            download_lyrics: Whether lyrics were requested
+
+        Returns:
+            Track: Track updated with its lyrics status, or None if it has
+                to be downloaded
+        """
+        if self.journal and self.journal.is_done(track, output_path):
+            self.logger.info(f"Already done by this job, skipping: {output_path}")
+            return track
+        if self.force or not self.library.is_present(output_path, track.uri, track.name):
+            return None
+
+        self.logger.info(f"Already in library, skipping: {output_path}")
+        self.library.claim(output_path, track.source_type)
+        self._checkpoint(track, TAGGED, path=str(output_path))
+        if not download_lyrics:
+            return track
+        has_lyrics = output_path.with_suffix(".lrc").exists() or self._save_lyrics(
+            track, output_path
+        )
+        return track.with_lyrics_status(has_lyrics)
+
     def _download_cover(self, track: Track) -> Optional[bytes]:
         """Download cover art from Spotify.
 
+        Covers are cached by ``ImageDownloader``, so the tracks of an album
+        and its cover file share one download.
+
         Args:
             track: Track object containing cover URL
 
@@ -315,56 +761,90 @@ class YouTubeDownloader:
         bitrate: Bitrate = Bitrate.B128,
         album_artist: str = None,
         download_lyrics: bool = False,
+        match: Optional[TrackMatch] = None,
     ) -> tuple[Optional[Path], Optional[Track]]:
         """Download a track from YouTube Music with Spotify metadata.
 
         Args:
             track: Track object with metadata
-            yt_url: YouTube Music URL for the track
             album_artist: Artist name for file organization
             download_lyrics: Whether to download lyrics
             output_format: Audio format enum (M4A, MP3, OPUS).
             bitrate: Audio bitrate enum (B96, B128, B192, B256).
+            match: Already resolved YouTube Music match. When omitted the
+                track is searched here.
 
         Returns:
             tuple: (Downloaded file path, Updated track) or (None, None) on error
+                or cancellation
         """
+        if self.cancelled:
+            return None, None
+
         output_path = self._get_output_path(track, album_artist, output_format)
-        yt_url = self.searcher.search_track(track)
-        ydl_opts = self._get_ydl_opts(output_path, output_format, bitrate)
+        self._claim_output(output_path)
+        try:
+            return self._download_claimed(
+                track, output_path, output_format, bitrate, download_lyrics, match
+            )
+        finally:
+            self._release_output(output_path)
 
-        if not yt_url:
+    def _download_claimed(
+        self,
+        track: Track,
+        output_path: Path,
+        output_format: AudioFormat,
+        bitrate: Bitrate,
+        download_lyrics: bool,
+        match: Optional[TrackMatch],
+    ) -> tuple[Optional[Path], Optional[Track]]:
+        """Download a track to an output path claimed by ``download_track``."""
+        existing = self._find_existing(track, output_path, download_lyrics)
+        if existing:
+            return output_path, existing
+
+        if match is None:
+            match = self._resolve(track)
+
+        if not match:
             self.logger.error(f"No match found for: {track.name}")
             return None, None
 
         try:
             # 1. Descarga el audio
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([yt_url])
+            source_path, source_codec = self._fetch_audio(
+                match.url, output_path, output_format, bitrate, track.name
+            )
+            self._checkpoint(track, FETCHED)
 
-            # 2. Add metadata and cover art
-            cover_data = self._download_cover(track)
-            metadata = MusicFileMetadata(
-                file_path=output_path, track=track, cover_data=cover_data
+            # 2. Convert to the requested format, tagging it on the way
+            metadata = self._prepare_metadata(track, output_path)
+            self._report_phase(track, "transcoding")
+            self._transcode_audio(
+                source_path, output_path, output_format, bitrate, source_codec, metadata
             )
-            metadata.add_metadata()
+            self._checkpoint(track, TRANSCODED)
 
-            # 3. Lyrics handling
-            updated_track = track
-            if download_lyrics:
-                success = self._save_lyrics(track, output_path)
-                updated_track = track.with_lyrics_status(success)
+            # 3. Add the remaining metadata and lyrics
+            self._report_phase(track, "tagging")
+            updated_track = self._tag_audio(track, output_path, download_lyrics, metadata)
+            self._checkpoint(track, TAGGED, path=str(output_path))
+            self._report_phase(track, "finished")
 
             self.logger.info(f"Download completed: {output_path}")
             return output_path, updated_track
 
+        except DownloadCancelled:
+            self.logger.info(f"Download cancelled: {track.name}")
+            self._cleanup_partial(output_path)
+            return None, None
         except Exception as e:
             self.logger.error(f"Error downloading {track.name}: {e}", exc_info=True)
-            if output_path.exists():
-                self.logger.debug(f"Removing corrupt file: {output_path}")
-                output_path.unlink()
+            self._cleanup_partial(output_path)
+            self._checkpoint(track, FAILED, error=str(e))
             return None, None
-        
+
     def download_album(
         self,
         album: Album,
@@ -385,6 +865,9 @@ class YouTubeDownloader:
             cover: Whether to download album cover
         """
         for track in album.tracks:
+            if self.cancelled:
+                self.logger.info(f"Album download cancelled: {album.name}")
+                return
             self.download_track(
                 track=track,
                 output_format=output_format,
@@ -446,6 +929,9 @@ class YouTubeDownloader:
 
         # Descarga de tracks
         for track in playlist.tracks:
+            if self.cancelled:
+                self.logger.info(f"Playlist download cancelled: {playlist.name}")
+                return success
             try:
                 # Descargar URL de YouTube
                 _, updated_track = self.download_track(
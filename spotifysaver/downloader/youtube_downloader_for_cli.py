@@ -1,15 +1,65 @@
 """Youtube Downloader Module"""
 
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, List, Optional
 
-from spotifysaver.services import YoutubeMusicSearcher, LrclibAPI
+from spotifysaver.config import Config
 from spotifysaver.metadata import NFOGenerator
 from spotifysaver.downloader.youtube_downloader import YouTubeDownloader
-from spotifysaver.downloader.image_downloader import ImageDownloader
+from spotifysaver.downloader.pipeline import DownloadPipeline, PipelineStage, TrackJob
+from spotifysaver.downloader.cancellation import CancellationToken
+from spotifysaver.downloader.progress import TrackProgress
+from spotifysaver.downloader.job_journal import (
+    FAILED,
+    FETCHED,
+    TAGGED,
+    TRANSCODED,
+    JobJournal,
+)
 from spotifysaver.models import Track, Album, Playlist
 from spotifysaver.enums import AudioFormat, Bitrate
-from spotifysaver.spotlog import get_logger
+
+
+class _CountingIterator:
+    """Iterator that counts the tracks taken from the wrapped iterable.
+
+    Attributes:
+        count: Tracks taken so far, duplicates included
+        uris: Unique URIs of the tracks taken so far
+    """
+
+    def __init__(self, items: Iterable[Track]):
+        self._items = iter(items)
+        self.count = 0
+        self.uris = set()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = next(self._items)
+        self.count += 1
+        self.uris.add(item.uri)
+        return item
+
+
+def _map_bounded(executor: ThreadPoolExecutor, fn: Callable, items: Iterable, window: int) -> Iterator:
+    """Like ``executor.map``, but pulls at most ``window`` items ahead of the results.
+
+    ``executor.map`` submits the whole iterable up front, which would
+    materialize a streamed track list; results are still yielded in order.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 class YouTubeDownloaderForCLI(YouTubeDownloader):
@@ -23,21 +73,243 @@ class YouTubeDownloaderForCLI(YouTubeDownloader):
         searcher: YouTube Music searcher instance
         lrc_client: LRC Lib API client for lyrics
         image_downloader: Image downloader instance
+        transcoder: FFmpeg transcoder for downloaded streams
+        library: Index of the files already present in base_dir
+        force: Whether to download tracks that already exist in the library
+        cancel_token: Token that stops the downloads of this instance
+        on_progress: Function receiving byte-level TrackProgress updates
+        pipeline: Staged pipeline of the current (or last) pipelined download
     """
 
-    def __init__(self, base_dir: str = "Music"):
+    def __init__(
+        self,
+        base_dir: str = "Music",
+        force: bool = False,
+        cancel_token: Optional[CancellationToken] = None,
+        on_progress: Optional[Callable[[TrackProgress], None]] = None,
+    ):
         """Initialize the YouTube downloader.
 
         Args:
             base_dir: Base directory where music will be downloaded
+            force: Re-download tracks even if a valid copy already exists
+            cancel_token: Token checked between and during downloads.
+                Default: a new token, cancelled with ``cancel()``
+            on_progress: Function receiving TrackProgress updates (bytes,
+                speed, ETA and phase) of each track
+        """
+        super().__init__(base_dir, force, cancel_token, on_progress)
+        self.pipeline: Optional[DownloadPipeline] = None
+
+    @contextmanager
+    def _job_journal(self, job_id: str, tracks: Iterable[Track], resume: bool):
+        """Keep a checkpoint journal while a batch job runs.
+
+        The journal is removed when every track ends up tagged, and kept
+        (for ``resume``) when tracks failed or the job was interrupted.
+
+        Args:
+            job_id: ID of the job (see ``JobJournal.job_id``)
+            tracks: Tracks of the job, possibly a lazy iterator
+            resume: Continue from the journal of a previous run of the same job
+
+        Yields:
+            iterator: The tracks, with a ``count`` of the ones consumed so far
+        """
+        job_tracks = _CountingIterator(tracks)
+        self.journal = JobJournal.for_job(self.base_dir, job_id, resume)
+        try:
+            yield job_tracks
+        finally:
+            journal, self.journal = self.journal, None
+            journal.close(not self.cancelled and journal.is_complete(len(job_tracks.uris)))
+
+    def _run_track_jobs(
+        self,
+        tracks: Iterable[Track],
+        job: Callable[[Track], bool],
+        workers: int = 1,
+        progress_callback: Optional[callable] = None,
+        total: Optional[int] = None,
+    ) -> int:
+        """Run a per-track download job over a list or stream of tracks.
+
+        With ``workers > 1`` whole per-track pipelines (search, download,
+        transcode, tagging, lyrics) run in a thread pool. Progress callbacks
+        are serialized through a lock and always receive a monotonically
+        increasing index, so consumers see the same ordered sequence as in
+        sequential mode. Tracks are pulled from ``tracks`` only a few ahead
+        of the workers, so a lazy iterator is never materialized. Once the
+        cancel token is set, tracks that have not started yet are skipped;
+        an interrupt (Ctrl+C) cancels the token so running workers stop too.
+
+        Args:
+            tracks: Tracks to process
+            job: Function that downloads one track and returns True on success
+            workers: Maximum number of tracks processed at the same time
+            progress_callback: Function that receives (current_track, total_tracks, track_name)
+            total: Number of tracks, required when ``tracks`` has no length
+
+        Returns:
+            int: Number of tracks for which the job succeeded
         """
-        self.logger = get_logger(f"{self.__class__.__name__}")
-        self.base_dir = Path(base_dir)
-        self.base_dir.mkdir(exist_ok=True)
-        self.searcher = YoutubeMusicSearcher()
-        self.lrc_client = LrclibAPI()
-        self.image_downloader = ImageDownloader()
+        total = len(tracks) if total is None else total
+        progress_lock = threading.Lock()
+        started = 0
+
+        def run(track: Track) -> bool:
+            nonlocal started
+            if self.cancelled:
+                return False
+            try:
+                if progress_callback:
+                    with progress_lock:
+                        started += 1
+                        progress_callback(started, total, track.name)
+                return bool(job(track))
+            except Exception as e:
+                self.logger.error(f"Error en track {track.name}: {str(e)}")
+                return False
+
+        try:
+            if workers <= 1 or total <= 1:
+                results = map(run, tracks)
+                return sum(1 for ok in self._interruptible(results) if ok)
+
+            workers = min(workers, total)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="track-worker") as executor:
+                # Cancel before leaving the with block, which waits for the workers
+                results = _map_bounded(executor, run, tracks, workers * 2)
+                return sum(1 for ok in self._interruptible(results) if ok)
+        finally:
+            # Each worker kept its yt-dlp session for the whole batch
+            self.ydl_sessions.close()
+
+    def _interruptible(self, results):
+        """Yield job results, cancelling the token on Ctrl+C."""
+        try:
+            yield from results
+        except KeyboardInterrupt:
+            self.cancel("Interrupted")
+            raise
+
+    def _run_track_pipeline(
+        self,
+        tracks: Iterable[Track],
+        album_artist: Optional[str] = None,
+        output_format: AudioFormat = AudioFormat.M4A,
+        bitrate: Bitrate = Bitrate.B128,
+        download_lyrics: bool = False,
+        progress_callback: Optional[callable] = None,
+        total: Optional[int] = None,
+    ) -> int:
+        """Download tracks through the staged search/fetch/transcode/tag pipeline.
 
+        Each stage runs with its own concurrency limit (see the
+        ``PIPELINE_*_WORKERS`` settings) and hands work to the next one
+        through a bounded queue. The pipeline is kept in ``self.pipeline`` so
+        callers can poll its per-stage statistics while it runs.
+
+        Args:
+            tracks: Tracks to download
+            album_artist: Artist name for file organization
+            output_format: Audio format enum
+            bitrate: Audio bitrate enum
+            download_lyrics: Whether to download lyrics
+            progress_callback: Function that receives (current_track, total_tracks, track_name)
+            total: Number of tracks, required when ``tracks`` has no length
+
+        Returns:
+            int: Number of tracks downloaded successfully
+        """
+        total = len(tracks) if total is None else total
+        progress_lock = threading.Lock()
+        started = 0
+
+        def search(job: TrackJob) -> Optional[TrackJob]:
+            nonlocal started
+            self.cancel_token.raise_if_cancelled()
+            if progress_callback:
+                with progress_lock:
+                    started += 1
+                    progress_callback(started, total, job.track.name)
+            # Duplicates of a track wait here until the first copy leaves the pipeline
+            self._claim_output(job.output_path)
+            job.claimed = True
+            job.updated_track = self._find_existing(job.track, job.output_path, download_lyrics)
+            if job.updated_track:
+                job.skipped = True
+                return job
+            job.match = self._resolve(job.track)
+            if not job.match:
+                self.logger.error(f"No match found for: {job.track.name}")
+                return None
+            return job
+
+        def fetch(job: TrackJob) -> TrackJob:
+            if job.skipped:
+                return job
+            job.source_path, job.source_codec = self._fetch_audio(
+                job.match.url, job.output_path, output_format, bitrate, job.track.name
+            )
+            self._checkpoint(job.track, FETCHED)
+            return job
+
+        def transcode(job: TrackJob) -> TrackJob:
+            if job.skipped:
+                return job
+            job.metadata = self._prepare_metadata(job.track, job.output_path)
+            self._report_phase(job.track, "transcoding")
+            self._transcode_audio(
+                job.source_path,
+                job.output_path,
+                output_format,
+                bitrate,
+                job.source_codec,
+                job.metadata,
+            )
+            self._checkpoint(job.track, TRANSCODED)
+            return job
+
+        def tag(job: TrackJob) -> TrackJob:
+            if job.skipped:
+                return job
+            self._report_phase(job.track, "tagging")
+            job.updated_track = self._tag_audio(
+                job.track, job.output_path, download_lyrics, job.metadata
+            )
+            self._checkpoint(job.track, TAGGED, path=str(job.output_path))
+            self._report_phase(job.track, "finished")
+            self.logger.info(f"Download completed: {job.output_path}")
+            return job
+
+        def on_complete(job: TrackJob, success: bool):
+            if not success:
+                if job.claimed:
+                    self._cleanup_partial(job.output_path)
+                if job.match and not self.cancelled:
+                    self._checkpoint(job.track, FAILED)
+            if job.claimed:
+                self._release_output(job.output_path)
+
+        self.pipeline = DownloadPipeline(
+            [
+                PipelineStage("search", search, Config.PIPELINE_SEARCH_WORKERS),
+                PipelineStage("fetch", fetch, Config.PIPELINE_FETCH_WORKERS),
+                PipelineStage("transcode", transcode, Config.PIPELINE_TRANSCODE_WORKERS),
+                PipelineStage("tag", tag, Config.PIPELINE_TAG_WORKERS),
+            ],
+            queue_size=Config.PIPELINE_QUEUE_SIZE,
+            cancel_token=self.cancel_token,
+        )
+        jobs = (
+            TrackJob(track, self._get_output_path(track, album_artist, output_format))
+            for track in tracks
+        )
+        try:
+            return self.pipeline.run(jobs, on_complete)
+        finally:
+            self.ydl_sessions.close()
 
     def download_track_cli(
         self, 
@@ -67,10 +339,7 @@ class YouTubeDownloaderForCLI(YouTubeDownloader):
             if progress_callback:
                 progress_callback(1, 1, track.name)
 
-            yt_url = self.searcher.search_track(track)
-            if not yt_url:
-                raise ValueError(f"No se encontró en YouTube Music: {track.name}")
-
+            # download_track skips tracks already in the library and resolves the match
             audio_path, updated_track = self.download_track(
                 track=track,
                 album_artist=album_artist,
@@ -90,6 +359,63 @@ class YouTubeDownloaderForCLI(YouTubeDownloader):
             self.logger.error(f"Error al descargar el track {track.name}: {str(e)}", exc_info=True)
             return None, None
 
+    def download_tracks_cli(
+        self,
+        tracks: List[Track],
+        output_format: AudioFormat = AudioFormat.M4A,
+        bitrate: Bitrate = Bitrate.B128,
+        download_lyrics: bool = False,
+        progress_callback: Optional[callable] = None,
+        workers: int = 1,
+        pipeline: bool = False,
+        resume: bool = False,
+    ) -> tuple[int, int]:
+        """Download a list of unrelated tracks, e.g. from a multi-URL job.
+
+        Every track is organized like a single track download
+        (Artist/Album (Year)/Track), with the same worker, pipeline and
+        resume options as albums and playlists.
+
+        Args:
+            tracks: Tracks to download
+            output_format: Audio format enum
+            bitrate: Audio bitrate enum
+            download_lyrics: Whether to download lyrics
+            progress_callback: Function that receives (current_track, total_tracks, track_name)
+            workers: Number of tracks to download in parallel (default: 1)
+            pipeline: Whether to use the staged search/fetch/transcode/tag pipeline
+            resume: Whether to skip the work done by a previous, interrupted
+                    run of the same track list (see JobJournal)
+
+        Returns:
+            tuple: (successful_downloads, total_tracks)
+        """
+        if not tracks:
+            return 0, 0
+
+        def download_one(track: Track) -> bool:
+            audio_path, _ = self.download_track(
+                track=track,
+                download_lyrics=download_lyrics,
+                output_format=output_format,
+                bitrate=bitrate,
+            )
+            return audio_path is not None
+
+        job_id = JobJournal.job_id("tracks", tracks, output_format.value)
+        with self._job_journal(job_id, tracks, resume) as job_tracks:
+            if pipeline:
+                success = self._run_track_pipeline(
+                    job_tracks, None, output_format, bitrate, download_lyrics, progress_callback,
+                    len(tracks),
+                )
+            else:
+                success = self._run_track_jobs(
+                    job_tracks, download_one, workers, progress_callback, len(tracks)
+                )
+
+        return success, len(tracks)
+
     def download_album_cli(
         self,
         album: Album,
@@ -99,6 +425,9 @@ class YouTubeDownloaderForCLI(YouTubeDownloader):
         nfo: bool = False,  # Generate NFO
         cover: bool = False,  # Download cover art
         progress_callback: Optional[callable] = None,  # Progress callback
+        workers: int = 1,  # Tracks downloaded in parallel
+        pipeline: bool = False,  # Use the staged download pipeline
+        resume: bool = False,  # Continue from the journal of a previous run
     ) -> tuple[int, int]:  # Returns (success, total)
         """Download a complete album with progress support.
 
@@ -111,6 +440,11 @@ class YouTubeDownloaderForCLI(YouTubeDownloader):
             cover: Whether to download cover art
             progress_callback: Function that receives (current_track, total_tracks, track_name).
                             Example: lambda idx, total, name: print(f"{idx}/{total} {name}")
+            workers: Number of tracks to download in parallel (default: 1)
+            pipeline: Whether to use the staged search/fetch/transcode/tag pipeline
+                      instead of per-track workers
+            resume: Whether to skip the work done by a previous, interrupted
+                    run of the same album (see JobJournal)
 
         Returns:
             tuple: (successful_downloads, total_tracks)
@@ -119,30 +453,35 @@ class YouTubeDownloaderForCLI(YouTubeDownloader):
             self.logger.error("Álbum no contiene tracks.")
             return 0, 0
 
-        success = 0
-        for idx, track in enumerate(album.tracks, 1):
-            try:
-                if progress_callback:
-                    progress_callback(idx, len(album.tracks), track.name)
-
-                yt_url = self.searcher.search_track(track)
-                if not yt_url:
-                    raise ValueError(f"No se encontró en YouTube Music: {track.name}")
-
-                audio_path, _ = self.download_track(
-                    track=track,
-                    album_artist=album.artists[0],
-                    download_lyrics=download_lyrics,
-                    output_format=output_format,
-                    bitrate=bitrate,
+        def download_one(track: Track) -> bool:
+            audio_path, _ = self.download_track(
+                track=track,
+                album_artist=album.artists[0],
+                download_lyrics=download_lyrics,
+                output_format=output_format,
+                bitrate=bitrate,
+            )
+            return audio_path is not None
+
+        job_id = JobJournal.job_id("album", album.tracks, output_format.value)
+        with self._job_journal(job_id, album.tracks, resume) as tracks:
+            if pipeline:
+                success = self._run_track_pipeline(
+                    tracks,
+                    album.artists[0],
+                    output_format,
+                    bitrate,
+                    download_lyrics,
+                    progress_callback,
+                    len(album.tracks),
+                )
+            else:
+                success = self._run_track_jobs(
+                    tracks, download_one, workers, progress_callback, len(album.tracks)
                 )
-                if audio_path:
-                    success += 1
-            except Exception as e:
-                self.logger.error(f"Error en track {track.name}: {str(e)}")
 
         # Generar metadatos solo si hay éxitos
-        if success > 0:
+        if success > 0 and not self.cancelled:
             output_dir = self._get_album_dir(album)
             if nfo:
                 NFOGenerator.generate(album, output_dir)
@@ -162,9 +501,18 @@ class YouTubeDownloaderForCLI(YouTubeDownloader):
         download_lyrics: bool = False,
         cover: bool = False,
         progress_callback: Optional[callable] = None,
+        workers: int = 1,
+        pipeline: bool = False,
+        resume: bool = False,
+        tracks: Optional[Iterable[Track]] = None,
+        job_id: Optional[str] = None,
     ) -> tuple[int, int]:
         """Download a complete playlist with progress bar support.
 
+        The tracks can be streamed (see ``SpotifyAPI.iter_playlist_tracks``)
+        so downloads start while later pages of the playlist are still being
+        fetched.
+
         Args:
             playlist: Playlist object to download
             output_format: Audio format enum
@@ -173,39 +521,64 @@ class YouTubeDownloaderForCLI(YouTubeDownloader):
             cover: Whether to download playlist cover
             progress_callback: Function that receives (current_track, total_tracks, track_name).
                             Example: lambda idx, total, name: print(f"{idx}/{total} {name}")
+            workers: Number of tracks to download in parallel (default: 1)
+            pipeline: Whether to use the staged search/fetch/transcode/tag pipeline
+                      instead of per-track workers
+            resume: Whether to skip the work done by a previous, interrupted
+                    run of the same playlist (see JobJournal)
+            tracks: Tracks to download instead of ``playlist.tracks``, e.g. a
+                    lazy iterator; ``playlist.total_tracks`` gives their number
+            job_id: Journal job ID. Default: the ID of a full download of the
+                    playlist (see ``JobJournal.playlist_job_id``); callers
+                    downloading only part of it must pass their own
 
         Returns:
             tuple: (successful_downloads, total_tracks)
         """
-        if not playlist.name or not playlist.tracks:
+        if tracks is None:
+            tracks = playlist.tracks
+            total = len(playlist.tracks)
+        else:
+            total = playlist.total_tracks or 0
+        if not playlist.name or not total:
             self.logger.error("Playlist inválida: sin nombre o tracks vacíos")
             return 0, 0
 
         output_dir = self.base_dir / playlist.name
         output_dir.mkdir(parents=True, exist_ok=True)
-        success = 0
-
-        for idx, track in enumerate(playlist.tracks, 1):
-            try:
-                # Notificar progreso (si hay callback)
-                if progress_callback:
-                    progress_callback(idx, len(playlist.tracks), track.name)
-
-                _, updated_track = self.download_track(
-                    track,
-                    output_format=output_format,
-                    bitrate=bitrate,
-                    download_lyrics=download_lyrics,
+        def download_one(track: Track) -> bool:
+            _, updated_track = self.download_track(
+                track,
+                output_format=output_format,
+                bitrate=bitrate,
+                download_lyrics=download_lyrics,
+            )
+            return updated_track is not None
+
+        job_id = job_id or JobJournal.playlist_job_id(playlist, output_format.value)
+        with self._job_journal(job_id, tracks, resume) as job_tracks:
+            if pipeline:
+                success = self._run_track_pipeline(
+                    job_tracks,
+                    None,
+                    output_format,
+                    bitrate,
+                    download_lyrics,
+                    progress_callback,
+                    total,
                 )
-                if updated_track:
-                    success += 1
-            except Exception as e:
-                self.logger.error(f"Error en {track.name}: {str(e)}")
+            else:
+                success = self._run_track_jobs(
+                    job_tracks, download_one, workers, progress_callback, total
+                )
+        if not self.cancelled:
+            # Streamed playlists count removed and local items in total_tracks
+            total = job_tracks.count
 
-        if success > 0 and cover and playlist.cover_url:
+        if success > 0 and cover and playlist.cover_url and not self.cancelled:
             try:
                 self._save_cover_album(playlist.cover_url, output_dir / "cover.jpg")
             except Exception as e:
                 self.logger.error(f"Error downloading playlist cover: {str(e)}")
 
-        return success, len(playlist.tracks)
+        return success, total
@@ -1,13 +1,15 @@
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, NoReturn
+from typing import Dict, Optional, NoReturn
 from mutagen import File
-from mutagen.id3 import ID3, APIC, TIT2, TPE1, TPE2, TALB, TDRC, TRCK, TPOS, TCON
-from mutagen.mp4 import MP4, MP4Cover
+from mutagen.id3 import ID3, APIC, TIT2, TPE1, TPE2, TALB, TDRC, TRCK, TPOS, TCON, TXXX
+from mutagen.mp4 import MP4, MP4Cover, MP4FreeForm
 from mutagen.oggopus import OggOpus
 
 from spotifysaver.models import Track
 from spotifysaver.spotlog import get_logger
 from spotifysaver.services import TheAudioDBService
+from spotifysaver.services.the_audio_db_service import get_audiodb_service
 
 class MusicFileMetadata:
     """Handles metadata addition to music files in MP3, M4A, and Opus formats.
@@ -16,12 +18,27 @@ class MusicFileMetadata:
         file_path: Path to the audio file
         track: Track metadata to add
         cover_data: Optional cover art binary data
+        audiodb: TheAudioDB service used for genres. Default: the shared service
     """
-    def __init__(self, file_path: Path, track: Track, cover_data: Optional[bytes] = None):
+
+    # Custom tag holding the Spotify URI of the track
+    SPOTIFY_URI_TAG = "SPOTIFY_URI"
+    MP4_SPOTIFY_URI_KEY = "----:com.apple.iTunes:SPOTIFY_URI"
+
+    # Formats whose cover art FFmpeg can embed as an attached picture
+    FFMPEG_COVER_SUFFIXES = ('.mp3', '.m4a')
+
+    def __init__(
+        self,
+        file_path: Path,
+        track: Track,
+        cover_data: Optional[bytes] = None,
+        audiodb: Optional[TheAudioDBService] = None,
+    ):
         self.file_path = file_path
         self.track = track
         self.cover_data = cover_data
-        self.audiodb = TheAudioDBService()
+        self.audiodb = audiodb or get_audiodb_service()
         self.logger = get_logger(f"{self.__class__.__name__}")
 
     def safe_attr(self, obj, attr):
@@ -34,6 +51,11 @@ class MusicFileMetadata:
         """
         return getattr(obj, attr, None) if obj else None
 
+    @cached_property
+    def genre(self) -> Optional[str]:
+        """Genre of the track, looked up once in TheAudioDB."""
+        return self._get_genre(self.track)
+
     def _get_genre(self, track: Track) -> Optional[str]:
         """Get the genre of a track.
         
@@ -65,6 +87,46 @@ class MusicFileMetadata:
             self.logger.warning("No genre found")
             return None
 
+    @classmethod
+    def read_tags(cls, file_path: Path) -> Optional[dict]:
+        """Read the identifying tags of an audio file.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            dict: Title, artist, album and Spotify URI (None when missing),
+                or None if the file cannot be read or has no tags
+        """
+        try:
+            audio = File(str(file_path))
+        except Exception:
+            return None
+        if audio is None or audio.tags is None:
+            return None
+
+        tags = audio.tags
+        suffix = Path(file_path).suffix.lower()
+
+        def first(key):
+            value = tags.get(key)
+            if value is None:
+                return None
+            if suffix == '.mp3':
+                return str(value.text[0]) if value.text else None
+            value = value[0] if isinstance(value, list) and value else value
+            return bytes(value).decode("utf-8") if isinstance(value, bytes) else str(value)
+
+        if suffix == '.mp3':
+            keys = ("TIT2", "TPE1", "TALB", f"TXXX:{cls.SPOTIFY_URI_TAG}")
+        elif suffix == '.m4a':
+            keys = ('\xa9nam', '\xa9ART', '\xa9alb', cls.MP4_SPOTIFY_URI_KEY)
+        else:
+            keys = ("title", "artist", "album", cls.SPOTIFY_URI_TAG.lower())
+
+        title, artist, album, spotify_uri = (first(key) for key in keys)
+        return {"title": title, "artist": artist, "album": album, "spotify_uri": spotify_uri}
+
     def add_metadata(self) -> bool:
         """Add metadata to the audio file.
         
@@ -92,6 +154,64 @@ class MusicFileMetadata:
             self.logger.error(f"Failed to add metadata: {str(e)}")
             return False
 
+    def ffmpeg_tags(self) -> Dict[str, str]:
+        """Get the tags FFmpeg can write while it produces the file.
+
+        The keys are FFmpeg metadata keys, which the MP3, MP4 and Ogg
+        muxers map to the same frames, atoms and comments written by
+        ``add_metadata``. The Spotify URI of M4A files is missing: FFmpeg
+        cannot write iTunes freeform atoms, so ``add_remaining_metadata``
+        sets it afterwards.
+
+        Returns:
+            dict: ``-metadata`` key/value pairs for the output format
+        """
+        suffix = self.file_path.suffix.lower()
+        tags = {
+            'title': self.track.name,
+            'artist': "/".join(self.track.artists),
+            'album': self.track.album_name,
+            'track': f"{self.track.number}/{self.track.total_tracks}",
+            'disc': str(self.track.disc_number),
+        }
+        if suffix in ('.mp3', '.m4a'):
+            tags['album_artist'] = "/".join(self.track.album_artist)
+        if suffix == '.m4a':
+            tags['disc'] = f"{self.track.disc_number}/1"
+        if self.track.release_date:
+            tags['date'] = self.track.release_date[:4]
+        if self.genre:
+            tags['genre'] = self.genre
+        if self.track.uri and suffix == '.mp3':
+            tags[self.SPOTIFY_URI_TAG] = self.track.uri
+        elif self.track.uri and suffix == '.opus':
+            tags[self.SPOTIFY_URI_TAG.lower()] = self.track.uri
+        return {key: value for key, value in tags.items() if value}
+
+    def add_remaining_metadata(self) -> bool:
+        """Add the metadata FFmpeg could not write with ``ffmpeg_tags``.
+
+        Only the Spotify URI of M4A files and the cover of Opus files are
+        left; the file is not opened when there is nothing to add.
+
+        Returns:
+            bool: True if the metadata is complete
+        """
+        suffix = self.file_path.suffix.lower()
+        try:
+            if suffix == '.m4a' and self.track.uri:
+                audio = MP4(str(self.file_path))
+                audio[self.MP4_SPOTIFY_URI_KEY] = [MP4FreeForm(self.track.uri.encode("utf-8"))]
+                audio.save()
+            elif suffix == '.opus' and self.cover_data:
+                audio = OggOpus(str(self.file_path))
+                audio['cover'] = self.cover_data
+                audio.save()
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to add metadata: {str(e)}")
+            return False
+
     def _add_mp3_metadata(self) -> NoReturn:
         """Add ID3 tags to MP3 files."""
         audio = ID3(str(self.file_path))
@@ -110,13 +230,16 @@ class MusicFileMetadata:
         if self.track.release_date:
             frames.append(TDRC(encoding=3, text=self.track.release_date[:4])) # Release year
 
-        genre = self._get_genre(self.track)
+        genre = self.genre
         if genre:
             try:
                 frames.append(TCON(encoding=3, text=genre)) # Genres
             except:
                 self.logger.error(f"Failed to add genre: {genre}")
 
+        if self.track.uri:
+            frames.append(TXXX(encoding=3, desc=self.SPOTIFY_URI_TAG, text=self.track.uri))
+
         # Add all frames
         for frame in frames:
             audio.add(frame)
@@ -147,10 +270,13 @@ class MusicFileMetadata:
             'disk': [(self.track.disc_number, 1)],
         })
 
-        genre = self._get_genre(self.track)
+        genre = self.genre
         if genre:
             audio['\xa9gen'] = [genre]
 
+        if self.track.uri:
+            audio[self.MP4_SPOTIFY_URI_KEY] = [MP4FreeForm(self.track.uri.encode("utf-8"))]
+
         if self.cover_data:
             audio['covr'] = [MP4Cover(self.cover_data, imageformat=MP4Cover.FORMAT_JPEG)]
 
@@ -169,10 +295,13 @@ class MusicFileMetadata:
             'discnumber': str(self.track.disc_number),
         })
         
-        genre = self._get_genre(self.track)
+        genre = self.genre
         if genre:
             audio['genre'] = genre
 
+        if self.track.uri:
+            audio[self.SPOTIFY_URI_TAG.lower()] = self.track.uri
+
         if self.cover_data:
             audio['cover'] = self.cover_data
 
@@ -13,7 +13,7 @@ from xml.dom import minidom
 
 from spotifysaver.models.album import Album
 from spotifysaver.services.schemas import AlbumADBResponse
-from spotifysaver.services import TheAudioDBService
+from spotifysaver.services.the_audio_db_service import get_audiodb_service
 
 
 class NFOGenerator:
@@ -26,7 +26,7 @@ class NFOGenerator:
 
     @staticmethod
     def _get_theaudiodb_data(album: Album) -> Optional[AlbumADBResponse]:
-        service = TheAudioDBService()
+        service = get_audiodb_service()
         return service.get_album_metadata(album.artists[0], album.name)
 
     @staticmethod
@@ -4,5 +4,6 @@ from spotifysaver.models.album import Album
 from spotifysaver.models.track import Track
 from spotifysaver.models.artist import Artist
 from spotifysaver.models.playlist import Playlist
+from spotifysaver.models.track_match import TrackMatch
 
-__all__ = ["Album", "Track", "Artist", "Playlist"]
+__all__ = ["Album", "Track", "Artist", "Playlist", "TrackMatch"]
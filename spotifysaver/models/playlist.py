@@ -1,7 +1,7 @@
 """Playlist model for Spotify Saver."""
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from .track import Track
 
@@ -20,6 +20,10 @@ class Playlist:
         uri: Spotify URI for the playlist
         cover_url: URL to the playlist cover image
         tracks: List of Track objects in the playlist
+        snapshot_id: Spotify version identifier that changes whenever the
+            playlist is modified
+        total_tracks: Number of items reported by Spotify, known before the
+            tracks are fetched (``tracks`` is empty when they are streamed)
     """
 
     name: str
@@ -28,6 +32,8 @@ class Playlist:
     uri: str
     cover_url: str
     tracks: List[Track]
+    snapshot_id: Optional[str] = None
+    total_tracks: Optional[int] = None
 
     def get_track_by_uri(self, uri: str) -> Track | None:
         """Find a track by its URI (similar to Album method).
@@ -0,0 +1,33 @@
+"""Track match model for SpotifySaver."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class TrackMatch:
+    """Represents the YouTube Music result chosen for a Spotify track.
+
+    A match is resolved once per track and then passed down the download
+    process, so the search round trip is never repeated.
+
+    Attributes:
+        video_id: YouTube video ID of the selected result
+        score: Match score computed by ScoreMatchCalculator
+        strategy: Name of the search strategy that found the result
+        title: Title of the selected result
+    """
+
+    video_id: str
+    score: float
+    strategy: Optional[str] = None
+    title: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        """YouTube Music URL of the matched video.
+
+        Returns:
+            str: URL that can be passed to yt-dlp
+        """
+        return f"https://music.youtube.com/watch?v={self.video_id}"
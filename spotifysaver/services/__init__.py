@@ -1,9 +1,44 @@
-"""SpotifySaver Services Module"""
+"""SpotifySaver Services Module
 
-from spotifysaver.services.spotify_api import SpotifyAPI
-from spotifysaver.services.youtube_api import YoutubeMusicSearcher
-from spotifysaver.services.lrclib_api import LrclibAPI
-from spotifysaver.services.score_match_calculator import ScoreMatchCalculator
-from spotifysaver.services.the_audio_db_service import TheAudioDBService
+Services are imported on first access (PEP 562): each one pulls in its own
+client library (spotipy, ytmusicapi, httpx, pydantic), and most entry points
+only need a few of them.
+"""
 
-__all__ = ["SpotifyAPI", "YoutubeMusicSearcher", "LrclibAPI", "ScoreMatchCalculator", "TheAudioDBService"]
+from importlib import import_module
+
+_SERVICES = {
+    "SpotifyAPI": "spotifysaver.services.spotify_api",
+    "YoutubeMusicSearcher": "spotifysaver.services.youtube_api",
+    "LrclibAPI": "spotifysaver.services.lrclib_api",
+    "ScoreMatchCalculator": "spotifysaver.services.score_match_calculator",
+    "TheAudioDBService": "spotifysaver.services.the_audio_db_service",
+    "MatchCache": "spotifysaver.services.match_cache",
+    "HTTPClient": "spotifysaver.services.http_client",
+    "AsyncSpotifyAPI": "spotifysaver.services.async_spotify_api",
+    "AsyncLrclibAPI": "spotifysaver.services.async_lrclib_api",
+}
+
+__all__ = [
+    "SpotifyAPI",
+    "YoutubeMusicSearcher",
+    "LrclibAPI",
+    "ScoreMatchCalculator",
+    "TheAudioDBService",
+    "MatchCache",
+    "HTTPClient",
+    "AsyncSpotifyAPI",
+    "AsyncLrclibAPI",
+]
+
+
+def __getattr__(name):
+    if name not in _SERVICES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_SERVICES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
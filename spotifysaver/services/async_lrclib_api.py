@@ -0,0 +1,101 @@
+"""Async LRC Lib API Client."""
+
+from typing import Optional
+
+import httpx
+
+from spotifysaver.models import Track
+from spotifysaver.spotlog import get_logger
+from spotifysaver.services.errors.errors import APIError
+from spotifysaver.services.http_client import create_async_http_client
+from spotifysaver.services.lrclib_api import LrclibAPI
+
+
+class AsyncLrclibAPI:
+    """Asynchronous LRC Lib API client for fetching synchronized lyrics.
+
+    Same interface as LrclibAPI, with coroutine methods.
+
+    Attributes:
+        BASE_URL: Base URL for the LRC Lib API
+        client: Async HTTP client for making requests
+    """
+
+    BASE_URL = LrclibAPI.BASE_URL
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize the LRC Lib API client.
+
+        Args:
+            client: Async HTTP client to use. Default: a new client owned by
+                this instance and closed by ``aclose``
+        """
+        self.client = client or create_async_http_client()
+        self._owns_client = client is None
+        self.logger = get_logger(f"{self.__class__.__name__}")
+
+    async def get_lyrics(self, track: Track, synced: bool = True) -> Optional[str]:
+        """Get synchronized or plain lyrics for a track.
+
+        Args:
+            track: Track object with metadata for lyrics search
+            synced: If True, returns synchronized lyrics (.lrc format)
+
+        Returns:
+            str: Lyrics in requested format, or None if not found
+
+        Raises:
+            APIError: If there's an error with the API request
+        """
+        try:
+            params = {
+                "track_name": track.name,
+                "artist_name": track.artists[0],
+                "album_name": track.album_name,
+                "duration": int(track.duration),
+            }
+
+            response = await self.client.get(
+                f"{self.BASE_URL}/get",
+                params=params,
+                headers={"Accept": "application/json"},
+            )
+
+            if response.status_code == 404:
+                self.logger.debug(f"Lyrics not found for: {track.name}")
+                return None
+
+            response.raise_for_status()
+            data = response.json()
+
+            lyric_type = "syncedLyrics" if synced else "plainLyrics"
+            self.logger.info(f"Song lyrics obtained: {lyric_type}")
+            return data.get(lyric_type)
+
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error in the LRC Lib API: {str(e)}")
+            raise APIError(f"LRC Lib API error: {str(e)}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error: {str(e)}")
+            raise APIError(f"Unexpected error: {str(e)}")
+
+    async def get_lyrics_with_fallback(self, track: Track) -> Optional[str]:
+        """Attempt to get synchronized lyrics, fallback to plain lyrics if failed.
+
+        Args:
+            track: Track object with metadata for lyrics search
+
+        Returns:
+            str: Lyrics (synchronized preferred, plain as fallback), or None if unavailable
+        """
+        try:
+            return await self.get_lyrics(track, synced=True) or await self.get_lyrics(
+                track, synced=False
+            )
+        except APIError:
+            return None
+
+    async def aclose(self):
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self.client.aclose()
@@ -0,0 +1,354 @@
+"""AsyncSpotifyAPI: asyncio-native interface to the Spotify Web API."""
+
+import asyncio
+import time
+from collections import deque
+from typing import AsyncIterator, List, Optional
+
+import httpx
+
+from spotifysaver.config import Config
+from spotifysaver.models import Album, Artist, Playlist, Track
+from spotifysaver.services.http_client import create_async_http_client
+from spotifysaver.services.spotify_api import SpotifyAPI, get_spotify_cache
+from spotifysaver.services.ttl_cache import TTLCache
+from spotifysaver.spotlog import get_logger
+
+
+class AsyncSpotifyAPI:
+    """Asynchronous counterpart of SpotifyAPI for the API server.
+
+    Uses the client credentials flow over a shared ``httpx.AsyncClient`` so
+    metadata requests never block the event loop. Responses are turned into
+    models with the same builders as SpotifyAPI.
+
+    Attributes:
+        client: Async HTTP client used for every request
+        cache: Metadata cache keyed by item type and Spotify ID
+    """
+
+    TOKEN_URL = "https://accounts.spotify.com/api/token"
+    API_URL = "https://api.spotify.com/v1"
+
+    def __init__(
+        self, client: Optional[httpx.AsyncClient] = None, cache: Optional[TTLCache] = None
+    ):
+        """Initialize the client.
+
+        Args:
+            client: Async HTTP client to use. Default: a new client owned by
+                this instance and closed by ``aclose``
+            cache: Metadata cache. Default: the cache shared with SpotifyAPI
+
+        Raises:
+            ValueError: If Spotify credentials are missing
+        """
+        Config.validate()
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.client = client or create_async_http_client()
+        self.cache = cache or get_spotify_cache()
+        self._owns_client = client is None
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._rate_limited_until = 0.0
+
+    async def _get_token(self, refresh: bool = False) -> str:
+        """Get an access token, requesting a new one when it expires."""
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            if refresh or not self._token or time.time() >= self._token_expires_at:
+                response = await self.client.post(
+                    self.TOKEN_URL,
+                    data={"grant_type": "client_credentials"},
+                    auth=(Config.SPOTIFY_CLIENT_ID, Config.SPOTIFY_CLIENT_SECRET),
+                )
+                if response.status_code != 200:
+                    raise ValueError(f"Spotify authentication failed ({response.status_code})")
+                data = response.json()
+                self._token = data["access_token"]
+                # Renew a minute early to avoid using a token as it expires
+                self._token_expires_at = time.time() + data.get("expires_in", 3600) - 60
+            return self._token
+
+    async def _get(self, url: str, params: Optional[dict] = None) -> dict:
+        """GET a Web API resource, handling token renewal and rate limits.
+
+        Args:
+            url: Path relative to API_URL, or an absolute ``next`` URL
+            params: Query parameters
+
+        Returns:
+            dict: Decoded JSON response
+
+        Raises:
+            ValueError: If the resource does not exist or the request fails
+        """
+        if not url.startswith("http"):
+            url = f"{self.API_URL}/{url}"
+
+        refreshed = False
+        for attempt in range(Config.HTTP_RETRIES + 1):
+            # A 429 pauses every request of this client, not only the one that got it
+            pause = self._rate_limited_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            token = await self._get_token()
+            response = await self.client.get(
+                url, params=params, headers={"Authorization": f"Bearer {token}"}
+            )
+            if response.status_code == 401 and not refreshed:
+                await self._get_token(refresh=True)
+                refreshed = True
+                continue
+            if response.status_code == 429 or response.status_code >= 500:
+                delay = float(response.headers.get("Retry-After", 2 ** attempt))
+                self.logger.warning(f"Spotify returned {response.status_code}, retrying in {delay}s")
+                if response.status_code == 429:
+                    self._rate_limited_until = max(
+                        self._rate_limited_until, time.monotonic() + delay
+                    )
+                await asyncio.sleep(delay)
+                continue
+            break
+
+        if response.status_code in (400, 404):
+            raise ValueError("Not found or invalid URL")
+        if response.status_code != 200:
+            raise ValueError(f"Spotify API error ({response.status_code})")
+        return response.json()
+
+    async def _fetch(self, kind: str, url: str, params: Optional[dict] = None) -> dict:
+        """Fetch a track, album, artist or playlist by URL."""
+        item_id = SpotifyAPI._extract_spotify_id(url)
+        if not item_id:
+            raise ValueError(f"Invalid {kind} URL")
+        self.logger.debug(f"Fetching {kind} data: {url}")
+        try:
+            return await self._get(f"{kind}s/{item_id}", params)
+        except ValueError as e:
+            self.logger.error(f"Error fetching {kind} data: {e}")
+            raise ValueError(f"{kind.capitalize()} not found or invalid URL") from e
+
+    async def _fetch_cached(self, kind: str, url: str) -> dict:
+        """Fetch a track, album or artist by URL through the metadata cache."""
+        item_id = SpotifyAPI._extract_spotify_id(url)
+        key = f"{kind}:{item_id}"
+        raw_data = self.cache.get(key) if item_id else None
+        if raw_data is None:
+            raw_data = await self._fetch(kind, url)
+            if kind == "album":
+                raw_data = await self._complete_album_tracks(raw_data)
+            self.cache.set(key, raw_data)
+        return raw_data
+
+    async def get_track(self, track_url: str) -> Track:
+        """Get an individual track.
+
+        Args:
+            track_url: Spotify URL or URI for the track
+
+        Returns:
+            Track: Track object with complete metadata
+        """
+        return SpotifyAPI._build_track(await self._fetch_cached("track", track_url))
+
+    async def _complete_album_tracks(self, raw_data: dict) -> dict:
+        """Fetch the remaining track pages of an album with more than 50 tracks."""
+        page = raw_data["tracks"]
+        while page.get("next"):
+            page = await self._get(page["next"])
+            raw_data["tracks"]["items"].extend(page["items"])
+        return raw_data
+
+    async def _fetch_batch(self, kind: str, urls: List[str], batch_size: int) -> List[dict]:
+        """Fetch tracks or albums by URL with the batch endpoint.
+
+        Args:
+            kind: "track" or "album"
+            urls: Spotify URLs or URIs
+            batch_size: Maximum IDs per request
+
+        Returns:
+            list: Raw items in input order, without the unavailable ones
+        """
+        items = []
+        for ids in SpotifyAPI._batch_ids(urls, kind, batch_size):
+            self.logger.debug(f"Fetching {len(ids)} {kind}s")
+            try:
+                raw_items = (await self._get(f"{kind}s", {"ids": ",".join(ids)}))[f"{kind}s"]
+            except ValueError as e:
+                self.logger.error(f"Error fetching {kind} batch: {e}")
+                raise ValueError(f"{kind.capitalize()}s not found or invalid URLs") from e
+            for item_id, raw_data in zip(ids, raw_items):
+                if raw_data:
+                    items.append(raw_data)
+                else:
+                    self.logger.warning(f"{kind.capitalize()} not found: {item_id}")
+        return items
+
+    async def get_tracks(self, track_urls: List[str]) -> List[Track]:
+        """Get several tracks with the batch endpoint (50 tracks per request).
+
+        Args:
+            track_urls: Spotify URLs or URIs of the tracks
+
+        Returns:
+            list: Track objects in input order, without unavailable tracks
+        """
+        raw_tracks = await self._fetch_batch("track", track_urls, SpotifyAPI.TRACKS_BATCH_SIZE)
+        return [SpotifyAPI._build_track(raw_data) for raw_data in raw_tracks]
+
+    async def get_albums(self, album_urls: List[str]) -> List[Album]:
+        """Get several albums with the batch endpoint (20 albums per request).
+
+        Args:
+            album_urls: Spotify URLs or URIs of the albums
+
+        Returns:
+            list: Album objects with their tracks in input order, without
+                unavailable albums
+        """
+        raw_albums = await self._fetch_batch("album", album_urls, SpotifyAPI.ALBUMS_BATCH_SIZE)
+        return [
+            SpotifyAPI._build_album(await self._complete_album_tracks(raw_data))
+            for raw_data in raw_albums
+        ]
+
+    async def get_album(self, album_url: str) -> Album:
+        """Get an Album object with its tracks.
+
+        Args:
+            album_url: Spotify URL or URI for the album
+
+        Returns:
+            Album: Album object with complete metadata and track list
+        """
+        return SpotifyAPI._build_album(await self._fetch_cached("album", album_url))
+
+    async def get_artist(self, artist_url: str) -> Artist:
+        """Get basic artist information.
+
+        Args:
+            artist_url: Spotify URL or URI for the artist
+
+        Returns:
+            Artist: Artist object with metadata
+        """
+        return SpotifyAPI._build_artist(await self._fetch_cached("artist", artist_url))
+
+    async def get_playlist(self, playlist_url: str) -> Playlist:
+        """Get a Playlist object with all of its tracks.
+
+        Args:
+            playlist_url: Spotify URL or URI for the playlist
+
+        Returns:
+            Playlist: Playlist object with complete metadata and track list
+        """
+        raw_data = await self._fetch("playlist", playlist_url)
+        raw_data["tracks"]["items"] = await self._get_playlist_items(
+            SpotifyAPI._extract_spotify_id(playlist_url), raw_data["tracks"]
+        )
+        return SpotifyAPI._build_playlist(raw_data)
+
+    async def iter_playlist_items(
+        self, playlist_id: str, first_page: Optional[dict] = None
+    ) -> AsyncIterator[List[dict]]:
+        """Stream the item pages of a playlist in order.
+
+        The offsets of every page are known from the ``total`` of the first
+        one; up to ``Config.SPOTIFY_PAGE_CONCURRENCY`` pages are requested at
+        the same time, a few ahead of the consumer, and yielded in playlist
+        order.
+
+        Args:
+            playlist_id: Spotify ID of the playlist
+            first_page: First paging object, if already fetched
+
+        Yields:
+            list: Raw playlist items of one page
+        """
+        page_size = SpotifyAPI.PLAYLIST_PAGE_SIZE
+        if first_page is None:
+            first_page = await self._get(
+                f"playlists/{playlist_id}/tracks", {"offset": 0, "limit": page_size}
+            )
+        yield first_page["items"]
+
+        page_size = first_page.get("limit") or page_size
+        offsets = range(first_page.get("offset", 0) + page_size, first_page["total"], page_size)
+        concurrency = max(1, Config.SPOTIFY_PAGE_CONCURRENCY)
+        pending = deque()
+        try:
+            for offset in offsets:
+                pending.append(asyncio.ensure_future(self._get(
+                    f"playlists/{playlist_id}/tracks", {"offset": offset, "limit": page_size}
+                )))
+                if len(pending) >= concurrency:
+                    yield (await pending.popleft())["items"]
+            while pending:
+                yield (await pending.popleft())["items"]
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _get_playlist_items(self, playlist_id: str, first_page: dict) -> list:
+        """Get every item of a playlist (see ``iter_playlist_items``)."""
+        items = []
+        async for page_items in self.iter_playlist_items(playlist_id, first_page):
+            items.extend(page_items)
+        return items
+
+    async def get_playlist_info(self, playlist_url: str) -> Playlist:
+        """Get the metadata of a playlist without any of its tracks.
+
+        Args:
+            playlist_url: Spotify URL or URI for the playlist
+
+        Returns:
+            Playlist: Playlist with an empty ``tracks`` list and ``total_tracks`` set
+        """
+        raw_data = await self._fetch(
+            "playlist", playlist_url, {"fields": SpotifyAPI.PLAYLIST_INFO_FIELDS}
+        )
+        return SpotifyAPI._build_playlist_info(raw_data)
+
+    async def iter_playlist_tracks(
+        self, playlist_url: str, playlist: Optional[Playlist] = None
+    ) -> AsyncIterator[Track]:
+        """Stream the tracks of a playlist while its pages are being fetched.
+
+        Args:
+            playlist_url: Spotify URL or URI for the playlist
+            playlist: Metadata from ``get_playlist_info``, if already fetched
+
+        Yields:
+            Track: Tracks of the playlist in order
+        """
+        playlist = playlist or await self.get_playlist_info(playlist_url)
+        idx = 0
+        async for items in self.iter_playlist_items(SpotifyAPI._extract_spotify_id(playlist_url)):
+            for item in items:
+                track = SpotifyAPI._build_playlist_track(item, idx, playlist.name, playlist.total_tracks)
+                idx += 1
+                if track:
+                    yield track
+
+    async def get_playlist_snapshot_id(self, playlist_url: str) -> Optional[str]:
+        """Get the current snapshot ID of a playlist without fetching its tracks.
+
+        Args:
+            playlist_url: Spotify URL or URI for the playlist
+
+        Returns:
+            str: Snapshot ID of the playlist, or None if not available
+        """
+        raw_data = await self._fetch("playlist", playlist_url, {"fields": "snapshot_id"})
+        return raw_data.get("snapshot_id")
+
+    async def aclose(self):
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self.client.aclose()
@@ -0,0 +1,165 @@
+"""Shared HTTP client for the metadata, lyrics and image services."""
+
+import threading
+from typing import Dict, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from spotifysaver.config import Config
+from spotifysaver.spotlog import get_logger
+
+
+class HTTPClient:
+    """Process-wide keep-alive HTTP client.
+
+    Wraps a single ``requests.Session`` so every service reuses the same
+    connection pools instead of opening a new TLS connection per request.
+    Each host gets its own pool size, and idempotent requests are retried with
+    exponential backoff on connection errors, 429 and 5xx responses.
+
+    Attributes:
+        session: Underlying requests session
+        timeout: Default (connect, read) timeout in seconds
+    """
+
+    # Hosts hit once or more per track, sized for the concurrent download workers
+    HOST_POOL_SIZES = {
+        "i.scdn.co": 16,  # Spotify cover art
+        "lrclib.net": 8,
+        "www.theaudiodb.com": 8,
+    }
+    # Hosts whose pools the default adapter keeps; it serves every host not listed above
+    DEFAULT_ADAPTER_HOSTS = 10
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        timeout: Optional[tuple] = None,
+        host_pool_sizes: Optional[Dict[str, int]] = None,
+    ):
+        """Initialize the session and mount the connection pools.
+
+        Args:
+            pool_size: Connections kept per host not listed in host_pool_sizes.
+                Default: Config.HTTP_POOL_SIZE
+            retries: Retries for failed idempotent requests. Default: Config.HTTP_RETRIES
+            backoff_factor: Exponential backoff factor between retries.
+                Default: Config.HTTP_BACKOFF_FACTOR
+            timeout: Default (connect, read) timeout. Default:
+                (Config.HTTP_CONNECT_TIMEOUT, Config.DOWNLOAD_TIMEOUT)
+            host_pool_sizes: Pool size per host. Default: HOST_POOL_SIZES
+        """
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.timeout = timeout or (Config.HTTP_CONNECT_TIMEOUT, Config.DOWNLOAD_TIMEOUT)
+        self._retry = Retry(
+            total=Config.HTTP_RETRIES if retries is None else retries,
+            backoff_factor=Config.HTTP_BACKOFF_FACTOR if backoff_factor is None else backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+        self.session = requests.Session()
+        default_adapter = self._adapter(
+            pool_size or Config.HTTP_POOL_SIZE, hosts=self.DEFAULT_ADAPTER_HOSTS
+        )
+        self.session.mount("https://", default_adapter)
+        self.session.mount("http://", default_adapter)
+
+        sizes = self.HOST_POOL_SIZES if host_pool_sizes is None else host_pool_sizes
+        for host, size in sizes.items():
+            self.session.mount(f"https://{host}/", self._adapter(size))
+
+    def _adapter(self, pool_size: int, hosts: int = 1) -> HTTPAdapter:
+        # pool_connections is the number of per-host pools the adapter keeps;
+        # a smaller value closes the pool of one host whenever another is used
+        return HTTPAdapter(
+            pool_connections=hosts,
+            pool_maxsize=pool_size,
+            max_retries=self._retry,
+            pool_block=False,
+        )
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the shared session.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Arguments for ``requests.Session.request``. ``timeout``
+                defaults to the client timeout.
+
+        Returns:
+            requests.Response: The response (retries already applied)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request through the shared session.
+
+        Args:
+            url: Request URL
+            **kwargs: Arguments for ``requests.Session.request``
+
+        Returns:
+            requests.Response: The response (retries already applied)
+        """
+        return self.request("GET", url, **kwargs)
+
+    def close(self):
+        """Close every pooled connection."""
+        self.session.close()
+
+
+_default_client: Optional[HTTPClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """Get the process-wide HTTP client.
+
+    Returns:
+        HTTPClient: Shared client instance
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HTTPClient()
+        return _default_client
+
+
+def create_async_http_client(**kwargs) -> httpx.AsyncClient:
+    """Create an asyncio HTTP client with the same pool and timeout settings.
+
+    The client must be used from a single event loop and closed with
+    ``await client.aclose()`` when no longer needed.
+
+    Args:
+        **kwargs: Extra arguments for ``httpx.AsyncClient``
+
+    Returns:
+        httpx.AsyncClient: Keep-alive client that retries failed connections
+    """
+    kwargs.setdefault(
+        "timeout", httpx.Timeout(Config.DOWNLOAD_TIMEOUT, connect=Config.HTTP_CONNECT_TIMEOUT)
+    )
+    # The transport owns the connection pool, so the limits are set on it
+    kwargs.setdefault(
+        "transport",
+        httpx.AsyncHTTPTransport(
+            retries=Config.HTTP_RETRIES,
+            limits=httpx.Limits(
+                max_connections=Config.HTTP_ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.HTTP_POOL_SIZE,
+            ),
+        ),
+    )
+    return httpx.AsyncClient(**kwargs)
@@ -7,6 +7,7 @@ import requests
 from spotifysaver.models import Track
 from spotifysaver.spotlog import get_logger
 from spotifysaver.services.errors.errors import APIError
+from spotifysaver.services.http_client import HTTPClient, get_http_client
 
 
 class LrclibAPI:
@@ -17,18 +18,19 @@ class LrclibAPI:
     
     Attributes:
         BASE_URL: Base URL for the LRC Lib API
-        session: HTTP session for making requests    """
+        http: Shared HTTP client for making requests
+    """
     
     BASE_URL = "https://lrclib.net/api"
 
-    def __init__(self):
+    def __init__(self, http_client: Optional[HTTPClient] = None):
         """Initialize the LRC Lib API client.
         
-        Sets up the HTTP session with appropriate timeout settings.
+        Args:
+            http_client: HTTP client to use. Default: the process-wide client
         """
-        self.session = requests.Session()
+        self.http = http_client or get_http_client()
         self.logger = get_logger(f"{self.__class__.__name__}")
-        self.session.timeout = 10  # 10 seconds timeout
 
     def get_lyrics(self, track: Track, synced: bool = True) -> Optional[str]:
         """Get synchronized or plain lyrics for a track.
@@ -51,7 +53,7 @@ class LrclibAPI:
                 "duration": int(track.duration),
             }
 
-            response = self.session.get(
+            response = self.http.get(
                 f"{self.BASE_URL}/get",
                 params=params,
                 headers={"Accept": "application/json"},
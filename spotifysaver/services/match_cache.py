@@ -0,0 +1,168 @@
+"""Persistent match cache for YouTube Music resolutions."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from spotifysaver.config import Config
+from spotifysaver.models.track_match import TrackMatch
+from spotifysaver.spotlog import get_logger
+
+
+class MatchCache:
+    """SQLite cache of Spotify track URI to YouTube Music match resolutions.
+
+    Searching YouTube Music can take up to three strategies per track. The
+    chosen video is stored here with its score, the strategy that found it and
+    the time it was resolved, so later runs (CLI or API) skip the search
+    entirely until the entry expires.
+
+    Attributes:
+        db_path: Path of the SQLite database
+        ttl: Lifetime of an entry in seconds (None or 0 means no expiration)
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, ttl_days: Optional[float] = None):
+        """Initialize the cache and create its table if needed.
+
+        Args:
+            db_path: Path of the SQLite database. Default: Config.MATCH_CACHE_PATH
+            ttl_days: Lifetime of an entry in days. Default: Config.MATCH_CACHE_TTL_DAYS
+        """
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.db_path = Path(db_path or Config.MATCH_CACHE_PATH)
+        ttl_days = Config.MATCH_CACHE_TTL_DAYS if ttl_days is None else ttl_days
+        self.ttl = ttl_days * 86400 if ttl_days else None
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS matches (
+                    spotify_uri TEXT PRIMARY KEY,
+                    video_id TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    strategy TEXT,
+                    title TEXT,
+                    resolved_at REAL NOT NULL
+                )
+                """
+            )
+
+    def _is_fresh(self, resolved_at: float) -> bool:
+        return self.ttl is None or time.time() - resolved_at < self.ttl
+
+    def get(self, spotify_uri: str) -> Optional[TrackMatch]:
+        """Get the cached match of a track if it has not expired.
+
+        Args:
+            spotify_uri: Spotify URI of the track
+
+        Returns:
+            TrackMatch: Cached match, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT video_id, score, strategy, title, resolved_at "
+                "FROM matches WHERE spotify_uri = ?",
+                (spotify_uri,),
+            ).fetchone()
+
+        if not row or not self._is_fresh(row[4]):
+            return None
+        return TrackMatch(video_id=row[0], score=row[1], strategy=row[2], title=row[3])
+
+    def set(self, spotify_uri: str, match: TrackMatch):
+        """Store (or replace) the match of a track.
+
+        Args:
+            spotify_uri: Spotify URI of the track
+            match: Resolved YouTube Music match
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO matches "
+                "(spotify_uri, video_id, score, strategy, title, resolved_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (spotify_uri, match.video_id, match.score, match.strategy, match.title, time.time()),
+            )
+
+    def invalidate(
+        self,
+        spotify_uri: Optional[str] = None,
+        older_than_days: Optional[float] = None,
+        expired_only: bool = False,
+    ) -> int:
+        """Remove entries from the cache.
+
+        Without arguments every entry is removed.
+
+        Args:
+            spotify_uri: Only remove the entry of this track
+            older_than_days: Only remove entries resolved more than N days ago
+            expired_only: Only remove entries past the configured TTL
+
+        Returns:
+            int: Number of removed entries
+        """
+        clauses, params = [], []
+        if spotify_uri:
+            clauses.append("spotify_uri = ?")
+            params.append(spotify_uri)
+        if older_than_days is not None:
+            clauses.append("resolved_at < ?")
+            params.append(time.time() - older_than_days * 86400)
+        if expired_only and self.ttl is not None:
+            clauses.append("resolved_at < ?")
+            params.append(time.time() - self.ttl)
+        elif expired_only:
+            return 0
+
+        query = "DELETE FROM matches"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+
+        with self._lock, self._conn:
+            removed = self._conn.execute(query, params).rowcount
+        self.logger.info(f"Removed {removed} cached matches")
+        return removed
+
+    def stats(self) -> dict:
+        """Get the number of entries in the cache.
+
+        Returns:
+            dict: Total and expired entries plus the database path
+        """
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+            expired = 0
+            if self.ttl is not None:
+                expired = self._conn.execute(
+                    "SELECT COUNT(*) FROM matches WHERE resolved_at < ?",
+                    (time.time() - self.ttl,),
+                ).fetchone()[0]
+        return {"path": str(self.db_path), "entries": total, "expired": expired}
+
+
+_default_cache: Optional[MatchCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_match_cache() -> Optional[MatchCache]:
+    """Get the process-wide match cache, or None if it is disabled.
+
+    Returns:
+        MatchCache: Shared cache instance backed by Config.MATCH_CACHE_PATH
+    """
+    global _default_cache
+    if not Config.MATCH_CACHE_ENABLED:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = MatchCache()
+        return _default_cache
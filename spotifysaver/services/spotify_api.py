@@ -1,15 +1,19 @@
 """SpotifyAPI: Interface for interacting with the Spotify Web API."""
 
-from functools import lru_cache
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional
 
 import re
+import threading
+import time
 import spotipy
 from urllib.parse import urlparse
 from spotipy.oauth2 import SpotifyClientCredentials
 
 from spotifysaver.config import Config
 from spotifysaver.models import Album, Track, Artist, Playlist
+from spotifysaver.services.ttl_cache import TTLCache
 from spotifysaver.spotlog import get_logger
 
 
@@ -22,13 +26,24 @@ class SpotifyAPI:
     
     Attributes:
         sp: Authenticated Spotipy client instance
+        cache: Metadata cache keyed by item type and Spotify ID
     """
 
-    def __init__(self):
+    # Maximum IDs per request of the batch endpoints
+    TRACKS_BATCH_SIZE = 50
+    ALBUMS_BATCH_SIZE = 20
+    PLAYLIST_PAGE_SIZE = 100
+    PLAYLIST_INFO_FIELDS = "name,description,owner(display_name),uri,images,snapshot_id,tracks(total)"
+
+    def __init__(self, cache: Optional[TTLCache] = None):
         """Initialize the Spotify API client with authentication.
         
         Validates credentials and sets up the authenticated Spotipy client.
         
+        Args:
+            cache: Metadata cache. Default: the cache shared by the process
+                (see ``get_spotify_cache``)
+        
         Raises:
             ValueError: If Spotify credentials are missing or invalid
         """
@@ -40,21 +55,52 @@ class SpotifyAPI:
             )
         )
         self.logger = get_logger(f"{self.__class__.__name__}")
+        self.cache = cache or get_spotify_cache()
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limited_until = 0.0
 
-    def _extract_spotify_id(self, url: str) -> Optional[str]:
+    @staticmethod
+    def _extract_spotify_id(url: str) -> Optional[str]:
         """
-        Extrack the ID from a Spotify URL. It uses regex.
+        Extrack the ID from a Spotify URL or URI. It uses regex.
+
+        Query strings such as ``?si=`` are ignored, so every variant of a
+        link maps to the same ID.
 
         Args:
-            url (str): Spotify URL of a Track, Artist, Album or Playlist
+            url (str): Spotify URL or URI of a Track, Artist, Album or Playlist
         
         Returns:
             id (Optional[str]): id of the item or None if not found
         """
-        pattern = r"(?:track|artist|album|playlist)/([A-Za-z0-9]+)"
+        pattern = r"(?:track|artist|album|playlist)[/:]([A-Za-z0-9]+)"
         match = re.search(pattern, url)
         return match.group(1) if match else None
     
+    @classmethod
+    def _batch_ids(cls, urls: List[str], kind: str, batch_size: int) -> Iterator[List[str]]:
+        """Extract the unique IDs of a list of URLs and split them into batches.
+
+        URLs without an ID are logged and skipped; duplicates are fetched once.
+
+        Args:
+            urls: Spotify URLs or URIs
+            kind: Item type, for log messages
+            batch_size: Maximum IDs per batch
+
+        Yields:
+            list: IDs of one batch request, in input order
+        """
+        ids = []
+        for url in urls:
+            item_id = cls._extract_spotify_id(url)
+            if not item_id:
+                get_logger(cls.__name__).warning(f"Invalid {kind} URL skipped: {url}")
+            elif item_id not in ids:
+                ids.append(item_id)
+        for start in range(0, len(ids), batch_size):
+            yield ids[start:start + batch_size]
+
     def _parse_spotify_url(self, url: str) -> Optional[str]:
         """
         Parse the spotify url and gets the item ID. Uses urlparse from urllib.
@@ -71,7 +117,19 @@ class SpotifyAPI:
                 return path_parts[i+1] if i+1 < len(path_parts) else None
         return None
 
-    @lru_cache(maxsize=32)
+    def _cached(self, kind: str, item_id: str, loader: Callable[[], dict]) -> dict:
+        """Get raw item data from the metadata cache, calling ``loader`` on a miss.
+
+        Args:
+            kind: Item type, part of the cache key
+            item_id: Canonical Spotify ID of the item
+            loader: Fetches the raw data from the API
+
+        Returns:
+            dict: Raw item data
+        """
+        return self.cache.get_or_load(f"{kind}:{item_id}", lambda: (loader(), True))
+
     def _fetch_track_data(self, track_url: str) -> dict:
         """Fetch raw track data from the API.
         
@@ -89,12 +147,11 @@ class SpotifyAPI:
             track_id = self._extract_spotify_id(track_url)
             if not track_id:
                 raise ValueError("Invalid track URL")
-            return self.sp.track(track_id)
+            return self._cached("track", track_id, lambda: self.sp.track(track_id))
         except spotipy.exceptions.SpotifyException as e:
             self.logger.error(f"Error fetching track data: {e}")
             raise ValueError("Track not found or invalid URL") from e
 
-    @lru_cache(maxsize=32)  # Cachea las últimas 32 llamadas
     def _fetch_album_data(self, album_url: str) -> dict:
         """Fetch raw album data from the API.
         
@@ -112,12 +169,13 @@ class SpotifyAPI:
             album_id = self._extract_spotify_id(album_url)
             if not album_id:
                 raise ValueError("Invalid album URL")
-            return self.sp.album(album_id)
+            return self._cached(
+                "album", album_id, lambda: self._complete_album_tracks(self.sp.album(album_id))
+            )
         except spotipy.exceptions.SpotifyException as e:
             self.logger.error(f"Error fetching album data: {e}")
             raise ValueError("Album not found or invalid URL") from e
 
-    @lru_cache(maxsize=32)
     def _fetch_artist_data(self, artist_url: str) -> dict:
         """Fetch raw artist data from the API.
         
@@ -135,17 +193,18 @@ class SpotifyAPI:
             artist_id = self._extract_spotify_id(artist_url)
             if not artist_id:
                 raise ValueError("Invalid artist URL")
-            return self.sp.artist(artist_id)
+            return self._cached("artist", artist_id, lambda: self.sp.artist(artist_id))
         except spotipy.exceptions.SpotifyException as e:
             self.logger.error(f"Error fetching artist data: {e}")
             raise ValueError("Artist not found or invalid URL") from e
 
-    @lru_cache(maxsize=32)
-    def _fetch_playlist_data(self, playlist_url: str) -> dict:
+    def _fetch_playlist_data(self, playlist_url: str, snapshot_id: Optional[str] = None) -> dict:
         """Fetch raw playlist data from the API.
         
         Args:
             playlist_url: Spotify URL or URI for the playlist
+            snapshot_id: Current snapshot ID, if known. A cached copy of an
+                older snapshot is discarded and fetched again.
             
         Returns:
             dict: Raw playlist data from Spotify API
@@ -158,22 +217,119 @@ class SpotifyAPI:
             playlist_id = self._extract_spotify_id(playlist_url)
             if not playlist_id:
                 raise ValueError("Invalid playlist URL")
-            playlist = self.sp.playlist(playlist_id)
-            playlist["tracks"]['items'] = self._get_playlist_tracks(playlist_id)
+
+            def load() -> dict:
+                playlist = self.sp.playlist(playlist_id)
+                playlist["tracks"]['items'] = self._get_playlist_tracks(playlist_id, playlist["tracks"])
+                return playlist
+
+            playlist = self._cached("playlist", playlist_id, load)
+            if snapshot_id and playlist.get("snapshot_id") != snapshot_id:
+                self.cache.delete(f"playlist:{playlist_id}")
+                playlist = self._cached("playlist", playlist_id, load)
             return playlist
         except spotipy.exceptions.SpotifyException as e:
             self.logger.error(f"Error fetching playlist data: {e}")
             raise ValueError("Playlist not found or invalid URL") from e
 
-    def _get_playlist_tracks(self, playlist_id) ->list:
-            results = self.sp.playlist_tracks(playlist_id)
-            tracks = results['items']
-            while results['next']:
-                results = self.sp.next(results)
-                tracks.extend(results['items'])
-            return tracks
+    def _wait_for_rate_limit(self):
+        """Sleep until the pause requested by the last 429 response is over."""
+        with self._rate_limit_lock:
+            delay = self._rate_limited_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _fetch_playlist_page(self, playlist_id: str, offset: int) -> dict:
+        """Fetch one page of playlist items, honouring Spotify rate limits.
+
+        A 429 response pauses every page request of this client for the
+        ``Retry-After`` delay, not only the one that hit the limit, so the
+        concurrent page fetchers back off together.
+
+        Args:
+            playlist_id: Spotify ID of the playlist
+            offset: Index of the first item of the page
+
+        Returns:
+            dict: Paging object with the items of the page
+
+        Raises:
+            SpotifyException: If the request fails or stays rate limited
+        """
+        for attempt in range(Config.HTTP_RETRIES + 1):
+            self._wait_for_rate_limit()
+            try:
+                return self.sp.playlist_tracks(
+                    playlist_id, limit=self.PLAYLIST_PAGE_SIZE, offset=offset
+                )
+            except spotipy.exceptions.SpotifyException as e:
+                if e.http_status != 429 or attempt == Config.HTTP_RETRIES:
+                    raise
+                delay = float((e.headers or {}).get("Retry-After", 2 ** attempt))
+                self.logger.warning(f"Spotify rate limit reached, pausing page requests for {delay}s")
+                with self._rate_limit_lock:
+                    self._rate_limited_until = max(
+                        self._rate_limited_until, time.monotonic() + delay
+                    )
+
+    def iter_playlist_items(
+        self, playlist_id: str, first_page: Optional[dict] = None
+    ) -> Iterator[List[dict]]:
+        """Stream the item pages of a playlist in order.
+
+        The offsets of every page are known from the ``total`` of the first
+        one, so up to ``Config.SPOTIFY_PAGE_CONCURRENCY`` pages are fetched
+        at the same time instead of following the ``next`` links one by one.
+        Pages are still yielded in playlist order as soon as they (and the
+        pages before them) arrive, so a consumer can start working on the
+        first page while later ones are in flight. Pages are only requested
+        a few ahead of the consumer, and the ones still pending are
+        cancelled if it stops early.
+
+        Args:
+            playlist_id: Spotify ID of the playlist
+            first_page: First paging object, if already fetched (e.g. the
+                ``tracks`` of a playlist response)
+
+        Yields:
+            list: Raw playlist items of one page
+
+        Raises:
+            SpotifyException: If a page request fails
+        """
+        first_page = first_page or self._fetch_playlist_page(playlist_id, 0)
+        yield first_page["items"]
+
+        page_size = first_page.get("limit") or self.PLAYLIST_PAGE_SIZE
+        offsets = range(first_page.get("offset", 0) + page_size, first_page["total"], page_size)
+        concurrency = max(1, Config.SPOTIFY_PAGE_CONCURRENCY)
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="spotify-page")
+        pending = deque()
+        try:
+            for offset in offsets:
+                pending.append(executor.submit(self._fetch_playlist_page, playlist_id, offset))
+                if len(pending) >= concurrency:
+                    yield pending.popleft().result()["items"]
+            while pending:
+                yield pending.popleft().result()["items"]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_playlist_tracks(self, playlist_id: str, first_page: Optional[dict] = None) -> list:
+        """Get every item of a playlist (see ``iter_playlist_items``)."""
+        tracks = []
+        for items in self.iter_playlist_items(playlist_id, first_page):
+            tracks.extend(items)
+        return tracks
+
+    def _complete_album_tracks(self, raw_data: dict) -> dict:
+        """Fetch the remaining track pages of an album with more than 50 tracks."""
+        page = raw_data["tracks"]
+        while page.get("next"):
+            page = self.sp.next(page)
+            raw_data["tracks"]["items"].extend(page["items"])
+        return raw_data
 
-    @lru_cache(maxsize=32)
     def fetch_artist_albums(self, artist_url: str) -> dict:
         """Fetch raw artist data from the API.
         
@@ -191,28 +347,23 @@ class SpotifyAPI:
             artist_id = self._extract_spotify_id(artist_url)
             if not artist_id:
                 raise ValueError("Invalid artist URL")
-            return self.sp.artist_albums(artist_id)
+            return self._cached(
+                "artist_albums", artist_id, lambda: self.sp.artist_albums(artist_id)
+            )
         except spotipy.exceptions.SpotifyException as e:
             self.logger.error(f"Error fetching artist albuns: {e}")
             raise ValueError("Artist not found or invalid URL") from e
 
-    def get_track(self, track_url: str) -> Track:
-        """Get an individual track (for singles or specific searches).
+    @staticmethod
+    def _build_track(raw_data: dict) -> Track:
+        """Build a Track from raw track data.
         
         Args:
-            track_url: Spotify URL or URI for the track
+            raw_data: Raw track data from Spotify API
             
         Returns:
             Track: Track object with complete metadata
-            
-        Raises:
-            ValueError: If track is not found
         """
-        raw_data = self._fetch_track_data(track_url)
-        if not raw_data:
-            self.logger.error(f"Track not found: {track_url}")
-            raise ValueError("Track not found")
-
         return Track(
             number=raw_data["track_number"],
             total_tracks=1,  # Individual tracks have total_tracks = 1
@@ -232,17 +383,16 @@ class SpotifyAPI:
             ),
         )
 
-    def get_album(self, album_url: str) -> Album:
-        """Get an Album object with its tracks.
+    @staticmethod
+    def _build_album(raw_data: dict) -> Album:
+        """Build an Album (with its tracks) from raw album data.
         
         Args:
-            album_url: Spotify URL or URI for the album
+            raw_data: Raw album data from Spotify API
             
         Returns:
             Album: Album object with complete metadata and track list
         """
-        raw_data = self._fetch_album_data(album_url)
-
         # Construye objetos Track
         tracks = [
             Track(
@@ -273,23 +423,16 @@ class SpotifyAPI:
             tracks=tracks,
         )
 
-    def get_artist(self, artist_url: str) -> Dict[str, Optional[str]]:
-        """Get basic artist information.
+    @staticmethod
+    def _build_artist(raw_data: dict) -> Artist:
+        """Build an Artist from raw artist data.
         
         Args:
-            artist_url: Spotify URL or URI for the artist
+            raw_data: Raw artist data from Spotify API
             
         Returns:
             Artist: Artist object with metadata
-            
-        Raises:
-            ValueError: If artist is not found
         """
-        raw_data = self._fetch_artist_data(artist_url)
-        if not raw_data:
-            self.logger.error(f"Artist not found: {artist_url}")
-            raise ValueError("Artist not found")
-
         return Artist(
             name=raw_data["name"],
             uri=raw_data["uri"],
@@ -300,51 +443,299 @@ class SpotifyAPI:
             image_url=raw_data["images"][0]["url"] if raw_data["images"] else None,
         )
 
-    def get_playlist(self, playlist_url: str) -> Playlist:
-        """Get a Playlist object with its tracks.
+    @staticmethod
+    def _build_playlist_track(item: dict, idx: int, playlist_name: str, total: int) -> Optional[Track]:
+        """Build the Track of a raw playlist item.
         
         Args:
-            playlist_url: Spotify URL or URI for the playlist
+            item: Raw playlist item from Spotify API
+            idx: Position of the item in the playlist (0-based)
+            playlist_name: Name of the playlist
+            total: Number of items of the playlist
             
         Returns:
-            Playlist: Playlist object with complete metadata and track list
+            Track: Track object, or None for items without a track (removed
+                or local files)
         """
-        raw_data = self._fetch_playlist_data(playlist_url)
-
-        tracks = [
-            Track(
-                source_type="playlist",
-                playlist_name=raw_data["name"],
-                number=idx + 1,
-                total_tracks=raw_data["tracks"]["total"],
-                name=track["track"]["name"],
-                duration=track["track"]["duration_ms"] // 1000,
-                uri=track["track"]["uri"],
-                artists=[a["name"] for a in track["track"]["artists"]],
-                album_artist=[a["name"] for a in track["track"]["album"]["artists"]],
-                album_name=(
-                    track["track"]["album"]["name"] if track["track"]["album"] else None
-                ),
-                release_date=(
-                    track["track"]["album"]["release_date"]
-                    if track["track"]["album"]
-                    else "NA"
-                ),
-                cover_url=(
-                    track["track"]["album"]["images"][0]["url"]
-                    if track["track"]["album"]["images"]
-                    else None
-                ),
-            )
-            for idx, track in enumerate(raw_data["tracks"]["items"])
-            if track["track"]
-        ]
+        track = item["track"]
+        if not track:
+            return None
+        return Track(
+            source_type="playlist",
+            playlist_name=playlist_name,
+            number=idx + 1,
+            total_tracks=total,
+            name=track["name"],
+            duration=track["duration_ms"] // 1000,
+            uri=track["uri"],
+            artists=[a["name"] for a in track["artists"]],
+            album_artist=[a["name"] for a in track["album"]["artists"]],
+            album_name=track["album"]["name"] if track["album"] else None,
+            release_date=track["album"]["release_date"] if track["album"] else "NA",
+            cover_url=(
+                track["album"]["images"][0]["url"] if track["album"]["images"] else None
+            ),
+        )
 
+    @staticmethod
+    def _build_playlist_info(raw_data: dict) -> Playlist:
+        """Build a Playlist with its metadata only (``tracks`` is empty).
+        
+        Args:
+            raw_data: Raw playlist data from Spotify API
+            
+        Returns:
+            Playlist: Playlist object with metadata and ``total_tracks``
+        """
         return Playlist(
             name=raw_data["name"],
             description=raw_data.get("description", ""),
             owner=raw_data["owner"]["display_name"],
             uri=raw_data["uri"],
             cover_url=raw_data["images"][0]["url"] if raw_data["images"] else None,
-            tracks=tracks,
+            tracks=[],
+            snapshot_id=raw_data.get("snapshot_id"),
+            total_tracks=raw_data["tracks"]["total"],
         )
+
+    @classmethod
+    def _build_playlist(cls, raw_data: dict) -> Playlist:
+        """Build a Playlist from raw playlist data with every track item.
+        
+        Args:
+            raw_data: Raw playlist data from Spotify API
+            
+        Returns:
+            Playlist: Playlist object with complete metadata and track list
+        """
+        playlist = cls._build_playlist_info(raw_data)
+        for idx, item in enumerate(raw_data["tracks"]["items"]):
+            track = cls._build_playlist_track(item, idx, playlist.name, playlist.total_tracks)
+            if track:
+                playlist.tracks.append(track)
+        return playlist
+
+    def get_track(self, track_url: str) -> Track:
+        """Get an individual track (for singles or specific searches).
+        
+        Args:
+            track_url: Spotify URL or URI for the track
+            
+        Returns:
+            Track: Track object with complete metadata
+            
+        Raises:
+            ValueError: If track is not found
+        """
+        raw_data = self._fetch_track_data(track_url)
+        if not raw_data:
+            self.logger.error(f"Track not found: {track_url}")
+            raise ValueError("Track not found")
+
+        return self._build_track(raw_data)
+
+    def get_tracks(self, track_urls: List[str]) -> List[Track]:
+        """Get several tracks with the batch endpoint (50 tracks per request).
+
+        Args:
+            track_urls: Spotify URLs or URIs of the tracks
+
+        Returns:
+            list: Track objects in input order; invalid, duplicate and
+                unavailable tracks are left out
+
+        Raises:
+            ValueError: If a batch request fails
+        """
+        tracks = []
+        for ids in self._batch_ids(track_urls, "track", self.TRACKS_BATCH_SIZE):
+            try:
+                self.logger.debug(f"Fetching {len(ids)} tracks")
+                raw_tracks = self.sp.tracks(ids)["tracks"]
+            except spotipy.exceptions.SpotifyException as e:
+                self.logger.error(f"Error fetching track batch: {e}")
+                raise ValueError("Tracks not found or invalid URLs") from e
+            for track_id, raw_data in zip(ids, raw_tracks):
+                if raw_data:
+                    tracks.append(self._build_track(raw_data))
+                else:
+                    self.logger.warning(f"Track not found: {track_id}")
+        return tracks
+
+    def get_albums(self, album_urls: List[str]) -> List[Album]:
+        """Get several albums with the batch endpoint (20 albums per request).
+
+        Args:
+            album_urls: Spotify URLs or URIs of the albums
+
+        Returns:
+            list: Album objects with their tracks in input order; invalid,
+                duplicate and unavailable albums are left out
+
+        Raises:
+            ValueError: If a batch request fails
+        """
+        albums = []
+        for ids in self._batch_ids(album_urls, "album", self.ALBUMS_BATCH_SIZE):
+            try:
+                self.logger.info(f"Fetching {len(ids)} albums")
+                raw_albums = self.sp.albums(ids)["albums"]
+                for album_id, raw_data in zip(ids, raw_albums):
+                    if raw_data:
+                        albums.append(self._build_album(self._complete_album_tracks(raw_data)))
+                    else:
+                        self.logger.warning(f"Album not found: {album_id}")
+            except spotipy.exceptions.SpotifyException as e:
+                self.logger.error(f"Error fetching album batch: {e}")
+                raise ValueError("Albums not found or invalid URLs") from e
+        return albums
+
+    def get_album(self, album_url: str) -> Album:
+        """Get an Album object with its tracks.
+        
+        Args:
+            album_url: Spotify URL or URI for the album
+            
+        Returns:
+            Album: Album object with complete metadata and track list
+        """
+        return self._build_album(self._fetch_album_data(album_url))
+
+    def get_artist(self, artist_url: str) -> Dict[str, Optional[str]]:
+        """Get basic artist information.
+        
+        Args:
+            artist_url: Spotify URL or URI for the artist
+            
+        Returns:
+            Artist: Artist object with metadata
+            
+        Raises:
+            ValueError: If artist is not found
+        """
+        raw_data = self._fetch_artist_data(artist_url)
+        if not raw_data:
+            self.logger.error(f"Artist not found: {artist_url}")
+            raise ValueError("Artist not found")
+
+        return self._build_artist(raw_data)
+
+    def get_playlist(self, playlist_url: str, snapshot_id: Optional[str] = None) -> Playlist:
+        """Get a Playlist object with its tracks.
+        
+        Args:
+            playlist_url: Spotify URL or URI for the playlist
+            snapshot_id: Current snapshot ID, if known, so a cached copy of
+                an older version of the playlist is not returned
+            
+        Returns:
+            Playlist: Playlist object with complete metadata and track list
+        """
+        return self._build_playlist(self._fetch_playlist_data(playlist_url, snapshot_id))
+
+    def get_playlist_info(self, playlist_url: str) -> Playlist:
+        """Get the metadata of a playlist without any of its tracks.
+        
+        Args:
+            playlist_url: Spotify URL or URI for the playlist
+            
+        Returns:
+            Playlist: Playlist with an empty ``tracks`` list and ``total_tracks`` set
+            
+        Raises:
+            ValueError: If playlist is not found or URL is invalid
+        """
+        try:
+            playlist_id = self._extract_spotify_id(playlist_url)
+            if not playlist_id:
+                raise ValueError("Invalid playlist URL")
+            raw_data = self.sp.playlist(playlist_id, fields=self.PLAYLIST_INFO_FIELDS)
+            return self._build_playlist_info(raw_data)
+        except spotipy.exceptions.SpotifyException as e:
+            self.logger.error(f"Error fetching playlist data: {e}")
+            raise ValueError("Playlist not found or invalid URL") from e
+
+    def iter_playlist_tracks(
+        self, playlist_url: str, playlist: Optional[Playlist] = None
+    ) -> Iterator[Track]:
+        """Stream the tracks of a playlist while its pages are being fetched.
+        
+        Tracks are built page by page from ``iter_playlist_items``, so a
+        download can start on the first page while later pages are in
+        flight, and neither the raw pages nor the whole track list are kept
+        in memory.
+        
+        Args:
+            playlist_url: Spotify URL or URI for the playlist
+            playlist: Metadata from ``get_playlist_info``, if already fetched
+            
+        Yields:
+            Track: Tracks of the playlist in order
+            
+        Raises:
+            ValueError: If playlist is not found or a page request fails
+        """
+        playlist = playlist or self.get_playlist_info(playlist_url)
+        playlist_id = self._extract_spotify_id(playlist_url)
+        idx = 0
+        try:
+            for items in self.iter_playlist_items(playlist_id):
+                for item in items:
+                    track = self._build_playlist_track(item, idx, playlist.name, playlist.total_tracks)
+                    idx += 1
+                    if track:
+                        yield track
+        except spotipy.exceptions.SpotifyException as e:
+            self.logger.error(f"Error fetching playlist tracks: {e}")
+            raise ValueError("Playlist tracks could not be fetched") from e
+
+    def get_playlist_snapshot_id(self, playlist_url: str) -> Optional[str]:
+        """Get the current snapshot ID of a playlist without fetching its tracks.
+        
+        The snapshot ID changes whenever the playlist is modified, so it is a
+        cheap way to detect whether a previously synced playlist changed.
+        
+        Args:
+            playlist_url: Spotify URL or URI for the playlist
+            
+        Returns:
+            str: Snapshot ID of the playlist, or None if not available
+            
+        Raises:
+            ValueError: If playlist is not found or URL is invalid
+        """
+        try:
+            playlist_id = self._extract_spotify_id(playlist_url)
+            if not playlist_id:
+                raise ValueError("Invalid playlist URL")
+            return self.sp.playlist(playlist_id, fields="snapshot_id").get("snapshot_id")
+        except spotipy.exceptions.SpotifyException as e:
+            self.logger.error(f"Error fetching playlist snapshot: {e}")
+            raise ValueError("Playlist not found or invalid URL") from e
+
+
+_default_cache: Optional[TTLCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_spotify_cache() -> TTLCache:
+    """Get the process-wide Spotify metadata cache.
+
+    Entries are keyed by item type and canonical Spotify ID, expire after
+    Config.SPOTIFY_CACHE_TTL_HOURS and the memory tier is bounded by
+    Config.SPOTIFY_CACHE_MAX_MB of JSON. Persisted to
+    Config.SPOTIFY_CACHE_PATH when enabled.
+
+    Returns:
+        TTLCache: Shared cache
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TTLCache(
+                ttl=Config.SPOTIFY_CACHE_TTL_HOURS * 3600,
+                maxsize=Config.SPOTIFY_CACHE_SIZE,
+                maxbytes=int(Config.SPOTIFY_CACHE_MAX_MB * 1024 * 1024),
+                db_path=Config.SPOTIFY_CACHE_PATH if Config.SPOTIFY_CACHE_PERSIST else None,
+            )
+        return _default_cache
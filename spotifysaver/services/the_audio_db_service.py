@@ -1,7 +1,11 @@
+import threading
 import requests
 from typing import Optional, Dict, Any, List
 
+from spotifysaver.config import Config
 from spotifysaver.spotlog import get_logger
+from spotifysaver.services.ttl_cache import TTLCache
+from spotifysaver.services.http_client import HTTPClient, get_http_client
 from spotifysaver.services.audiodb_parser import AudioDBParser
 from spotifysaver.services.schemas import TrackADBResponse, AlbumADBResponse, ArtistADBResponse
 
@@ -10,12 +14,71 @@ class TheAudioDBService():
     Search for metadata in TheAudioDB.
 
     This class provides methods to obtain metadata for artist, albums and tracks from TheAudioDB.
+
+    Lookups are memoized (including "not found" answers), so the tracks of
+    an album share a single album and artist request.
+
+    Args:
+        http_client: HTTP client to use. Default: the process-wide client
+        cache: Memoization cache. Default: the process-wide TheAudioDB cache
     """
-    def __init__(self):
+    def __init__(self, http_client: Optional[HTTPClient] = None, cache: Optional[TTLCache] = None):
         self.logger = get_logger(f"{__class__.__name__}")
+        self.http = http_client or get_http_client()
+        self.cache = cache or get_audiodb_cache()
+        self.negative_ttl = Config.AUDIODB_CACHE_NEGATIVE_TTL_HOURS * 3600
         self.url_base = "https://www.theaudiodb.com/api/v1/json/123/"
         self.parser = AudioDBParser()
 
+    def _lookup(
+        self,
+        endpoint: str,
+        params: Dict[str, str],
+        field: str,
+        first_only: bool = True,
+        not_found: str = "No results found",
+    ) -> Optional[Any]:
+        """
+        Query an endpoint through the memoization cache.
+
+        Successful answers are cached for AUDIODB_CACHE_TTL_HOURS. Answers that
+        found nothing are cached for AUDIODB_CACHE_NEGATIVE_TTL_HOURS, while
+        network errors and non-200 responses are never cached.
+
+        Args:
+            endpoint (str): Endpoint file name, e.g. "searchalbum.php".
+            params (Dict[str, str]): Query parameters.
+            field (str): Response field holding the result list.
+            first_only (bool): Return only the first result.
+            not_found (str): Warning logged when nothing is found.
+
+        Returns:
+            Optional[Any]: The first result (or every result), otherwise None.
+        """
+        key = endpoint + "?" + "&".join(
+            f"{name}={str(value).strip().lower()}" for name, value in sorted(params.items())
+        )
+
+        def load():
+            try:
+                response = self.http.get(f"{self.url_base}{endpoint}", params=params)
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Error: {e}")
+                return None, False
+            if response.status_code != 200:
+                self.logger.error(f"TheAudioDB returned {response.status_code} for {endpoint}")
+                return None, False
+
+            results = response.json().get(field)
+            if not results or not isinstance(results, list):
+                self.logger.warning(not_found)
+                return None, True
+            return (results[0] if first_only else results), True
+
+        return self.cache.get_or_load(
+            key, load, ttl=lambda value: self.cache.ttl if value is not None else self.negative_ttl
+        )
+
     def _search_artist_by_name(self, artist_name: str) -> Optional[Dict[str, Any]]:
         """
         Search for an artist by name.
@@ -27,20 +90,10 @@ class TheAudioDBService():
             Optional[Dict[str, Any]]: A dictionary containing the artist information if found, otherwise None.
         """
         self.logger.info(f"Searching artist by name: {artist_name}")
-        try:
-            response = requests.get(f"{self.url_base}search.php?s={artist_name}")
-            if response.status_code == 200:
-                raw = response.json()
-                artists = raw.get("artists")
-                if artists and isinstance(artists, list) and len(artists) > 0:
-                    return artists[0]
-                else:
-                    self.logger.warning(f"No artist found for {artist_name}")
-                    return None
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error: {e}")
-            return None
+        return self._lookup(
+            "search.php", {"s": artist_name}, "artists",
+            not_found=f"No artist found for {artist_name}",
+        )
     
     def _search_album_by_name(self, artist_name: str, album_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -54,20 +107,10 @@ class TheAudioDBService():
             Optional[Dict[str, Any]]: A dictionary containing the album information if found, otherwise None.
         """
         self.logger.info(f"Searching album by name: {album_name}")
-        try:
-            response = requests.get(f"{self.url_base}searchalbum.php?s={artist_name}&a={album_name}")
-            if response.status_code == 200:
-                raw = response.json()
-                albums = raw.get("album")
-                if albums and isinstance(albums, list) and len(albums) > 0:
-                    return albums[0]
-                else:
-                    self.logger.warning(f"No album found for {artist_name} - {album_name}")
-                    return None
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error: {e}")
-            return None
+        return self._lookup(
+            "searchalbum.php", {"s": artist_name, "a": album_name}, "album",
+            not_found=f"No album found for {artist_name} - {album_name}",
+        )
     
     def _search_track_by_name(self, artist_name: str, track_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -81,23 +124,10 @@ class TheAudioDBService():
             Optional[Dict[str, Any]]: A dictionary containing the track information if found, otherwise None.
         """
         self.logger.info(f"Searching track by name: {track_name}")
-        try:
-            response = requests.get(f"{self.url_base}searchtrack.php?s={artist_name}&t={track_name}")
-            if response.status_code == 200:
-                raw = response.json()
-                tracks = raw.get("track")
-                if tracks and isinstance(tracks, list) and len(tracks) > 0:
-                    return tracks[0]
-                else:
-                    self.logger.warning(f"No track found for {artist_name} - {track_name}")
-                    return None
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error: {e}")
-            return None
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error: {e}")
-            return None
+        return self._lookup(
+            "searchtrack.php", {"s": artist_name, "t": track_name}, "track",
+            not_found=f"No track found for {artist_name} - {track_name}",
+        )
 
     def _get_tracks_from_an_album(self, album_id: str) -> Optional[List[Dict[str, Any]]]:
         """
@@ -110,20 +140,10 @@ class TheAudioDBService():
             Optional[List[Dict[str, Any]]]: A dictionary containing the tracks information if found, otherwise None.
         """
         self.logger.info(f"Getting tracks from album: {album_id}")
-        try:
-            response = requests.get(f"{self.url_base}track.php?m={album_id}")
-            if response.status_code == 200:
-                raw = response.json()
-                tracks = raw.get("track")
-                if tracks and isinstance(tracks, list) and len(tracks) > 0:
-                    return tracks
-                else:
-                    self.logger.warning(f"No tracks found for album: {album_id}")
-                    return None
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error: {e}")
-            return None
+        return self._lookup(
+            "track.php", {"m": album_id}, "track", first_only=False,
+            not_found=f"No tracks found for album: {album_id}",
+        )
 
     def _search_track_by_id(self, track_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -136,20 +156,10 @@ class TheAudioDBService():
             Optional[Dict[str, Any]]: A dictionary containing the track information if found, otherwise None.
         """
         self.logger.info(f"Searching track by ID: {track_id}")
-        try:
-            response = requests.get(f"{self.url_base}track.php?i={track_id}")
-            if response.status_code == 200:
-                raw = response.json()
-                tracks = raw.get("track")
-                if tracks and isinstance(tracks, list) and len(tracks) > 0:
-                    return tracks[0]
-                else:
-                    self.logger.warning(f"No track found for ID: {track_id}")
-                    return None
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error: {e}")
-            return None
+        return self._lookup(
+            "track.php", {"i": track_id}, "track",
+            not_found=f"No track found for ID: {track_id}",
+        )
         
     def get_track_metadata(
             self, 
@@ -211,4 +221,40 @@ class TheAudioDBService():
         if not raw_data:
             return None
 
-        return self.parser.parse_artist(raw_data)
\ No newline at end of file
+        return self.parser.parse_artist(raw_data)
+
+
+_default_cache: Optional[TTLCache] = None
+_default_cache_lock = threading.Lock()
+_default_service: Optional[TheAudioDBService] = None
+_default_service_lock = threading.Lock()
+
+
+def get_audiodb_cache() -> TTLCache:
+    """Get the process-wide TheAudioDB lookup cache.
+
+    Returns:
+        TTLCache: Shared cache, persisted to Config.AUDIODB_CACHE_PATH when enabled
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TTLCache(
+                ttl=Config.AUDIODB_CACHE_TTL_HOURS * 3600,
+                maxsize=Config.AUDIODB_CACHE_SIZE,
+                db_path=Config.AUDIODB_CACHE_PATH if Config.AUDIODB_CACHE_PERSIST else None,
+            )
+        return _default_cache
+
+
+def get_audiodb_service() -> TheAudioDBService:
+    """Get the process-wide TheAudioDB service.
+
+    Returns:
+        TheAudioDBService: Shared service instance
+    """
+    global _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = TheAudioDBService()
+        return _default_service
@@ -0,0 +1,263 @@
+"""Time-to-live memoization cache with optional SQLite persistence."""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from spotifysaver.spotlog import get_logger
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    Values must be JSON-serializable when a database path is given: entries
+    are then also written to SQLite and survive restarts. ``None`` is a valid
+    cached value, which allows negative results to be memoized.
+
+    With ``maxbytes`` the memory tier is also bounded by the JSON size of
+    the values, so a few large payloads cannot grow it without limit; a
+    value larger than ``maxbytes`` is only kept on disk (if any).
+
+    Attributes:
+        ttl: Default lifetime of an entry in seconds
+        maxsize: Maximum number of entries kept in memory
+        maxbytes: Maximum JSON size of the values kept in memory, or None
+        db_path: Path of the SQLite database, or None for memory only
+        hits: Lookups answered from memory
+        disk_hits: Lookups answered from the SQLite tier
+        misses: Lookups that found no fresh entry
+        evictions: Entries dropped from memory to respect the bounds
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = 1024,
+        db_path: Optional[Path] = None,
+        maxbytes: Optional[int] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Default lifetime of an entry in seconds
+            maxsize: Maximum number of entries kept in memory
+            db_path: Optional SQLite database for persistence
+            maxbytes: Optional bound on the JSON size of the values kept in memory
+        """
+        self.logger = get_logger(f"{self.__class__.__name__}")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.db_path = Path(db_path) if db_path else None
+        self._entries: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Key -> [lock, number of threads holding or waiting for it]
+        self._key_locks: dict = {}
+        self._conn = None
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            with self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS entries (
+                        key TEXT PRIMARY KEY,
+                        value TEXT,
+                        expires_at REAL NOT NULL
+                    )
+                    """
+                )
+
+    def _remember(self, key: str, expires_at: float, value: Any, size: int = 0):
+        """Store an entry in memory, evicting the least recently used. Caller holds the lock."""
+        self._forget(key)
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        self._entries[key] = (expires_at, value, size)
+        self._bytes += size
+        while len(self._entries) > self.maxsize or (
+            self.maxbytes is not None and self._bytes > self.maxbytes
+        ):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def _forget(self, key: str):
+        """Drop an entry from memory. Caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._bytes -= entry[2]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value if it is cached and not expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            The cached value (which may be None), or ``default``
+        """
+        return self._lookup(key, default, count=True)
+
+    def _lookup(self, key: str, default: Any, count: bool) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += count
+                    return entry[1]
+                self._forget(key)
+
+            row = None
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+            if not row or row[1] <= now:
+                self.misses += count
+                return default
+            value = json.loads(row[0])
+            self._remember(key, row[1], value, len(row[0]))
+            self.disk_hits += count
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache (None caches a negative result)
+            ttl: Lifetime in seconds. Default: the cache ttl
+        """
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        encoded = None
+        if self._conn is not None or self.maxbytes is not None:
+            encoded = json.dumps(value)
+        with self._lock:
+            self._remember(key, expires_at, value, len(encoded) if encoded else 0)
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, encoded, expires_at),
+                    )
+
+    def delete(self, key: str):
+        """Remove an entry, in memory and on disk.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._forget(key)
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Tuple[Any, bool]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Get a value, calling ``loader`` once on a miss.
+
+        Concurrent callers asking for the same key wait for the first one
+        instead of issuing the same request in parallel.
+
+        Args:
+            key: Cache key
+            loader: Returns ``(value, cacheable)``. Uncacheable values (for
+                example after a network error) are returned but not stored.
+            ttl: Lifetime in seconds, or a function of the value returning it.
+                Default: the cache ttl
+
+        Returns:
+            The cached or loaded value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                # Filled by a concurrent loader while waiting; already counted as a miss
+                value = self._lookup(key, _MISSING, count=False)
+                if value is not _MISSING:
+                    return value
+                value, cacheable = loader()
+                if cacheable:
+                    self.set(key, value, ttl(value) if callable(ttl) else ttl)
+                return value
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._key_locks[key]
+
+    def clear(self):
+        """Remove every entry, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM entries")
+
+    def purge_expired(self) -> int:
+        """Remove expired entries from disk.
+
+        Returns:
+            int: Number of removed entries
+        """
+        with self._lock:
+            now = time.time()
+            for key in [k for k, entry in self._entries.items() if entry[0] <= now]:
+                self._forget(key)
+            if self._conn is None:
+                return 0
+            with self._conn:
+                return self._conn.execute(
+                    "DELETE FROM entries WHERE expires_at <= ?", (now,)
+                ).rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the size and hit/miss counters of the cache.
+
+        Returns:
+            dict: entries, bytes and maxbytes of the memory tier, disk_entries
+                (None without a database), hits, disk_hits, misses, evictions
+                and hit_rate
+        """
+        with self._lock:
+            disk_entries = None
+            if self._conn is not None:
+                disk_entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxbytes": self.maxbytes,
+                "disk_entries": disk_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
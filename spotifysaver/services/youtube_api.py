@@ -1,13 +1,15 @@
 """YouTube Music Searcher Service"""
 
-from functools import lru_cache
+from dataclasses import replace
 from typing import List, Dict, Optional, Tuple
 
 from ytmusicapi import YTMusic
 
 from spotifysaver.models.track import Track
+from spotifysaver.models.track_match import TrackMatch
 from spotifysaver.spotlog import get_logger
 from spotifysaver.services.score_match_calculator import ScoreMatchCalculator
+from spotifysaver.services.match_cache import MatchCache, get_match_cache
 from spotifysaver.services.errors.errors import (
     YouTubeAPIError,
     AlbumNotFoundError,
@@ -25,16 +27,22 @@ class YoutubeMusicSearcher:
     Attributes:
         ytmusic: YTMusic API client instance
         max_retries: Maximum number of retry attempts for failed searches
+        match_cache: Persistent cache of previous resolutions (None if disabled)
     """
     
-    def __init__(self):
+    def __init__(self, match_cache: Optional[MatchCache] = None):
         """Initialize the YouTube Music searcher.
         
         Sets up the YTMusic client and configures retry behavior.
+
+        Args:
+            match_cache: Persistent match cache. Default: the shared cache
+                configured in Config (if enabled)
         """
         self.ytmusic = YTMusic()
         self.scorer = ScoreMatchCalculator()
         self.max_retries = 3
+        self.match_cache = match_cache or get_match_cache()
         self.logger = get_logger(f"{self.__class__.__name__}")
 
     @staticmethod
@@ -72,7 +80,7 @@ class YoutubeMusicSearcher:
         )
         return " ".join([w for w in text.split() if w not in {"lyrics", "audio"}])
 
-    def _search_with_fallback(self, track: Track) -> Optional[str]:
+    def _search_with_fallback(self, track: Track) -> Optional[TrackMatch]:
         """Prioritized search strategy with multiple fallback methods.
         
         Tries different search strategies in order of reliability until
@@ -82,7 +90,7 @@ class YoutubeMusicSearcher:
             track: Track object to search for
             
         Returns:
-            str: YouTube Music URL if found, None otherwise
+            TrackMatch: Best match found, None otherwise
         """
         search_strategies = [
             self._search_exact_match,
@@ -91,22 +99,22 @@ class YoutubeMusicSearcher:
         ]
 
         for strategy in search_strategies:
-            if url := strategy(track):
+            if match := strategy(track):
                 self.logger.info(
                     f"Found track: {track.name} by {track.artists[0]} using {strategy.__name__}"
                 )
-                return url
+                return replace(match, strategy=strategy.__name__)
         self.logger.warning(f"No results found for {track.name} by {track.artists[0]}")
         return None
 
-    def _search_exact_match(self, track: Track) -> Optional[str]:
+    def _search_exact_match(self, track: Track) -> Optional[TrackMatch]:
         """Exact search with song filter.
         
         Args:
             track: Track object to search for
             
         Returns:
-            str: YouTube Music URL if found, None otherwise
+            TrackMatch: Best match if found, None otherwise
         """
         query = self._normalize(f"{track.artists[0]} {track.name} {track.album_name}")
         results = self.ytmusic.search(
@@ -118,14 +126,14 @@ class YoutubeMusicSearcher:
         self.logger.debug(f"Exact match search results: {results}")
         return self._process_results(results, track, strict=True)
 
-    def _search_album_context(self, track: Track) -> Optional[str]:
+    def _search_album_context(self, track: Track) -> Optional[TrackMatch]:
         """Search for the album with detailed error handling.
         
         Args:
             track: Track object to search for
             
         Returns:
-            str: YouTube Music URL if found, None otherwise
+            TrackMatch: Best match if found, None otherwise
             
         Raises:
             AlbumNotFoundError: If the album cannot be found
@@ -166,14 +174,14 @@ class YoutubeMusicSearcher:
         except Exception as e:
             raise InvalidResultError(f"Unexpected error in album search: {str(e)}")
 
-    def _search_fuzzy_match(self, track: Track) -> Optional[str]:
+    def _search_fuzzy_match(self, track: Track) -> Optional[TrackMatch]:
         """More flexible search when exact searches fail.
         
         Args:
             track: Track object to search for
             
         Returns:
-            str: YouTube Music URL if found, None otherwise
+            TrackMatch: Best match if found, None otherwise
         """
         results = self.ytmusic.search(
             query=self._normalize(f"{track.artists[0]} {track.name} {track.album_name}"),
@@ -185,7 +193,7 @@ class YoutubeMusicSearcher:
 
     def _process_results(
         self, results: List[Dict], track: Track, strict: bool
-    ) -> Optional[str]:
+    ) -> Optional[TrackMatch]:
         """Evaluate and select the best result.
         
         Args:
@@ -194,7 +202,7 @@ class YoutubeMusicSearcher:
             strict: Whether to use strict matching criteria
             
         Returns:
-            str: YouTube Music URL of the best match, None if no valid matches
+            TrackMatch: Best match, None if no valid matches
         """
         if not results:
             self.logger.warning(f"No results found for {track.name} by {track.artists[0]}")
@@ -212,34 +220,49 @@ class YoutubeMusicSearcher:
             return None
 
         scored_results.sort(reverse=True, key=lambda x: x[0])
-        best_match = scored_results[0][1]
+        best_score, best_match = scored_results[0]
         self.logger.info(
-            f"Best match for {track.name} by {track.artists[0]}: {best_match.get('title', 'Unknown')} with score {scored_results[0][0]}"
+            f"Best match for {track.name} by {track.artists[0]}: {best_match.get('title', 'Unknown')} with score {best_score}"
+        )
+        return TrackMatch(
+            video_id=best_match["videoId"],
+            score=best_score,
+            title=best_match.get("title"),
         )
-        return f"https://music.youtube.com/watch?v={best_match['videoId']}"
 
     def search_raw(self, track: Track) -> List[Dict]:
         """Return raw YouTube Music search results for a given track."""
         query = f"{track.artists[0]} {track.name} {track.album_name or ''}"
         return self.ytmusic.search(query, filter="songs")
 
-    @lru_cache(maxsize=100)
-    def search_track(self, track: Track) -> Optional[str]:
-        """Search for a track with elegant error handling.
+    def resolve_track(self, track: Track) -> Optional[TrackMatch]:
+        """Resolve a track to its best YouTube Music match with elegant error handling.
         
         Main entry point for track searching with retry logic and caching.
+        The returned match carries the video ID and score, so callers can
+        hand it to the downloader instead of searching again. Matches are
+        looked up in (and stored to) the persistent match cache by Spotify URI.
         
         Args:
             track: Track object to search for
             
         Returns:
-            str: YouTube Music URL if found, None if not found after all attempts
+            TrackMatch: Best match, None if not found after all attempts
         """
+        if self.match_cache and track.uri:
+            cached = self.match_cache.get(track.uri)
+            if cached:
+                self.logger.debug(f"Match cache hit for {track.name}: {cached.video_id}")
+                return cached
+
         last_error = None
 
         for attempt in range(1, self.max_retries + 1):
             try:
-                return self._search_with_fallback(track)
+                match = self._search_with_fallback(track)
+                if match and self.match_cache and track.uri:
+                    self.match_cache.set(track.uri, match)
+                return match
 
             except AlbumNotFoundError as e:
                 self.logger.warning(f"Attempt {attempt}: {str(e)}")
@@ -255,3 +278,15 @@ class YoutubeMusicSearcher:
         if last_error:
             self.logger.info(f"Last error details: {str(last_error)}")
         return None
+
+    def search_track(self, track: Track) -> Optional[str]:
+        """Search for a track and return the URL of its best match.
+        
+        Args:
+            track: Track object to search for
+            
+        Returns:
+            str: YouTube Music URL if found, None if not found after all attempts
+        """
+        match = self.resolve_track(track)
+        return match.url if match else None
@@ -145,6 +145,10 @@ class ApiClient {
         return await response.json();
     }
 
+    getDownloadEventsUrl(taskId) {
+        return `${this.apiUrl}/download/${taskId}/events`;
+    }
+
     async getDownloadStatus(taskId) {
         try {
             const response = await fetch(`${this.apiUrl}/download/${taskId}/status`);
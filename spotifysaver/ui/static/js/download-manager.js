@@ -114,6 +114,50 @@ class DownloadManager {
     }
 
     startProgressMonitoring(taskId) {
+        // Preferir el stream de eventos (SSE); si no está disponible, usar polling
+        if (typeof EventSource === 'undefined') {
+            this.startProgressPolling(taskId);
+            return;
+        }
+
+        const source = new EventSource(this.apiClient.getDownloadEventsUrl(taskId));
+        let finished = false;
+
+        source.addEventListener('status', (event) => {
+            const status = JSON.parse(event.data);
+            console.log('📡 API Status event:', status);
+            finished = this.handleStatusUpdate(status);
+            if (finished) {
+                source.close();
+            }
+        });
+
+        source.onerror = () => {
+            source.close();
+            if (!finished) {
+                console.warn('Event stream unavailable, falling back to polling');
+                this.startProgressPolling(taskId);
+            }
+        };
+    }
+
+    // Devuelve true cuando la tarea ha terminado
+    handleStatusUpdate(status) {
+        if (status.status === 'completed') {
+            this.handleDownloadCompleted();
+            return true;
+        } else if (status.status === 'failed' || status.status === 'cancelled') {
+            this.handleDownloadFailed(status.error_message || 'Download failed', status.current_track_number);
+            return true;
+        } else if (status.status === 'processing') {
+            this.handleDownloadProgress(status);
+        } else if (status.status === 'pending' && status.queue_position) {
+            this.uiManager.updateStatus(`Queued (position ${status.queue_position})...`, 'info');
+        }
+        return false;
+    }
+
+    startProgressPolling(taskId) {
         // Monitorear progreso usando polling
         const pollInterval = 2000; // 2 segundos
         
@@ -123,14 +167,8 @@ class DownloadManager {
                 if (status) {
                     console.log('📡 API Status received:', status);
                     
-                    if (status.status === 'completed') {
-                        this.handleDownloadCompleted();
+                    if (this.handleStatusUpdate(status)) {
                         return;
-                    } else if (status.status === 'failed') {
-                        this.handleDownloadFailed(status.message || 'Download failed', status.current_track_number);
-                        return;
-                    } else if (status.status === 'processing') {
-                        this.handleDownloadProgress(status);
                     }
                     
                     // Continuar monitoreando
@@ -195,10 +233,25 @@ class DownloadManager {
         }
     }
 
+    // Velocidad, ETA y fase de la canción actual
+    formatByteProgress(status) {
+        if (status.phase && status.phase !== 'downloading') {
+            return ` (${status.phase})`;
+        }
+        const parts = [];
+        if (status.speed) {
+            parts.push(`${(status.speed / 1048576).toFixed(1)} MiB/s`);
+        }
+        if (status.eta) {
+            parts.push(`ETA ${Math.round(status.eta)}s`);
+        }
+        return parts.length ? ` (${parts.join(', ')})` : '';
+    }
+
     handleDownloadProgress(status) {
         const currentProgress = status.progress || 0;
         this.uiManager.updateProgress(currentProgress);
-        this.uiManager.updateStatus(`Downloading... ${Math.round(currentProgress)}%`, 'info');
+        this.uiManager.updateStatus(`Downloading... ${Math.round(currentProgress)}%${this.formatByteProgress(status)}`, 'info');
         
         // Actualizar estado de canción actual
         if (status.current_track && this.currentTrackData) {
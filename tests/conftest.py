@@ -0,0 +1,50 @@
+"""Shared pytest configuration.
+
+Keeps the persistent caches and the task store of the tests out of the
+real ``~/.spotify-saver`` directory.
+"""
+
+import os
+import tempfile
+
+os.environ["HOME"] = tempfile.mkdtemp(prefix="spotifysaver-tests-")
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "test-client-id")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "test-client-secret")
+
+import pytest
+
+from spotifysaver.models import Track
+
+
+@pytest.fixture
+def make_track():
+    """Factory of album tracks; keyword arguments override the defaults."""
+
+    def factory(number: int = 1, **fields) -> Track:
+        values = {
+            "source_type": "album",
+            "number": number,
+            "total_tracks": 10,
+            "name": f"Song {number}",
+            "duration": 200,
+            "uri": f"spotify:track:{number}",
+            "artists": ["Artist"],
+            "album_artist": ["Artist"],
+            "album_name": "Album",
+            "release_date": "2020-01-01",
+            "disc_number": 1,
+        }
+        values.update(fields)
+        return Track(**values)
+
+    return factory
+
+
+@pytest.fixture
+def downloader(monkeypatch, tmp_path):
+    """YouTubeDownloaderForCLI writing to a temporary library, without network clients."""
+    from spotifysaver.downloader.youtube_downloader_for_cli import YouTubeDownloaderForCLI
+    from spotifysaver.services import youtube_api
+
+    monkeypatch.setattr(youtube_api, "YTMusic", lambda: None)
+    return YouTubeDownloaderForCLI(base_dir=str(tmp_path / "Music"))
@@ -0,0 +1,136 @@
+"""In-memory stand-in for the subset of redis-py used by the task store."""
+
+import math
+import threading
+
+from spotifysaver.api.services.task_store import WatchError
+
+
+def _encode(value) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode()
+
+
+def _bound(value) -> float:
+    return {"-inf": -math.inf, "+inf": math.inf, "inf": math.inf}.get(value, value)
+
+
+class FakeRedis:
+    """Strings and sorted sets with per-key versions, so WATCH can detect changes."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.data = {}
+        self.versions = {}
+
+    def _touch(self, key):
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def get(self, key):
+        with self.lock:
+            return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        with self.lock:
+            if nx and key in self.data:
+                return None
+            self.data[key] = _encode(value)
+            self._touch(key)
+            return True
+
+    def mget(self, keys):
+        with self.lock:
+            return [self.data.get(key) for key in keys]
+
+    def delete(self, *keys):
+        with self.lock:
+            removed = 0
+            for key in keys:
+                if self.data.pop(key, None) is not None:
+                    removed += 1
+                    self._touch(key)
+            return removed
+
+    def zadd(self, key, mapping):
+        with self.lock:
+            zset = self.data.setdefault(key, {})
+            for member, score in mapping.items():
+                zset[_encode(member)] = float(score)
+            self._touch(key)
+            return len(mapping)
+
+    def zrem(self, key, *members):
+        with self.lock:
+            zset = self.data.get(key, {})
+            removed = sum(1 for member in members if zset.pop(_encode(member), None) is not None)
+            if removed:
+                self._touch(key)
+            return removed
+
+    def zrange(self, key, start, end, withscores=False):
+        with self.lock:
+            items = sorted(self.data.get(key, {}).items(), key=lambda item: item[1])
+        items = items[start:] if end == -1 else items[start : end + 1]
+        return items if withscores else [member for member, _ in items]
+
+    def zrangebyscore(self, key, low, high):
+        low, high = _bound(low), _bound(high)
+        items = self.zrange(key, 0, -1, withscores=True)
+        return [member for member, score in items if low <= score <= high]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def close(self):
+        pass
+
+
+class FakePipeline:
+    """Buffers commands until ``execute``; runs them immediately between WATCH and MULTI."""
+
+    COMMANDS = ("get", "set", "mget", "delete", "zadd", "zrem", "zrange", "zrangebyscore")
+
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.reset()
+
+    def reset(self):
+        self.watched = {}
+        self.immediate = False
+        self.commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.reset()
+
+    def watch(self, *keys):
+        with self.client.lock:
+            self.watched = {key: self.client.versions.get(key, 0) for key in keys}
+        self.immediate = True
+
+    def multi(self):
+        self.immediate = False
+
+    def __getattr__(self, name):
+        if name not in self.COMMANDS:
+            raise AttributeError(name)
+        command = getattr(self.client, name)
+
+        def call(*args, **kwargs):
+            if self.immediate:
+                return command(*args, **kwargs)
+            self.commands.append((command, args, kwargs))
+            return self
+
+        return call
+
+    def execute(self):
+        with self.client.lock:
+            try:
+                versions = self.client.versions
+                if any(versions.get(key, 0) != version for key, version in self.watched.items()):
+                    raise WatchError("Watched key changed")
+                return [command(*args, **kwargs) for command, args, kwargs in self.commands]
+            finally:
+                self.reset()
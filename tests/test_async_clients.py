@@ -0,0 +1,124 @@
+"""Tests of the asyncio Spotify and LRC Lib clients used by the API server."""
+
+import asyncio
+
+import httpx
+
+from spotifysaver.services.async_lrclib_api import AsyncLrclibAPI
+from spotifysaver.services.async_spotify_api import AsyncSpotifyAPI
+from spotifysaver.services.ttl_cache import TTLCache
+
+
+def raw_track(track_id="abc", name="Song"):
+    return {
+        "track_number": 1,
+        "name": name,
+        "duration_ms": 200000,
+        "uri": f"spotify:track:{track_id}",
+        "artists": [{"name": "Artist"}],
+        "album": {
+            "name": "Album",
+            "artists": [{"name": "Artist"}],
+            "release_date": "2020-01-01",
+            "images": [{"url": "https://i.scdn.co/image/cover"}],
+        },
+    }
+
+
+class SpotifyServer:
+    """Answers token and track requests, optionally rejecting the first token once."""
+
+    def __init__(self, reject_first_token=False):
+        self.tokens = 0
+        self.requests = []
+        self.reject_first_token = reject_first_token
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/token":
+            self.tokens += 1
+            token = {"access_token": f"token-{self.tokens}", "expires_in": 3600}
+            return httpx.Response(200, json=token)
+        self.requests.append((request.url.path, request.headers["Authorization"]))
+        if self.reject_first_token and request.headers["Authorization"] == "Bearer token-1":
+            return httpx.Response(401)
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404)
+        return httpx.Response(200, json=raw_track(request.url.path.rsplit("/", 1)[-1]))
+
+
+def _spotify(server):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return AsyncSpotifyAPI(client=client, cache=TTLCache(ttl=60))
+
+
+def test_spotify_client_renews_rejected_tokens_and_caches_tracks():
+    server = SpotifyServer(reject_first_token=True)
+
+    async def main():
+        api = _spotify(server)
+        first = await api.get_track("https://open.spotify.com/track/abc")
+        again = await api.get_track("spotify:track:abc")
+        other = await api.get_track("spotify:track:def")
+        await api.client.aclose()
+        return first, again, other
+
+    first, again, other = asyncio.run(main())
+
+    assert (first.name, first.uri, first.album_name) == ("Song", "spotify:track:abc", "Album")
+    assert again == first
+    assert other.uri == "spotify:track:def"
+    assert server.tokens == 2
+    assert server.requests == [
+        ("/v1/tracks/abc", "Bearer token-1"),
+        ("/v1/tracks/abc", "Bearer token-2"),
+        ("/v1/tracks/def", "Bearer token-2"),
+    ]
+
+
+def test_spotify_client_reports_missing_items_as_value_errors():
+    server = SpotifyServer()
+
+    async def main():
+        api = _spotify(server)
+        try:
+            await api.get_track("spotify:track:missing")
+        except ValueError as e:
+            return str(e)
+        finally:
+            await api.client.aclose()
+
+    assert asyncio.run(main()) == "Track not found or invalid URL"
+
+
+def _lrclib(handler):
+    return AsyncLrclibAPI(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+def test_lyrics_fall_back_to_plain_lyrics(make_track):
+    asked = []
+
+    def handler(request):
+        asked.append(dict(request.url.params))
+        return httpx.Response(200, json={"syncedLyrics": None, "plainLyrics": "La la"})
+
+    async def main():
+        api = _lrclib(handler)
+        lyrics = await api.get_lyrics_with_fallback(make_track(duration=200))
+        await api.client.aclose()
+        return lyrics
+
+    assert asyncio.run(main()) == "La la"
+    assert len(asked) == 2
+    assert asked[0]["track_name"] == "Song 1"
+    assert asked[0]["duration"] == "200"
+
+
+def test_missing_or_failing_lyrics_return_none(make_track):
+    async def main(status):
+        api = _lrclib(lambda request: httpx.Response(status))
+        lyrics = await api.get_lyrics_with_fallback(make_track())
+        await api.client.aclose()
+        return lyrics
+
+    assert asyncio.run(main(404)) is None
+    assert asyncio.run(main(500)) is None
@@ -0,0 +1,95 @@
+"""Tests of the cancellation token and of aborting running downloads."""
+
+import sys
+import threading
+import time
+
+import pytest
+from yt_dlp.utils import DownloadCancelled as YDLDownloadCancelled
+
+from spotifysaver.downloader import transcoder
+from spotifysaver.downloader.cancellation import CancellationToken, DownloadCancelled
+from spotifysaver.downloader.job_journal import FAILED, JobJournal
+from spotifysaver.downloader.transcode_scheduler import TranscodeScheduler
+from spotifysaver.downloader.transcoder import AudioTranscoder
+from spotifysaver.enums import AudioFormat
+from spotifysaver.models import TrackMatch
+
+
+def test_callbacks_run_once_and_late_ones_run_immediately():
+    token = CancellationToken()
+    calls = []
+    token.on_cancel(lambda: calls.append("first"))
+    unregister = token.on_cancel(lambda: calls.append("unregistered"))
+    token.on_cancel(lambda: 1 / 0)  # errors do not stop the other callbacks
+    token.on_cancel(lambda: calls.append("last"))
+    unregister()
+
+    token.cancel("Stopped by user")
+    token.cancel("Again")
+    token.on_cancel(lambda: calls.append("late"))
+
+    assert calls == ["first", "last", "late"]
+    assert token.reason == "Stopped by user"
+    with pytest.raises(DownloadCancelled, match="Stopped by user"):
+        token.raise_if_cancelled()
+
+
+def test_progress_hook_aborts_yt_dlp_downloads():
+    token = CancellationToken()
+    token.progress_hook({"status": "downloading"})
+
+    token.cancel()
+
+    # yt-dlp stops the download instead of reporting an extractor error
+    with pytest.raises(YDLDownloadCancelled):
+        token.progress_hook({"status": "downloading"})
+
+
+def test_cancelling_kills_the_running_ffmpeg_process(tmp_path, monkeypatch):
+    source = tmp_path / "song.source.webm"
+    source.write_bytes(b"stream")
+    output = tmp_path / "song.m4a"
+    monkeypatch.setattr(transcoder, "check_ffmpeg_installed", lambda path: True)
+    converter = AudioTranscoder(scheduler=TranscodeScheduler(max_processes=1))
+    # Stands in for FFmpeg: writes the temporary output, then hangs
+    hang = "import pathlib, sys, time; pathlib.Path(sys.argv[1]).write_bytes(b'x'); time.sleep(30)"
+    monkeypatch.setattr(
+        converter,
+        "build_command",
+        lambda source_path, temp_path, *args: [sys.executable, "-c", hang, str(temp_path)],
+    )
+    token = CancellationToken()
+    threading.Timer(0.5, token.cancel).start()
+
+    started = time.monotonic()
+    with pytest.raises(DownloadCancelled):
+        converter.transcode(source, output, AudioFormat.M4A, cancel_token=token)
+
+    assert time.monotonic() - started < 10
+    assert not output.exists()
+    assert not (tmp_path / "song.temp.m4a").exists()
+
+
+def test_cancelled_track_is_cleaned_up_without_being_marked_failed(
+    downloader, make_track, monkeypatch
+):
+    track = make_track()
+    output_path = downloader._build_output_path(track, None, AudioFormat.M4A)
+
+    def fetch_audio(url, output_path, *args):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.with_suffix(".source.webm").write_bytes(b"partial")
+        downloader.cancel("Stopped by user")
+        downloader.cancel_token.progress_hook({"status": "downloading"})
+
+    monkeypatch.setattr(downloader, "_resolve", lambda track: TrackMatch(video_id="abc", score=1.0))
+    monkeypatch.setattr(downloader, "_fetch_audio", fetch_audio)
+    downloader.journal = JobJournal.for_job(downloader.base_dir, "album-test")
+
+    assert downloader.download_track(track) == (None, None)
+    assert list(output_path.parent.iterdir()) == []
+    assert downloader.journal.entries.get(track.uri, {}).get("state") != FAILED
+    # Tracks that have not started yet are skipped
+    assert downloader.download_track(make_track(2)) == (None, None)
+    downloader.journal.close()
@@ -0,0 +1,33 @@
+"""The CLI entry point must start without importing the heavy dependencies."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+HEAVY_MODULES = ("yt_dlp", "ytmusicapi", "spotipy", "mutagen")
+
+
+def test_cli_import_does_not_load_heavy_dependencies(tmp_path):
+    env = {
+        **os.environ,
+        "HOME": str(tmp_path),
+        "SPOTIFY_CLIENT_ID": "test-client-id",
+        "SPOTIFY_CLIENT_SECRET": "test-client-secret",
+    }
+    code = (
+        "import sys, spotifysaver.cli.cli; "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
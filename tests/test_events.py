@@ -0,0 +1,101 @@
+"""Tests of the task event broker and the event stream endpoint."""
+
+import asyncio
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from spotifysaver.api.routers import download
+from spotifysaver.api.schemas import DownloadStatus
+from spotifysaver.api.services.events import TaskEventBroker
+from spotifysaver.api.services.task_store import SQLiteTaskStore
+
+
+def _task(status="processing", progress=0):
+    return DownloadStatus(task_id="task", status=status, progress=progress)
+
+
+def test_subscribers_receive_changes_published_from_other_threads():
+    broker = TaskEventBroker()
+
+    async def main():
+        queue = broker.subscribe("task")
+        thread = threading.Thread(
+            target=lambda: [broker.publish(_task(progress=p)) for p in (10, 10, 20)]
+        )
+        thread.start()
+        thread.join()
+        received = [(await queue.get()).progress for _ in range(2)]
+        await asyncio.sleep(0)
+        broker.unsubscribe("task", queue)
+        return received, queue.empty()
+
+    received, drained = asyncio.run(main())
+
+    assert received == [10, 20]
+    assert drained
+    assert broker.subscriber_count() == 0
+
+
+def test_last_update_is_only_remembered_while_subscribed():
+    broker = TaskEventBroker()
+
+    broker.publish(_task(progress=10))
+    assert broker._last_payload == {}
+
+    async def main():
+        queue = broker.subscribe("task")
+        broker.publish(_task(progress=10))
+        remembered = "task" in broker._last_payload
+        broker.publish(_task(status="completed", progress=100))
+        finished = "task" in broker._last_payload
+        broker.publish(_task(progress=50))
+        broker.unsubscribe("task", queue)
+        return remembered, finished
+
+    remembered, finished = asyncio.run(main())
+
+    assert remembered and not finished
+    assert broker._last_payload == {}
+
+
+def test_event_stream_sends_each_change_until_the_task_finishes(tmp_path, monkeypatch):
+    store = SQLiteTaskStore(tmp_path / "tasks.db", ttl_hours=1)
+    broker = TaskEventBroker()
+    monkeypatch.setattr(download, "get_task_store", lambda: store)
+    monkeypatch.setattr(download, "get_event_broker", lambda: broker)
+    app = FastAPI()
+    app.include_router(download.router, prefix="/api/v1")
+    store.save(_task())
+
+    def publish_when_subscribed():
+        while not broker.subscriber_count("task"):
+            time.sleep(0.01)
+        for update in (_task(progress=50), _task(progress=50)):
+            broker.publish(update)
+        broker.publish(_task(status="completed", progress=100))
+
+    # The test client returns once the stream has ended
+    publisher = threading.Thread(target=publish_when_subscribed)
+    publisher.start()
+    with TestClient(app) as client:
+        response = client.get("/api/v1/download/task/events")
+        missing = client.get("/api/v1/download/unknown/events")
+    publisher.join()
+    events = [
+        DownloadStatus.model_validate_json(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert [(event.status, event.progress) for event in events] == [
+        ("processing", 0),
+        ("processing", 50),
+        ("completed", 100),
+    ]
+    assert broker.subscriber_count() == 0
+    assert missing.status_code == 404
+    store.close()
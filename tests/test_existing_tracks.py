@@ -0,0 +1,33 @@
+"""Tracks already in the library are looked up once per download."""
+
+import pytest
+
+
+@pytest.fixture
+def lookups(downloader, monkeypatch):
+    """Record the library lookups; every track is missing and fails to download."""
+    calls = []
+
+    def find_existing(track, output_path, download_lyrics=False):
+        calls.append(track.uri)
+        return None
+
+    def fetch_audio(*args, **kwargs):
+        raise RuntimeError("offline")
+
+    monkeypatch.setattr(downloader, "_find_existing", find_existing)
+    monkeypatch.setattr(downloader, "_resolve", lambda track: object())
+    monkeypatch.setattr(downloader, "_fetch_audio", fetch_audio)
+    return calls
+
+
+def test_single_track_checks_the_library_once(downloader, lookups, make_track):
+    assert downloader.download_track_cli(make_track()) == (None, None)
+    assert lookups == ["spotify:track:1"]
+
+
+def test_track_list_checks_each_track_once(downloader, lookups, make_track):
+    success, total = downloader.download_tracks_cli([make_track(1), make_track(2)])
+
+    assert (success, total) == (0, 2)
+    assert sorted(lookups) == ["spotify:track:1", "spotify:track:2"]
@@ -0,0 +1,56 @@
+"""Tests of the yt-dlp format selector preferring streams in the target codec."""
+
+import pytest
+import yt_dlp
+
+from spotifysaver.config import Config
+from spotifysaver.enums import AudioFormat, Bitrate
+
+# Audio streams YouTube Music typically offers
+FORMATS = [
+    {"format_id": "139", "ext": "m4a", "acodec": "mp4a.40.5", "abr": 48.8},
+    {"format_id": "250", "ext": "webm", "acodec": "opus", "abr": 70.1},
+    {"format_id": "140", "ext": "m4a", "acodec": "mp4a.40.2", "abr": 129.5},
+    {"format_id": "251", "ext": "webm", "acodec": "opus", "abr": 134.9},
+]
+
+
+def _select(selector):
+    stream = {"vcodec": "none", "protocol": "https", "url": "https://example.com/stream"}
+    formats = [{**fmt, **stream, "tbr": fmt["abr"]} for fmt in FORMATS]
+    with yt_dlp.YoutubeDL({"quiet": True}) as ydl:
+        select = ydl.build_format_selector(selector)
+        ctx = {"formats": formats, "incomplete_formats": False, "has_merged_format": False}
+        return [fmt["format_id"] for fmt in select(ctx)]
+
+
+@pytest.mark.parametrize(
+    "output_format, bitrate, expected",
+    [
+        (AudioFormat.M4A, Bitrate.B128, "140"),
+        (AudioFormat.OPUS, Bitrate.B128, "251"),
+        # The 48 kbps HE-AAC stream is too far below 96 kbps
+        (AudioFormat.M4A, Bitrate.B96, "251"),
+        (AudioFormat.OPUS, Bitrate.B96, "251"),
+        (AudioFormat.MP3, Bitrate.B128, "251"),
+    ],
+)
+def test_streams_in_the_target_codec_near_the_bitrate_are_preferred(
+    downloader, output_format, bitrate, expected
+):
+    assert _select(downloader._get_format_selector(output_format, bitrate)) == [expected]
+
+
+def test_abr_bounds_allow_the_nominal_youtube_rates(downloader):
+    assert downloader._get_format_selector(AudioFormat.M4A, Bitrate.B128) == (
+        "bestaudio[acodec^=mp4a][abr>=?96][abr<=?135]/bestaudio/best"
+    )
+    assert downloader._get_format_selector(AudioFormat.OPUS, Bitrate.B256) == (
+        "bestaudio[acodec=opus][abr>=?192][abr<=?269]/bestaudio/best"
+    )
+
+
+def test_native_format_preference_can_be_disabled(downloader, monkeypatch):
+    monkeypatch.setattr(Config, "YTDLP_NATIVE_FORMAT", False)
+
+    assert downloader._get_format_selector(AudioFormat.M4A, Bitrate.B128) == "bestaudio/best"
@@ -0,0 +1,33 @@
+"""Tests of the shared HTTP client."""
+
+import requests
+
+from spotifysaver.services.http_client import HTTPClient
+
+
+def test_hosts_get_their_own_pool_sizes():
+    client = HTTPClient(pool_size=4, host_pool_sizes={"lrclib.net": 8})
+
+    host_adapter = client.session.get_adapter("https://lrclib.net/api/get")
+    default_adapter = client.session.get_adapter("https://api.example.com/v1")
+
+    assert host_adapter is not default_adapter
+    assert host_adapter._pool_maxsize == 8
+    assert default_adapter._pool_maxsize == 4
+    assert client.session.get_adapter("http://example.com/") is default_adapter
+    assert host_adapter.max_retries.total == client._retry.total
+
+
+def test_default_adapter_keeps_the_pools_of_several_hosts():
+    client = HTTPClient(host_pool_sizes={})
+    adapter = client.session.get_adapter("https://api.example.com/")
+
+    def pool(url):
+        request = requests.Request("GET", url).prepare()
+        return adapter.get_connection_with_tls_context(request, verify=True, proxies={})
+
+    pools = [pool(f"https://host{n}.example.com/") for n in range(3)]
+
+    assert adapter._pool_connections >= 10
+    assert pool("https://host0.example.com/") is pools[0]
+    client.close()
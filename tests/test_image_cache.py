@@ -0,0 +1,71 @@
+"""Tests of the content-addressed image cache."""
+
+import threading
+import time
+
+from spotifysaver.downloader.image_cache import ImageCache
+
+
+def test_memory_tier_evicts_least_recently_used_by_size():
+    cache = ImageCache(maxbytes=10)
+    cache.put("a", b"aaaa")
+    cache.put("b", b"bbbb")
+    cache.get("a")
+    cache.put("c", b"cccc")
+
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_same_content_is_stored_once(tmp_path):
+    cache = ImageCache(maxbytes=100, cache_dir=tmp_path)
+    cache.put("https://img/1", b"cover")
+    cache.put("https://img/2", b"cover")
+
+    assert cache.path("https://img/1") == cache.path("https://img/2")
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["disk_entries"] == 1
+
+
+def test_disk_tier_survives_a_new_instance_and_drops_modified_blobs(tmp_path):
+    ImageCache(maxbytes=100, cache_dir=tmp_path).put("https://img/1", b"cover")
+
+    cache = ImageCache(maxbytes=100, cache_dir=tmp_path)
+    assert cache.get("https://img/1") == b"cover"
+    assert cache.stats()["disk_hits"] == 1
+
+    cache.path("https://img/1").write_bytes(b"edited")
+    assert ImageCache(maxbytes=100, cache_dir=tmp_path).get("https://img/1") is None
+
+
+def test_concurrent_misses_call_the_loader_once(tmp_path):
+    # Images larger than the memory tier are only found again on disk
+    cache = ImageCache(maxbytes=1, cache_dir=tmp_path)
+    calls = []
+
+    def loader():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return b"cover"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("https://img/1", loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [b"cover"] * 8
+    assert not cache._url_locks
+
+
+def test_failed_load_is_not_cached():
+    cache = ImageCache(maxbytes=100)
+
+    assert cache.get_or_load("https://img/1", lambda: None) is None
+    assert cache.get_or_load("https://img/1", lambda: b"cover") == b"cover"
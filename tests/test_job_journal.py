@@ -0,0 +1,49 @@
+"""Tests for the checkpoint journal of batch downloads."""
+
+from spotifysaver.downloader.job_journal import FAILED, TAGGED, JobJournal
+from spotifysaver.models import TrackMatch
+
+
+def test_resume_replays_states_and_matches(tmp_path, make_track):
+    done, failed = make_track(1), make_track(2)
+    journal = JobJournal(tmp_path / "job.jsonl")
+    journal.record_match(done, TrackMatch(video_id="v1", score=0.9))
+    journal.record(done, TAGGED, path="a.m4a")
+    journal.record(failed, FAILED, error="boom")
+    journal.close()
+    # A line cut short by a crash is ignored
+    with journal.path.open("a", encoding="utf-8") as file:
+        file.write('{"uri": "spotify:track:3", "sta')
+
+    resumed = JobJournal(tmp_path / "job.jsonl", resume=True)
+    output_path = tmp_path / "a.m4a"
+    output_path.write_bytes(b"audio")
+
+    assert resumed.is_done(done, output_path)
+    assert not resumed.is_done(failed, output_path)
+    assert resumed.get_match(done).video_id == "v1"
+    assert not resumed.is_complete(2)
+    resumed.close()
+
+
+def test_is_complete_counts_unique_tracks(tmp_path, make_track):
+    journal = JobJournal(tmp_path / "job.jsonl")
+    journal.record(make_track(1), TAGGED)
+    journal.record(make_track(2), TAGGED)
+
+    assert journal.is_complete(2)
+    assert not journal.is_complete(3)
+    journal.close()
+
+
+def test_job_with_duplicate_tracks_removes_its_journal(downloader, make_track):
+    first, second = make_track(1), make_track(2)
+    tracks = [first, second, first]
+
+    with downloader._job_journal("playlist-dupes", tracks, resume=False) as job_tracks:
+        path = downloader.journal.path
+        for track in job_tracks:
+            downloader._checkpoint(track, TAGGED)
+
+    assert job_tracks.count == 3
+    assert not path.exists()
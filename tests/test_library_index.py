@@ -0,0 +1,92 @@
+"""Tests of the SQLite index of the files already in the library."""
+
+import os
+
+import pytest
+
+from spotifysaver.downloader import library_index
+from spotifysaver.downloader.library_index import LibraryIndex
+
+
+class FakeTags(dict):
+    """Tags returned for each file name; files without an entry are untagged."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = []
+
+    def read(self, path):
+        self.reads.append(path.name)
+        return self.get(path.name)
+
+
+@pytest.fixture
+def tags(monkeypatch):
+    fake = FakeTags()
+    monkeypatch.setattr(library_index.MusicFileMetadata, "read_tags", staticmethod(fake.read))
+    return fake
+
+
+def _tags(title, uri=None):
+    return {"title": title, "artist": "Artist", "album": "Album", "spotify_uri": uri}
+
+
+def _write(path, data=b"audio"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_scan_only_reads_new_and_changed_files(tmp_path, tags):
+    album = tmp_path / "Artist" / "Album"
+    song = _write(album / "01 - Song.m4a")
+    other = _write(album / "02 - Other.mp3")
+    _write(album / "03 - Partial.source.webm")
+    _write(album / "04 - Converting.temp.m4a")
+    _write(album / "cover.jpg")
+    _write(tmp_path / ".spotifysaver" / "hidden.m4a")
+    index = LibraryIndex(tmp_path)
+
+    assert index.scan() == {"indexed": 2, "unchanged": 0, "removed": 0}
+    assert sorted(tags.reads) == ["01 - Song.m4a", "02 - Other.mp3"]
+
+    tags.reads.clear()
+    _write(song, b"longer audio")
+    other.unlink()
+
+    assert index.scan() == {"indexed": 1, "unchanged": 0, "removed": 1}
+    assert tags.reads == ["01 - Song.m4a"]
+    assert index.stats()["files"] == 1
+
+
+def test_is_present_matches_uri_or_legacy_title_but_not_untagged_files(tmp_path, tags):
+    tagged = _write(tmp_path / "A" / "tagged.m4a")
+    legacy = _write(tmp_path / "A" / "legacy.mp3")
+    untagged = _write(tmp_path / "A" / "untagged.opus")
+    tags["tagged.m4a"] = _tags("Song", "spotify:track:1")
+    tags["legacy.mp3"] = _tags("Old Song")
+    index = LibraryIndex(tmp_path)
+
+    assert index.is_present(tagged, "spotify:track:1", "Song")
+    assert not index.is_present(tagged, "spotify:track:2", "Song")
+    assert index.is_present(legacy, "spotify:track:3", "Old Song")
+    assert not index.is_present(legacy, "spotify:track:3", "Other Song")
+    # Unreadable or untagged files (e.g. cut short by a crash) are downloaded again
+    assert not index.is_present(untagged, "spotify:track:4", "Song")
+    assert index.stats() == {"path": str(index.db_path), "files": 3, "with_uri": 1}
+
+
+def test_is_present_rereads_changed_files_and_forgets_missing_ones(tmp_path, tags):
+    path = _write(tmp_path / "A" / "song.m4a")
+    index = LibraryIndex(tmp_path)
+    assert not index.is_present(path, "spotify:track:1")
+
+    # Tagged later by another run: a new mtime makes the index read it again
+    tags["song.m4a"] = _tags("Song", "spotify:track:1")
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert index.is_present(path, "spotify:track:1")
+
+    path.unlink()
+    assert not index.is_present(path, "spotify:track:1")
+    assert index.stats()["files"] == 0
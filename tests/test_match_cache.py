@@ -0,0 +1,63 @@
+"""Tests of the persistent YouTube Music match cache and its CLI command."""
+
+import time
+
+from click.testing import CliRunner
+
+from spotifysaver.cli.commands.cache.cache import cache
+from spotifysaver.config import Config
+from spotifysaver.models import TrackMatch
+from spotifysaver.services import match_cache
+from spotifysaver.services.match_cache import MatchCache
+
+DAY = 86400
+
+
+def _fill(cache_db, monkeypatch, ages):
+    """Store one match per age (in days) and return to the present."""
+    now = time.time()
+    for index, age in enumerate(ages):
+        monkeypatch.setattr(match_cache.time, "time", lambda: now - age * DAY)
+        cache_db.set(f"spotify:track:{index}", TrackMatch(video_id=f"v{index}", score=0.9))
+    monkeypatch.setattr(match_cache.time, "time", lambda: now)
+
+
+def test_matches_survive_a_new_instance_until_they_expire(tmp_path, monkeypatch):
+    db_path = tmp_path / "matches.db"
+    _fill(MatchCache(db_path, ttl_days=30), monkeypatch, [0, 40])
+
+    reopened = MatchCache(db_path, ttl_days=30)
+
+    assert reopened.get("spotify:track:0").video_id == "v0"
+    assert reopened.get("spotify:track:1") is None
+    assert reopened.stats()["entries"] == 2
+    assert reopened.stats()["expired"] == 1
+    assert MatchCache(db_path, ttl_days=0).get("spotify:track:1").video_id == "v1"
+
+
+def test_invalidate_filters_by_uri_age_and_expiration(tmp_path, monkeypatch):
+    matches = MatchCache(tmp_path / "matches.db", ttl_days=30)
+    _fill(matches, monkeypatch, [1, 10, 40, 50])
+
+    assert matches.invalidate(expired_only=True) == 2
+    assert matches.invalidate(older_than_days=5) == 1
+    assert matches.invalidate(spotify_uri="spotify:track:9") == 0
+    assert matches.invalidate(spotify_uri="spotify:track:0") == 1
+    assert matches.stats()["entries"] == 0
+
+
+def test_cache_clear_command_passes_its_filters(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "MATCH_CACHE_PATH", tmp_path / "matches.db")
+    monkeypatch.setattr(Config, "MATCH_CACHE_TTL_DAYS", 30)
+    _fill(MatchCache(), monkeypatch, [1, 10, 40])
+    runner = CliRunner()
+
+    expired = runner.invoke(cache, ["clear", "--expired"])
+    older = runner.invoke(cache, ["clear", "--older-than", "5"])
+    everything = runner.invoke(cache, ["clear"])
+
+    assert expired.exit_code == 0, expired.output
+    assert "Removed 1 cached matches" in expired.output
+    assert "Removed 1 cached matches" in older.output
+    assert "Removed 1 cached matches" in everything.output
+    assert MatchCache().stats()["entries"] == 0
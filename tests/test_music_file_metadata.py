@@ -0,0 +1,53 @@
+"""Tests of the tags written after FFmpeg and read back by the library index."""
+
+from mutagen.mp4 import MP4FreeForm
+
+from spotifysaver.metadata import music_file_metadata
+from spotifysaver.metadata.music_file_metadata import MusicFileMetadata
+
+
+class NoGenreAudioDB:
+    def get_track_metadata(self, *args):
+        return None
+
+    def get_album_metadata(self, *args):
+        return None
+
+
+class FakeAudio(dict):
+    def __init__(self, tags=None):
+        super().__init__()
+        self.tags = tags
+        self.saved = False
+
+    def save(self):
+        self.saved = True
+
+
+def test_mutagen_adds_the_spotify_uri_of_m4a_files_after_ffmpeg(make_track, monkeypatch, tmp_path):
+    track = make_track(uri="spotify:track:abc")
+    metadata = MusicFileMetadata(tmp_path / "song.m4a", track, audiodb=NoGenreAudioDB())
+    opened = []
+    monkeypatch.setattr(music_file_metadata, "MP4", lambda path: opened.append(FakeAudio()) or opened[-1])
+
+    # FFmpeg cannot write iTunes freeform atoms
+    assert "comment" not in metadata.ffmpeg_tags()
+    assert MusicFileMetadata.MP4_SPOTIFY_URI_KEY not in metadata.ffmpeg_tags()
+    assert metadata.add_remaining_metadata()
+
+    (audio,) = opened
+    assert audio.saved
+    assert audio[MusicFileMetadata.MP4_SPOTIFY_URI_KEY] == [MP4FreeForm(b"spotify:track:abc")]
+
+
+def test_read_tags_finds_the_uri_in_the_freeform_atom(monkeypatch, tmp_path):
+    tags = {
+        "\xa9nam": ["Song"],
+        MusicFileMetadata.MP4_SPOTIFY_URI_KEY: [MP4FreeForm(b"spotify:track:abc")],
+    }
+    monkeypatch.setattr(music_file_metadata, "File", lambda path: FakeAudio(tags))
+
+    read = MusicFileMetadata.read_tags(tmp_path / "song.m4a")
+
+    assert read["title"] == "Song"
+    assert read["spotify_uri"] == "spotify:track:abc"
@@ -0,0 +1,88 @@
+"""Tests of the staged download pipeline."""
+
+import threading
+import time
+
+from spotifysaver.downloader.cancellation import CancellationToken
+from spotifysaver.downloader.pipeline import DownloadPipeline, PipelineStage
+
+
+def test_items_go_through_every_stage():
+    pipeline = DownloadPipeline(
+        [
+            PipelineStage("double", lambda n: n * 2, workers=3),
+            PipelineStage("increment", lambda n: n + 1, workers=2),
+        ],
+        queue_size=2,
+    )
+    completed = []
+
+    succeeded = pipeline.run(range(20), lambda item, ok: completed.append((item, ok)))
+
+    assert succeeded == 20
+    assert sorted(item for item, _ in completed) == [n * 2 + 1 for n in range(20)]
+    assert all(ok for _, ok in completed)
+    stats = pipeline.stats()
+    assert stats["double"].processed == stats["increment"].processed == 20
+    assert stats["increment"].queue_depth == 0
+
+
+def test_failed_items_are_reported_once_and_skip_later_stages():
+    def check(n):
+        if n == 3:
+            raise RuntimeError("broken")
+        return None if n == 5 else n
+
+    later = []
+
+    def record(n):
+        later.append(n)
+        return n
+
+    pipeline = DownloadPipeline(
+        [PipelineStage("check", check, workers=2), PipelineStage("later", record)]
+    )
+    completed = []
+
+    assert pipeline.run(range(8), lambda item, ok: completed.append((item, ok))) == 6
+    assert sorted(item for item, ok in completed if not ok) == [3, 5]
+    assert sorted(later) == [0, 1, 2, 4, 6, 7]
+    assert len(completed) == 8
+    assert pipeline.stats()["check"].failed == 2
+
+
+def test_stages_run_concurrently():
+    running, peak = 0, 0
+    lock = threading.Lock()
+
+    def slow(n):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return n
+
+    DownloadPipeline([PipelineStage("slow", slow, workers=4)]).run(range(12))
+
+    assert peak == 4
+
+
+def test_cancellation_drops_queued_items():
+    token = CancellationToken()
+    handled = []
+
+    def handler(n):
+        handled.append(n)
+        if n == 2:
+            token.cancel()
+        return n
+
+    pipeline = DownloadPipeline([PipelineStage("one", handler)], queue_size=1, cancel_token=token)
+    completed = []
+
+    assert pipeline.run(range(50), lambda item, ok: completed.append(ok)) == 3
+    assert handled == [0, 1, 2]
+    assert completed.count(True) == 3
@@ -0,0 +1,209 @@
+"""Tests of the concurrent, ordered playlist page fetching of the Spotify clients."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from spotipy.exceptions import SpotifyException
+
+from spotifysaver.config import Config
+from spotifysaver.services.async_spotify_api import AsyncSpotifyAPI
+from spotifysaver.services.spotify_api import SpotifyAPI
+from spotifysaver.services.ttl_cache import TTLCache
+
+TOTAL = 1000
+PAGE_SIZE = SpotifyAPI.PLAYLIST_PAGE_SIZE
+RETRY_AFTER = 0.3
+
+
+def page(offset, total=TOTAL):
+    items = [{"index": index} for index in range(offset, min(offset + PAGE_SIZE, total))]
+    return {"items": items, "offset": offset, "limit": PAGE_SIZE, "total": total}
+
+
+class PageServer:
+    """Serves playlist pages, tracking overlap and rate limiting one page once."""
+
+    def __init__(self, limited_offset=None):
+        self.limited_offset = limited_offset
+        self.limited_at = None
+        self.started = []
+        self.running = self.peak = 0
+        self.lock = threading.Lock()
+
+    def begin(self, offset):
+        with self.lock:
+            self.started.append((offset, time.monotonic()))
+            if offset == self.limited_offset and self.limited_at is None:
+                self.limited_at = time.monotonic()
+                return False
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            return True
+
+    def end(self):
+        with self.lock:
+            self.running -= 1
+
+    def started_during_pause(self):
+        """Requests sent while the rate limit pause was running."""
+        return [
+            offset
+            for offset, at in self.started
+            if self.limited_at < at < self.limited_at + RETRY_AFTER - 0.05
+        ]
+
+
+class FakeSpotipy:
+    def __init__(self, server):
+        self.server = server
+
+    def playlist_tracks(self, playlist_id, limit, offset):
+        if not self.server.begin(offset):
+            raise SpotifyException(429, -1, "rate limited", headers={"Retry-After": str(RETRY_AFTER)})
+        time.sleep(0.05)
+        self.server.end()
+        return page(offset)
+
+
+@pytest.fixture
+def concurrency(monkeypatch):
+    monkeypatch.setattr(Config, "SPOTIFY_PAGE_CONCURRENCY", 3)
+    return 3
+
+
+def _spotify(server):
+    api = SpotifyAPI(cache=TTLCache(ttl=60))
+    api.sp = FakeSpotipy(server)
+    return api
+
+
+def test_pages_are_fetched_concurrently(concurrency):
+    server = PageServer()
+
+    pages = list(_spotify(server).iter_playlist_items("pl"))
+
+    assert [item["index"] for items in pages for item in items] == list(range(TOTAL))
+    assert server.peak == concurrency
+
+
+def test_a_rate_limited_page_pauses_every_page_request(concurrency):
+    server = PageServer(limited_offset=3 * PAGE_SIZE)
+
+    pages = list(_spotify(server).iter_playlist_items("pl"))
+
+    assert len(pages) == TOTAL // PAGE_SIZE
+    assert [offset for offset, _ in server.started].count(3 * PAGE_SIZE) == 2
+    assert server.started_during_pause() == []
+
+
+def test_async_client_pauses_every_request_after_a_rate_limit(concurrency):
+    server = PageServer(limited_offset=3 * PAGE_SIZE)
+
+    async def handler(request):
+        if request.url.path == "/api/token":
+            return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+        offset = int(request.url.params["offset"])
+        if not server.begin(offset):
+            return httpx.Response(429, headers={"Retry-After": str(RETRY_AFTER)})
+        await asyncio.sleep(0.05)
+        server.end()
+        return httpx.Response(200, json=page(offset))
+
+    async def main():
+        api = AsyncSpotifyAPI(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            cache=TTLCache(ttl=60),
+        )
+        pages = [items async for items in api.iter_playlist_items("pl")]
+        await api.client.aclose()
+        return pages
+
+    pages = asyncio.run(main())
+
+    assert [item["index"] for items in pages for item in items] == list(range(TOTAL))
+    assert server.peak == concurrency
+    assert server.started_during_pause() == []
+
+
+class SlowFirstSpotipy:
+    """Earlier pages answer slower, so they complete out of order."""
+
+    def __init__(self, total=TOTAL):
+        self.total = total
+        self.requested = []
+
+    def playlist_tracks(self, playlist_id, limit, offset):
+        self.requested.append(offset)
+        time.sleep(0.01 * (10 - offset // PAGE_SIZE))
+        return page(offset, self.total)
+
+    def playlist(self, playlist_id, fields=None):
+        return {
+            "name": "Mix",
+            "owner": {"display_name": "me"},
+            "uri": f"spotify:playlist:{playlist_id}",
+            "images": [],
+            "tracks": {"total": self.total},
+        }
+
+
+def test_pages_stream_in_playlist_order_a_few_ahead_of_the_consumer(concurrency):
+    api = SpotifyAPI(cache=TTLCache(ttl=60))
+    api.sp = SlowFirstSpotipy()
+
+    pages = api.iter_playlist_items("pl")
+    first_pages = [next(pages), next(pages)]
+    requested_early = len(api.sp.requested)
+    rest = list(pages)
+
+    assert [items[0]["index"] for items in first_pages + rest] == list(range(0, TOTAL, PAGE_SIZE))
+    assert requested_early <= 1 + concurrency + 1
+
+
+def test_stopping_early_leaves_later_pages_unrequested(concurrency):
+    api = SpotifyAPI(cache=TTLCache(ttl=60))
+    api.sp = SlowFirstSpotipy()
+
+    pages = api.iter_playlist_items("pl")
+    next(pages)
+    next(pages)
+    pages.close()
+    time.sleep(0.2)
+
+    assert len(api.sp.requested) < TOTAL // PAGE_SIZE
+
+
+class TrackPageSpotipy(SlowFirstSpotipy):
+    """Pages of playlist items carrying tracks; item 150 is a removed track."""
+
+    def playlist_tracks(self, playlist_id, limit, offset):
+        result = super().playlist_tracks(playlist_id, limit, offset)
+        for item in result["items"]:
+            item["track"] = None if item["index"] == 150 else {
+                "name": f"Song {item['index']}",
+                "uri": f"spotify:track:{item['index']}",
+                "duration_ms": 1000,
+                "artists": [{"name": "Artist"}],
+                "album": {
+                    "name": "Album",
+                    "artists": [{"name": "Artist"}],
+                    "release_date": "2020",
+                    "images": [],
+                },
+            }
+        return result
+
+
+def test_playlist_tracks_are_numbered_across_pages(concurrency):
+    api = SpotifyAPI(cache=TTLCache(ttl=60))
+    api.sp = TrackPageSpotipy(total=250)
+
+    tracks = list(api.iter_playlist_tracks("spotify:playlist:pl"))
+
+    assert len(tracks) == 249
+    assert [track.number for track in tracks[149:151]] == [150, 152]
+    assert {track.total_tracks for track in tracks} == {250}
+    assert tracks[-1].uri == "spotify:track:249"
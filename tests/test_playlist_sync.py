@@ -0,0 +1,113 @@
+"""Tests for the incremental playlist sync."""
+
+from spotifysaver.downloader.job_journal import JobJournal
+from spotifysaver.downloader.playlist_sync import PlaylistSync
+from spotifysaver.enums import AudioFormat
+from spotifysaver.models import Playlist
+
+
+class FakeSpotify:
+    def __init__(self, playlist: Playlist):
+        self.playlist = playlist
+
+    def _extract_spotify_id(self, url):
+        return url.rsplit(":", 1)[-1]
+
+    def get_playlist_snapshot_id(self, url):
+        return self.playlist.snapshot_id
+
+    def get_playlist(self, url, snapshot_id=None):
+        return self.playlist
+
+
+def make_playlist(tracks, snapshot_id="snap1", playlist_id="pl1"):
+    return Playlist(
+        name="Mix",
+        description="",
+        owner="me",
+        uri=f"spotify:playlist:{playlist_id}",
+        cover_url=None,
+        tracks=tracks,
+        snapshot_id=snapshot_id,
+    )
+
+
+def test_sync_downloads_missing_tracks_under_its_own_job(downloader, make_track):
+    present = make_track(1, album_name="Old")
+    missing = make_track(2, album_name="New")
+    playlist = make_playlist([present, missing])
+
+    present_path = downloader._build_output_path(present, None, AudioFormat.M4A)
+    present_path.parent.mkdir(parents=True)
+    present_path.write_bytes(b"audio")
+
+    # Checkpoint of an interrupted full download of the same playlist
+    full_job = JobJournal.for_job(
+        downloader.base_dir, JobJournal.playlist_job_id(playlist, AudioFormat.M4A.value)
+    )
+    full_job.record(present, "tagged")
+    full_job.close()
+
+    downloaded = []
+
+    def download_track(track, **kwargs):
+        downloaded.append(track.uri)
+        path = downloader._get_output_path(track, None, AudioFormat.M4A)
+        path.write_bytes(b"audio")
+        return path, track
+
+    downloader.download_track = download_track
+    result = PlaylistSync(FakeSpotify(playlist), downloader).sync("spotify:playlist:pl1")
+
+    assert downloaded == [missing.uri]
+    assert (result.added, result.downloaded) == (1, 1)
+    assert full_job.path.read_text(encoding="utf-8").strip(), "full download checkpoint was truncated"
+
+
+def test_sync_computes_paths_without_creating_directories(downloader, make_track):
+    track = make_track(1, album_name="Unavailable")
+    playlist = make_playlist([track])
+    downloader.download_track = lambda track, **kwargs: (None, None)
+
+    result = PlaylistSync(FakeSpotify(playlist), downloader).sync("spotify:playlist:pl1")
+
+    assert result.failed == 1
+    assert not downloader._build_output_path(track, None, AudioFormat.M4A).parent.exists()
+
+
+def test_prune_keeps_files_other_downloads_use(downloader, make_track):
+    shared = make_track(1, album_name="Shared")
+    only_here = make_track(2, album_name="Mine")
+    claimed = make_track(3, album_name="Claimed")
+
+    def download_track(track, **kwargs):
+        path = downloader._get_output_path(track, None, AudioFormat.M4A)
+        path.write_bytes(b"audio")
+        downloader.library.record(path, "playlist")
+        return path, track
+
+    downloader.download_track = download_track
+    PlaylistSync(
+        FakeSpotify(make_playlist([shared, only_here, claimed], playlist_id="a")), downloader
+    ).sync("spotify:playlist:a")
+    PlaylistSync(FakeSpotify(make_playlist([shared], playlist_id="b")), downloader).sync(
+        "spotify:playlist:b"
+    )
+    paths = {
+        track.uri: downloader._build_output_path(track, None, AudioFormat.M4A)
+        for track in (shared, only_here, claimed)
+    }
+    # A later album download found the file and now owns it
+    downloader.library.claim(paths[claimed.uri], "album")
+    assert downloader.library.get_origin(paths[only_here.uri]) == "playlist"
+
+    result = PlaylistSync(
+        FakeSpotify(make_playlist([], snapshot_id="snap2", playlist_id="a")), downloader
+    ).sync("spotify:playlist:a", prune=True)
+
+    assert (result.removed, result.pruned) == (3, 1)
+    assert not paths[only_here.uri].exists()
+    assert downloader.library.get_origin(paths[only_here.uri]) is None
+    assert paths[shared.uri].exists()
+    assert paths[claimed.uri].exists()
+    assert downloader.library.get_origin(paths[claimed.uri]) == "album"
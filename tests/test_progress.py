@@ -0,0 +1,76 @@
+"""Tests of the byte-level progress reported from the yt-dlp hooks."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from spotifysaver.downloader import progress
+from spotifysaver.downloader.progress import TrackProgress, YDLProgressReporter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Monotonic clock of the reporter, moved by hand."""
+    now = SimpleNamespace(value=100.0)
+    monkeypatch.setattr(progress, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def _chunk(downloaded, total=1000, state="downloading"):
+    return {"status": state, "downloaded_bytes": downloaded, "total_bytes": total, "eta": 5}
+
+
+def test_download_updates_are_throttled(clock):
+    updates = []
+    reporter = YDLProgressReporter("Song", updates.append, interval=0.5)
+
+    for downloaded in (100, 200, 300):
+        reporter.progress_hook(_chunk(downloaded))
+        clock.value += 0.2
+    reporter.progress_hook(_chunk(400))
+
+    assert [update.downloaded_bytes for update in updates] == [100, 400]
+    assert updates[-1].fraction == 0.4
+
+
+def test_phase_changes_and_the_end_of_the_download_are_always_reported(clock):
+    updates = []
+    reporter = YDLProgressReporter("Song", updates.append, interval=60)
+
+    reporter.progress_hook(_chunk(100, total=None))
+    reporter.progress_hook(_chunk(200, total=None))
+    reporter.progress_hook(_chunk(500, total=None, state="finished"))
+    reporter.postprocessor_hook({"status": "started"})
+    reporter.postprocessor_hook({"status": "finished"})
+    reporter.progress_hook({"status": "error"})
+
+    assert [(update.phase, update.downloaded_bytes) for update in updates] == [
+        ("downloading", 100),
+        ("downloading", 500),
+        ("postprocessing", 0),
+    ]
+    assert updates[0].fraction is None
+    # The size of a finished download without a known total is what was downloaded
+    assert (updates[1].total_bytes, updates[1].eta, updates[1].fraction) == (500, 0, 1.0)
+
+
+def test_failing_callbacks_do_not_abort_the_download(clock):
+    def callback(update):
+        raise RuntimeError("display closed")
+
+    YDLProgressReporter("Song", callback, interval=0).progress_hook(_chunk(100))
+
+
+def test_downloader_reports_processing_phases(downloader, make_track):
+    assert downloader._get_ydl_hooks(downloader.base_dir / "song.m4a") == ([], [])
+
+    updates = []
+    downloader.on_progress = updates.append
+    progress_hooks, postprocessor_hooks = downloader._get_ydl_hooks(
+        downloader.base_dir / "song.m4a", "Song 1"
+    )
+    downloader._report_phase(make_track(), "transcoding")
+
+    assert len(progress_hooks) == len(postprocessor_hooks) == 1
+    assert updates == [TrackProgress("Song 1", "transcoding")]
+    assert updates[0].fraction == 1.0
@@ -0,0 +1,79 @@
+"""Tests of the API download scheduler."""
+
+import asyncio
+
+from spotifysaver.api.services.scheduler import DownloadScheduler
+
+
+def test_runs_at_most_max_concurrent_jobs_by_priority():
+    async def scenario():
+        scheduler = DownloadScheduler(max_concurrent=2)
+        started, running, peak = [], 0, 0
+        release = asyncio.Event()
+
+        def job(name):
+            async def run():
+                nonlocal running, peak
+                started.append(name)
+                running += 1
+                peak = max(peak, running)
+                await release.wait()
+                running -= 1
+
+            return run
+
+        # Both workers take the first two jobs; the rest wait in the queue
+        await scheduler.submit("a", job("a"))
+        await scheduler.submit("b", job("b"))
+        while len(started) < 2:
+            await asyncio.sleep(0.01)
+        assert await scheduler.submit("low", job("low")) == 1
+        assert await scheduler.submit("high", job("high"), priority=5) == 1
+        assert scheduler.position("low") == 2
+
+        release.set()
+        while len(started) < 4 or running:
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+        return started, peak
+
+    started, peak = asyncio.run(scenario())
+
+    assert peak == 2
+    assert started[2:] == ["high", "low"]
+
+
+def test_cancel_removes_waiting_jobs_and_stops_running_ones():
+    async def scenario():
+        scheduler = DownloadScheduler(max_concurrent=1)
+        ran = []
+        blocked, cancelled = asyncio.Event(), asyncio.Event()
+
+        async def blocking():
+            blocked.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def waiting():
+            ran.append("waiting")
+
+        async def last():
+            ran.append("last")
+
+        await scheduler.submit("blocking", blocking)
+        await asyncio.wait_for(blocked.wait(), 5)
+        await scheduler.submit("waiting", waiting)
+        await scheduler.submit("last", last)
+
+        assert scheduler.cancel("waiting")
+        assert scheduler.cancel("blocking")
+        await asyncio.wait_for(cancelled.wait(), 5)
+        while not ran:
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+        return ran
+
+    assert asyncio.run(scenario()) == ["last"]
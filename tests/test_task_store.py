@@ -0,0 +1,232 @@
+"""Tests of the task stores, run against SQLite and a Redis stand-in."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from spotifysaver.api.routers import download
+from spotifysaver.api.schemas import DownloadRequest, DownloadStatus
+from spotifysaver.api.services.task_store import RedisTaskStore, SQLiteTaskStore
+from spotifysaver.downloader.cancellation import CancellationToken
+
+from .fake_redis import FakeRedis
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        store = SQLiteTaskStore(tmp_path / "tasks.db", ttl_hours=1)
+    else:
+        store = RedisTaskStore(client=FakeRedis(), ttl_hours=1)
+    yield store
+    store.close()
+
+
+def _expire_lease(store, task_id):
+    if isinstance(store, SQLiteTaskStore):
+        with store._lock, store._conn:
+            store._conn.execute("UPDATE tasks SET heartbeat = 0 WHERE task_id = ?", (task_id,))
+    else:
+        store.client.set(store._lease_key(task_id), 0)
+
+
+def _task(task_id="task", status="processing", worker_id="worker-a"):
+    return DownloadStatus(task_id=task_id, status=status, progress=0, worker_id=worker_id)
+
+
+def test_list_filters_by_status_in_start_order(store):
+    for index, status in enumerate(["pending", "completed", "processing"]):
+        task = _task(f"task-{index}", status=status)
+        task.started_at = f"2026-01-0{index + 1}T00:00:00"
+        store.save(task)
+
+    assert [task.task_id for task in store.list()] == ["task-0", "task-1", "task-2"]
+    assert [task.task_id for task in store.list(["pending", "processing"])] == ["task-0", "task-2"]
+
+
+def test_status_change_moves_the_task_and_delete_removes_it(store):
+    store.save(_task(status="pending"))
+    store.save(_task(status="processing"))
+
+    assert [task.status for task in store.list()] == ["processing"]
+    assert store.delete("task")
+    assert not store.delete("task")
+    assert store.get("task") is None
+    assert store.list() == []
+
+
+def test_evicts_finished_tasks_older_than_the_ttl(store):
+    old = _task("old", status="completed")
+    old.completed_at = "2000-01-01T00:00:00"
+    store.save(old)
+    store.save(_task("recent", status="completed"))
+    store.save(_task("running"))
+
+    assert store.evict_expired() == 1
+    assert sorted(task.task_id for task in store.list()) == ["recent", "running"]
+
+
+def test_concurrent_status_changes_leave_the_task_in_one_status(store):
+    statuses = ["pending", "processing", "completed", "failed"]
+
+    def save(offset):
+        for index in range(50):
+            store.save(_task(status=statuses[(index + offset) % len(statuses)]))
+
+    threads = [threading.Thread(target=save, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store.list()) == 1
+
+
+def test_task_of_a_live_worker_cannot_be_claimed(store):
+    store.save(_task())
+
+    assert not store.claim("task", "worker-a", "worker-b", stale_before=time.time() - 60)
+    assert store.get("task").worker_id == "worker-a"
+
+
+def test_stale_task_is_claimed_once(store):
+    store.save(_task())
+    stale_before = time.time() + 1
+
+    assert store.claim("task", "worker-a", "worker-b", stale_before)
+    assert not store.claim("task", "worker-a", "worker-c", stale_before)
+    assert store.get("task").worker_id == "worker-b"
+
+
+def test_claim_refreshes_the_lease(store):
+    store.save(_task())
+    assert store.claim("task", "worker-a", "worker-b", time.time() + 1)
+
+    assert not store.claim("task", "worker-b", "worker-c", time.time() - 60)
+
+
+def test_heartbeat_only_refreshes_unfinished_tasks_of_the_worker(store):
+    store.save(_task("running"))
+    store.save(_task("done", status="completed"))
+    store.save(_task("other", worker_id="worker-b"))
+    time.sleep(0.01)
+    stale_before = time.time()
+    time.sleep(0.01)
+
+    assert store.heartbeat("worker-a") == 1
+    assert not store.claim("running", "worker-a", "worker-c", stale_before)
+    assert store.claim("other", "worker-b", "worker-c", stale_before)
+
+
+def test_tasks_of_a_database_without_leases_are_stale(tmp_path):
+    db_path = tmp_path / "tasks.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE tasks (task_id TEXT PRIMARY KEY, status TEXT NOT NULL, "
+        "started_at REAL, completed_at REAL, data TEXT NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO tasks (task_id, status, data) VALUES (?, ?, ?)",
+        ("task", "processing", _task().model_dump_json()),
+    )
+    conn.commit()
+    conn.close()
+
+    store = SQLiteTaskStore(db_path)
+    try:
+        assert store.claim("task", "worker-a", "worker-b", stale_before=time.time() - 60)
+    finally:
+        store.close()
+
+
+def test_resume_only_takes_over_tasks_of_stopped_workers(store, monkeypatch):
+    class FakeScheduler:
+        def __init__(self):
+            self.submitted = []
+
+        async def submit(self, task_id, job, priority=0):
+            self.submitted.append(task_id)
+            return len(self.submitted)
+
+    request = DownloadRequest(spotify_url="https://open.spotify.com/track/abc")
+    live = _task("live")
+    live.request = request
+    store.save(live)
+    stopped = _task("stopped", worker_id="worker-b")
+    stopped.request = request
+    store.save(stopped)
+    _expire_lease(store, "stopped")
+
+    scheduler = FakeScheduler()
+    monkeypatch.setattr(download, "get_task_store", lambda: store)
+    monkeypatch.setattr(download, "get_scheduler", lambda: scheduler)
+
+    assert asyncio.run(download.resume_interrupted_tasks()) == 1
+    assert scheduler.submitted == ["stopped"]
+    assert store.get("stopped").worker_id == download.WORKER_ID
+    assert store.get("live").worker_id == "worker-a"
+
+
+@pytest.fixture
+def published(store, monkeypatch):
+    """Progress values published to the event streams; the router uses ``store``."""
+    values = []
+    broker = type("Broker", (), {"publish": lambda self, task: values.append(task.progress)})()
+    monkeypatch.setattr(download, "get_task_store", lambda: store)
+    monkeypatch.setattr(download, "get_event_broker", lambda: broker)
+    return values
+
+
+def test_progress_is_published_every_time_but_saved_once_per_interval(
+    store, published, monkeypatch
+):
+    monkeypatch.setattr(download.APIConfig, "PROGRESS_SAVE_SECONDS", 60)
+    store.save(_task())
+    task = _task()
+    save_progress = download._ProgressSaver(task, CancellationToken())
+
+    for progress in (10, 20, 30):
+        task.progress = progress
+        save_progress()
+
+    assert published == [10, 20, 30]
+    assert store.get("task").progress == 10
+
+
+def test_save_if_active_never_overwrites_a_finished_task(store):
+    assert not store.save_if_active(_task())
+
+    store.save(_task(status="pending"))
+    assert store.save_if_active(_task())
+    assert store.get("task").status == "processing"
+
+    store.save(_task(status="cancelled"))
+    assert not store.save_if_active(_task())
+    assert [task.status for task in store.list()] == ["cancelled"]
+
+
+def test_cancel_between_progress_saves_stops_the_download(store, published, monkeypatch):
+    monkeypatch.setattr(download.APIConfig, "PROGRESS_SAVE_SECONDS", 0)
+    store.save(_task())
+    task = _task()
+    token = CancellationToken()
+    save_progress = download._ProgressSaver(task, token)
+
+    task.progress = 10
+    save_progress()
+    # A cancel request, handled by any worker, reads and rewrites the task
+    cancelled = store.get("task")
+    cancelled.status = "cancelled"
+    store.save(cancelled)
+    task.progress = 20
+    save_progress()
+    task.progress = 30
+    save_progress()
+
+    assert token.cancelled
+    assert published == [10]
+    assert store.get("task").status == "cancelled"
+    assert store.get("task").progress == 10
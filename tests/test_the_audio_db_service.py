@@ -0,0 +1,25 @@
+"""Tests for the shared TheAudioDB service."""
+
+import threading
+
+from spotifysaver.services import the_audio_db_service
+from spotifysaver.services.the_audio_db_service import get_audiodb_cache, get_audiodb_service
+
+
+def test_get_audiodb_service_returns_shared_instance(monkeypatch):
+    monkeypatch.setattr(the_audio_db_service, "_default_cache", None)
+    monkeypatch.setattr(the_audio_db_service, "_default_service", None)
+    results = []
+
+    # Run in a thread so a deadlock fails the test instead of hanging the suite
+    worker = threading.Thread(
+        target=lambda: results.extend([get_audiodb_service(), get_audiodb_service()]),
+        daemon=True,
+    )
+    worker.start()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive(), "get_audiodb_service() deadlocked"
+    first, second = results
+    assert first is second
+    assert first.cache is get_audiodb_cache()
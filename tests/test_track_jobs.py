@@ -0,0 +1,102 @@
+"""Tests of the per-track worker pool of the CLI downloader."""
+
+import threading
+import time
+
+from spotifysaver.models import TrackMatch
+
+
+def test_workers_download_tracks_in_parallel_with_ordered_progress(downloader, make_track):
+    tracks = [make_track(n) for n in range(1, 9)]
+    running, peak = 0, 0
+    lock = threading.Lock()
+    progress = []
+
+    def job(track):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return track.number != 3
+
+    success = downloader._run_track_jobs(
+        iter(tracks),
+        job,
+        workers=4,
+        progress_callback=lambda index, total, name: progress.append((index, total)),
+        total=len(tracks),
+    )
+
+    assert success == 7
+    assert peak == 4
+    assert progress == [(i, 8) for i in range(1, 9)]
+
+
+def test_failing_job_does_not_stop_the_others(downloader, make_track):
+    def job(track):
+        if track.number == 1:
+            raise RuntimeError("broken")
+        return True
+
+    assert downloader._run_track_jobs([make_track(n) for n in range(1, 4)], job, workers=2) == 2
+
+
+def test_cancellation_skips_tracks_not_started(downloader, make_track):
+    started = []
+
+    def job(track):
+        started.append(track.number)
+        downloader.cancel("stop")
+        return True
+
+    assert downloader._run_track_jobs([make_track(n) for n in range(1, 6)], job, workers=1) == 1
+    assert started == [1]
+
+
+def _fake_download_steps(downloader):
+    """Replace the network and FFmpeg steps, counting overlapping fetches per file."""
+    fetching, overlaps, fetched = set(), [], []
+    lock = threading.Lock()
+
+    def fetch(url, output_path, *args):
+        with lock:
+            if output_path in fetching:
+                overlaps.append(output_path)
+            fetching.add(output_path)
+            fetched.append(output_path)
+        time.sleep(0.05)
+        with lock:
+            fetching.discard(output_path)
+        return output_path.with_suffix(".source.webm"), "opus"
+
+    downloader._resolve = lambda track: TrackMatch(video_id="abc", score=1.0)
+    downloader._fetch_audio = fetch
+    downloader._transcode_audio = lambda source, output_path, *args: output_path.write_bytes(b"audio")
+    downloader._tag_audio = lambda track, output_path, *args: track
+    downloader.library.is_present = lambda path, uri, title=None: path.exists()
+    return overlaps, fetched
+
+
+def test_duplicate_tracks_are_downloaded_once(downloader, make_track):
+    overlaps, fetched = _fake_download_steps(downloader)
+    tracks = [make_track(1), make_track(1), make_track(2)]
+
+    success = downloader._run_track_jobs(
+        tracks, lambda track: downloader.download_track(track)[0] is not None, workers=2
+    )
+
+    assert success == 3
+    assert overlaps == []
+    assert len(fetched) == 2
+
+
+def test_pipeline_downloads_duplicate_tracks_once(downloader, make_track):
+    overlaps, fetched = _fake_download_steps(downloader)
+    tracks = [make_track(1), make_track(1), make_track(2)]
+
+    assert downloader._run_track_pipeline(tracks) == 3
+    assert overlaps == []
+    assert len(fetched) == 2
@@ -0,0 +1,68 @@
+"""Tests of the process-wide FFmpeg slot scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from spotifysaver.downloader.cancellation import CancellationToken, DownloadCancelled
+from spotifysaver.downloader.transcode_scheduler import TranscodeScheduler
+
+
+def test_parse_cpu_list():
+    assert TranscodeScheduler.parse_cpu_list("0-2, 5") == {0, 1, 2, 5}
+    assert TranscodeScheduler.parse_cpu_list(" ") is None
+    with pytest.raises(ValueError):
+        TranscodeScheduler.parse_cpu_list("a-b")
+
+
+def test_slots_bound_the_running_conversions():
+    scheduler = TranscodeScheduler(max_processes=2)
+    running, peak = 0, 0
+    lock = threading.Lock()
+
+    def convert():
+        nonlocal running, peak
+        with scheduler.slot():
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+    threads = [threading.Thread(target=convert) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert scheduler.stats()["completed"] == 6
+    assert scheduler.stats()["running"] == scheduler.stats()["waiting"] == 0
+
+
+def test_cancelled_wait_gives_up_the_queue():
+    scheduler = TranscodeScheduler(max_processes=1)
+    token = CancellationToken()
+    errors = []
+
+    def wait():
+        try:
+            with scheduler.slot(token):
+                pass
+        except DownloadCancelled as e:
+            errors.append(e)
+
+    with scheduler.slot():
+        waiter = threading.Thread(target=wait)
+        waiter.start()
+        time.sleep(0.05)
+        assert scheduler.stats()["waiting"] == 1
+        token.cancel()
+        waiter.join(5)
+
+    assert len(errors) == 1
+    assert scheduler.stats()["waiting"] == 0
+    with scheduler.slot():
+        assert scheduler.stats()["running"] == 1
@@ -0,0 +1,110 @@
+"""Tests of the TTL cache shared by the API clients."""
+
+import threading
+import time
+
+from spotifysaver.services.ttl_cache import TTLCache
+
+
+def test_entries_expire():
+    cache = TTLCache(ttl=60)
+    cache.set("fresh", 1)
+    cache.set("stale", 2, ttl=-1)
+
+    assert cache.get("fresh") == 1
+    assert cache.get("stale", "missing") == "missing"
+
+
+def test_none_is_a_cached_value():
+    cache = TTLCache(ttl=60)
+    cache.set("negative", None)
+
+    assert cache.get("negative", "missing") is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_memory_tier_is_bounded_by_count_and_size():
+    by_count = TTLCache(ttl=60, maxsize=2)
+    for key in "abc":
+        by_count.set(key, key)
+    assert by_count.get("a") is None
+    assert by_count.get("c") == "c"
+
+    by_size = TTLCache(ttl=60, maxbytes=20)
+    by_size.set("a", "x" * 12)
+    by_size.set("b", "y" * 12)
+    assert by_size.get("a") is None
+    assert by_size.stats()["bytes"] <= 20
+    by_size.set("huge", "z" * 100)
+    assert by_size.get("huge") is None
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    TTLCache(ttl=60, db_path=tmp_path / "cache.db").set("key", {"name": "value"})
+
+    cache = TTLCache(ttl=60, db_path=tmp_path / "cache.db")
+    assert cache.get("key") == {"name": "value"}
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_concurrent_misses_call_the_loader_once():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value", True
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("key", loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["value"] * 8
+
+
+def test_uncacheable_values_are_not_stored():
+    cache = TTLCache(ttl=60)
+
+    assert cache.get_or_load("key", lambda: ("error", False)) == "error"
+    assert cache.get_or_load("key", lambda: ("value", True)) == "value"
+    assert cache.get("key") == "value"
+
+
+def test_callers_wait_for_a_slow_uncacheable_loader_in_turn():
+    cache = TTLCache(ttl=60)
+    running, peak = 0, 0
+    lock = threading.Lock()
+
+    def loader():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.1)
+        with lock:
+            running -= 1
+        return "error", False
+
+    def call():
+        cache.get_or_load("key", loader)
+
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    # Arrives after the first loader finished, while the second one runs
+    time.sleep(0.15)
+    threads.append(threading.Thread(target=call))
+    threads[-1].start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 1
+    assert cache._key_locks == {}
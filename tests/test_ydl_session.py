@@ -0,0 +1,67 @@
+"""Tests of the yt-dlp sessions reused across the tracks of a worker."""
+
+import threading
+
+from spotifysaver.downloader.ydl_session import YDLSession, YDLSessionPool
+from spotifysaver.enums import AudioFormat, Bitrate
+
+
+def _fire(ydl, kind, status):
+    """Call the hooks the way yt-dlp does during a download."""
+    for hook in ydl.params[kind]:
+        hook(status)
+
+
+def test_each_download_gets_its_own_template_and_hooks():
+    shared, first, second = [], [], []
+    session = YDLSession({"quiet": True, "progress_hooks": [shared.append]})
+
+    with session.download("/music/one.source.%(ext)s", [first.append]) as ydl:
+        template = ydl.params["outtmpl"]["default"]
+        _fire(ydl, "progress_hooks", {"status": "downloading"})
+    _fire(session.ydl, "progress_hooks", {"status": "between tracks"})
+    with session.download("/music/two.source.%(ext)s", [], [second.append]) as ydl:
+        _fire(ydl, "postprocessor_hooks", {"status": "started"})
+        assert ydl.params["outtmpl"]["default"] == "/music/two.source.%(ext)s"
+    session.close()
+
+    assert template == "/music/one.source.%(ext)s"
+    assert first == [{"status": "downloading"}]
+    assert second == [{"status": "started"}]
+    # Session-wide hooks (the cancellation check) see every download
+    assert [status["status"] for status in shared] == ["downloading", "between tracks"]
+    assert session.downloads == 2
+
+
+def test_pool_keeps_one_session_per_thread_and_options():
+    pool = YDLSessionPool()
+    built = []
+
+    def opts():
+        built.append(threading.get_ident())
+        return {"quiet": True}
+
+    main = pool.get("m4a", opts)
+    assert pool.get("m4a", opts) is main
+    assert pool.get("mp3", opts) is not main
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.get("m4a", opts)))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not main
+    assert len(built) == len(pool) == 3
+    pool.close()
+    assert len(pool) == 0
+    assert pool.get("m4a", opts) is not main
+    pool.close()
+
+
+def test_downloader_opens_a_new_session_when_the_format_changes(downloader):
+    m4a = downloader._get_ydl_session(AudioFormat.M4A, Bitrate.B128)
+
+    assert downloader._get_ydl_session(AudioFormat.M4A, Bitrate.B128) is m4a
+    assert downloader._get_ydl_session(AudioFormat.OPUS, Bitrate.B128) is not m4a
+    assert downloader.cancel_token.progress_hook in m4a.ydl.params["progress_hooks"]
+    downloader.close()
@@ -0,0 +1,30 @@
+"""Tests for the YouTube Music searcher."""
+
+from spotifysaver.models import TrackMatch
+from spotifysaver.services import youtube_api
+from spotifysaver.services.match_cache import MatchCache
+
+
+def test_resolve_track_uses_only_the_match_cache(monkeypatch, tmp_path, make_track):
+    monkeypatch.setattr(youtube_api, "YTMusic", lambda: None)
+    searcher = youtube_api.YoutubeMusicSearcher(match_cache=MatchCache(tmp_path / "matches.db"))
+    results = [None, TrackMatch(video_id="v1", score=0.9), TrackMatch(video_id="v2", score=0.9)]
+    searches = []
+
+    def search(track):
+        searches.append(track.uri)
+        return results[len(searches) - 1]
+
+    monkeypatch.setattr(searcher, "_search_with_fallback", search)
+    track = make_track(uri="spotify:track:abc")
+
+    # A failed resolution is not remembered
+    assert searcher.resolve_track(track) is None
+    assert searcher.resolve_track(track).video_id == "v1"
+    assert searcher.resolve_track(track).video_id == "v1"
+    assert len(searches) == 2
+
+    # Invalidating the persistent cache forces a new search
+    searcher.match_cache.invalidate(spotify_uri=track.uri)
+    assert searcher.resolve_track(track).video_id == "v2"
+    assert len(searches) == 3